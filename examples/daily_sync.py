@@ -21,7 +21,10 @@ Systemd timer example:
 
 import logging
 import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 
 from deribit_data.config import DeribitConfig
 from deribit_data.fetcher import DeribitFetcher
@@ -34,24 +37,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Batches queued for writing while the next page is fetched
+MAX_PENDING_WRITES = 2
 
-def sync_currency(config: DeribitConfig, currency: str) -> int:
+
+def sync_currency(
+    config: DeribitConfig,
+    currency: str,
+    storage: ParquetStorage,
+    manifest: ManifestManager,
+) -> int:
     """Sync a single currency.
 
+    Updates manifest entries in memory; the caller saves the manifest.
+
     Args:
         config: Configuration.
         currency: Currency to sync.
+        storage: Parquet storage shared across currencies.
+        manifest: Manifest shared across currencies.
 
     Returns:
         Number of new trades fetched.
     """
-    storage = ParquetStorage(
-        config.catalog_path,
-        config.compression,
-        config.compression_level,
-    )
-    manifest = ManifestManager(config.catalog_path)
-
     # Get last timestamp
     last_ts = storage.get_last_trade_timestamp(currency)
     if not last_ts:
@@ -64,19 +72,41 @@ def sync_currency(config: DeribitConfig, currency: str) -> int:
     logger.info(f"Syncing {currency} from {start_date.isoformat()}")
 
     total_trades = 0
-    with DeribitFetcher(config) as fetcher:
-        for batch in fetcher.fetch_trades_streaming(
-            currency=currency,
-            start_date=start_date,
-            end_date=end_date,
-        ):
-            written_files = storage.save_trades(batch, currency)
-            for f in written_files:
+    pending: deque[tuple[Future[list[Path]], int]] = deque()
+
+    def drain(max_pending: int) -> None:
+        nonlocal total_trades
+        while len(pending) > max_pending:
+            future, count = pending.popleft()
+            for f in future.result():
                 manifest.update_file(f)
-            total_trades += len(batch)
-            logger.info(f"  Saved {len(batch)} trades ({total_trades} total)")
+            total_trades += count
+            logger.info(f"  Saved {count} trades ({total_trades} total)")
+
+    # A single writer thread keeps Parquet writes ordered (batches can touch
+    # the same daily file) while the main thread fetches the next pages.
+    write_error: Exception | None = None
+    with DeribitFetcher(config) as fetcher, ThreadPoolExecutor(max_workers=1) as pool:
+        try:
+            for batch in fetcher.fetch_trades_streaming(
+                currency=currency,
+                start_date=start_date,
+                end_date=end_date,
+            ):
+                pending.append((pool.submit(storage.save_trades, batch, currency), len(batch)))
+                drain(MAX_PENDING_WRITES - 1)
+        finally:
+            # Record the files of every submitted write, also when fetching
+            # failed, so the manifest matches what was rewritten on disk
+            while pending:
+                try:
+                    drain(len(pending) - 1)
+                except Exception as e:
+                    logger.error(f"  Failed to save batch: {e}")
+                    write_error = write_error or e
+    if write_error is not None:
+        raise write_error
 
-    manifest.save()
     logger.info(f"Sync complete: {total_trades} new trades for {currency}")
 
     return total_trades
@@ -90,13 +120,22 @@ def main() -> int:
     logger.info(f"Catalog: {config.catalog_path}")
     logger.info(f"Currencies: {config.currencies}")
 
+    storage = ParquetStorage(
+        config.catalog_path,
+        config.compression,
+        config.compression_level,
+    )
+    manifest = ManifestManager(config.catalog_path)
+
     total = 0
     for currency in config.currencies:
         try:
-            total += sync_currency(config, currency)
+            total += sync_currency(config, currency, storage, manifest)
         except Exception as e:
             logger.error(f"Failed to sync {currency}: {e}")
 
+    manifest.save()
+
     logger.info(f"Daily sync complete: {total} new trades total")
     return 0
 
@@ -1,12 +1,32 @@
 """Deribit Data Downloader - High-performance options data downloader."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from deribit_data.audit import AuditLog
-from deribit_data.config import DeribitConfig, ValidationConfig
-from deribit_data.dead_letter import DeadLetterQueue
-from deribit_data.models import CheckpointState, DVOLCandle, FailedTrade, OptionTrade
-from deribit_data.reconciliation import DataReconciler
+if TYPE_CHECKING:
+    from deribit_data.audit import AuditLog
+    from deribit_data.config import DeribitConfig, ValidationConfig
+    from deribit_data.dead_letter import DeadLetterQueue
+    from deribit_data.models import CheckpointState, DVOLCandle, FailedTrade, OptionTrade
+    from deribit_data.reconciliation import DataReconciler
+
+# Public name -> defining module. Imported on first access, so importing a
+# light submodule (config, models) does not load pyarrow through this package.
+_EXPORTS = {
+    "DeribitConfig": "deribit_data.config",
+    "ValidationConfig": "deribit_data.config",
+    "OptionTrade": "deribit_data.models",
+    "DVOLCandle": "deribit_data.models",
+    "CheckpointState": "deribit_data.models",
+    "FailedTrade": "deribit_data.models",
+    "DeadLetterQueue": "deribit_data.dead_letter",
+    "AuditLog": "deribit_data.audit",
+    "DataReconciler": "deribit_data.reconciliation",
+}
 
 __all__ = [
     "DeribitConfig",
@@ -19,3 +39,16 @@ __all__ = [
     "AuditLog",
     "DataReconciler",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
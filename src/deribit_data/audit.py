@@ -5,17 +5,183 @@ Provides persistent logging of all download operations for compliance and debugg
 
 from __future__ import annotations
 
-import json
+import atexit
+import gzip
 import logging
+import mmap
+import os
+import queue
+import shutil
+import threading
+import time
+import weakref
+from collections import Counter
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_serializer
+
+from deribit_data import fastjson
 
 logger = logging.getLogger(__name__)
 
+# The writer thread flushes a batch once this many events are queued...
+DEFAULT_FLUSH_EVERY = 64
+# ...or once this many seconds have passed since the batch started.
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+# Seconds to wait for the writer thread to drain on close
+CLOSE_TIMEOUT = 5.0
+
+# How often to recheck the calendar month for rotation (seconds)
+MONTH_CHECK_INTERVAL = 30.0
+
+# Temp files of a sealer that died mid-write are removed once this old (seconds)
+STALE_SEAL_TMP_SECONDS = 3600.0
+
+# Gather-writes submit a whole batch in one syscall (POSIX only)
+_HAS_WRITEV = hasattr(os, "writev")
+try:
+    _IOV_MAX = max(os.sysconf("SC_IOV_MAX"), 16)
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+# Open audit logs, drained at interpreter exit so queued events are not lost
+_open_logs: weakref.WeakSet[AuditLog] = weakref.WeakSet()
+
+
+def _close_open_logs() -> None:
+    """Drain and close every audit log still open at exit."""
+    for audit in list(_open_logs):
+        audit.close()
+
+
+atexit.register(_close_open_logs)
+
+
+_TIMESTAMP_PREFIX = b'{"timestamp":"'
+
+
+def _line_timestamp(line: bytes) -> bytes | None:
+    """Extract the raw ISO timestamp from a serialized event without parsing JSON.
+
+    Events are written with ``timestamp`` as the first key, and ISO-8601 UTC
+    strings sort lexicographically, so the raw bytes can be range-compared.
+    """
+    if not line.startswith(_TIMESTAMP_PREFIX):
+        return None
+    start = len(_TIMESTAMP_PREFIX)
+    end = line.find(b'"', start)
+    return line[start:end] if end > 0 else None
+
+
+def _event_timestamp(event: dict[str, Any]) -> bytes | None:
+    """Get a parsed event's timestamp in the byte form of _line_timestamp().
+
+    Fallback for lines that do not start with the compact timestamp prefix,
+    e.g. events written with ``json.dumps`` before the current format.
+    """
+    value = event.get("timestamp")
+    if not isinstance(value, str):
+        return None
+    try:
+        return _timestamp_key(datetime.fromisoformat(value))
+    except ValueError:
+        return None
+
+
+def _timestamp_key(dt: datetime | None) -> bytes | None:
+    """Convert a filter bound to the byte form used in audit lines."""
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).isoformat().encode()
+
+
+def _month_key(dt: datetime | None) -> str | None:
+    """Convert a filter bound to a YYYY-MM key comparable with audit filenames."""
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).strftime("%Y-%m")
+
+
+def _file_month(file_path: Path) -> str:
+    """Get YYYY-MM from an audit filename (audit_YYYY-MM.jsonl[.gz])."""
+    return file_path.name[len("audit_") : len("audit_YYYY-MM")]
+
+
+def _previous_month(month: str) -> str:
+    """Get the YYYY-MM key of the month before a YYYY-MM key."""
+    year, mon = int(month[:4]), int(month[5:7])
+    return f"{year - 1}-12" if mon == 1 else f"{year}-{mon - 1:02d}"
+
+
+def _sealed_path(file_path: Path) -> Path:
+    """Get the sealed (gzip) path of a plain audit file."""
+    return file_path.with_name(file_path.name + ".gz")
+
+
+def _write_all(fd: int, data: memoryview) -> None:
+    """Write a buffer fully, retrying on partial writes."""
+    while data:
+        data = data[os.write(fd, data) :]
+
+
+def _open_audit_file(file_path: Path) -> BinaryIO:
+    """Open an audit file for binary reading, decompressing sealed months."""
+    if file_path.suffix == ".gz":
+        return gzip.open(file_path, "rb")  # type: ignore[return-value]
+    try:
+        return open(file_path, "rb")
+    except FileNotFoundError:
+        # Sealed by another process since the directory was listed
+        return gzip.open(_sealed_path(file_path), "rb")  # type: ignore[return-value]
+
+
+def _iter_lines_reversed(file_path: Path) -> Iterator[bytes]:
+    """Yield lines of a file from last to first without reading it all.
+
+    Memory-maps the file and scans backward for newlines, so finding the most
+    recent events costs O(lines returned) rather than O(file size). Sealed
+    (gzip) months are decompressed in memory and scanned the same way.
+    """
+    if file_path.suffix == ".gz":
+        with gzip.open(file_path, "rb") as gz:
+            lines = gz.read().splitlines()
+        for line in reversed(lines):
+            if line.strip():
+                yield line
+        return
+
+    try:
+        with open(file_path, "rb") as f:
+            yield from _mmap_lines_reversed(f)
+    except FileNotFoundError:
+        # Sealed by another process since the directory was listed
+        yield from _iter_lines_reversed(_sealed_path(file_path))
+
+
+def _mmap_lines_reversed(f: BinaryIO) -> Iterator[bytes]:
+    """Scan an open plain file backward for lines (see _iter_lines_reversed)."""
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:  # empty file cannot be mapped
+        return
+    with mm:
+        end = mm.size()
+        while end > 0:
+            start = mm.rfind(b"\n", 0, end - 1) + 1
+            line = mm[start:end].strip()
+            if line:
+                yield line
+            end = start
+
 
 class AuditEventType(str, Enum):
     """Types of audit events."""
@@ -34,6 +200,12 @@ class AuditEventType(str, Enum):
     DLQ_FAILURE = "dlq_failure"
 
 
+# Pre-serialized '"event_type":"<value>"' fragments spliced into emitted lines
+_EVENT_TYPE_FRAGMENTS: dict[AuditEventType, bytes] = {
+    et: b'"event_type":' + fastjson.dumps(et.value) for et in AuditEventType
+}
+
+
 class AuditEvent(BaseModel):
     """Single audit event."""
 
@@ -42,15 +214,23 @@ class AuditEvent(BaseModel):
     currency: str | None = None
     details: dict[str, Any] = Field(default_factory=dict)
 
-    def to_json_line(self) -> str:
-        """Convert to JSON line format."""
-        data = {
+    @model_serializer(mode="plain")
+    def _serialize_flat(self) -> dict[str, Any]:
+        """Serialize with details flattened into the top-level record."""
+        return {
             "timestamp": self.timestamp.isoformat(),
             "event_type": self.event_type.value,
             "currency": self.currency,
             **self.details,
         }
-        return json.dumps(data)
+
+    def to_json_bytes(self) -> bytes:
+        """Convert to a newline-terminated JSON line as bytes."""
+        return self.model_dump_json().encode() + b"\n"
+
+    def to_json_line(self) -> str:
+        """Convert to JSON line format."""
+        return self.model_dump_json()
 
 
 class AuditLog:
@@ -61,36 +241,389 @@ class AuditLog:
 
     Features:
     - Append-only log
-    - Monthly rotation
+    - Monthly rotation (older months sealed as audit_YYYY-MM.jsonl.gz in the
+      background)
+    - Asynchronous batched writes (one write + fsync per batch of events)
     - Queryable history
     - Compliance ready
+
+    Logging only serializes the event and puts it on a queue; a background
+    writer thread drains the queue and writes a batch when ``flush_every``
+    events are pending or ``flush_interval`` seconds have elapsed. Queries
+    flush first, and all open logs are drained at interpreter exit.
     """
 
-    def __init__(self, catalog_path: Path) -> None:
+    def __init__(
+        self,
+        catalog_path: Path,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
         """Initialize audit log.
 
         Args:
             catalog_path: Root path for catalog (creates _audit subdir).
+            flush_every: Write a batch once this many events are pending.
+            flush_interval: Write a batch once it is this many seconds old.
         """
         self.audit_path = catalog_path / "_audit"
         self.audit_path.mkdir(parents=True, exist_ok=True)
 
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+
+        self._fd: int | None = None
+        self._open_month: str | None = None
+        self._open_lock = threading.Lock()
+
+        # Serialized lines, flush markers (Event), month rotations (Path) and
+        # the stop sentinel (None). While the writer thread runs, it alone
+        # opens, writes and closes the descriptor.
+        self._queue: queue.SimpleQueue[bytes | threading.Event | Path | None] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+
+        self._cached_month_key = ""
+        self._cached_path = self.audit_path
+        self._month_checked_at = 0.0
+
+        # Compressing old months can take a while; queries wait for it
+        self._sealer = threading.Thread(
+            target=self._seal_past_months, name="audit-sealer", daemon=False
+        )
+        self._sealer.start()
+
+        _open_logs.add(self)
+
+    def __enter__(self) -> AuditLog:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _get_month_key(self) -> str:
+        """Get current month as YYYY-MM, rechecked at most every MONTH_CHECK_INTERVAL."""
+        now = time.monotonic()
+        if not self._cached_month_key or now - self._month_checked_at > MONTH_CHECK_INTERVAL:
+            month_str = datetime.now(timezone.utc).strftime("%Y-%m")
+            if month_str != self._cached_month_key:
+                self._cached_month_key = month_str
+                self._cached_path = self.audit_path / f"audit_{month_str}.jsonl"
+            self._month_checked_at = now
+        return self._cached_month_key
+
     def _get_current_file(self) -> Path:
         """Get current audit log file (monthly rotation)."""
-        month_str = datetime.now(timezone.utc).strftime("%Y-%m")
-        return self.audit_path / f"audit_{month_str}.jsonl"
+        self._get_month_key()
+        return self._cached_path
+
+    def _iter_audit_files(self) -> list[Path]:
+        """List audit files (plain and sealed), oldest month first.
+
+        Uses os.scandir so directory entries are filtered by name without
+        per-file stat calls.
+        """
+        with os.scandir(self.audit_path) as it:
+            names = {
+                entry.name
+                for entry in it
+                if entry.name.startswith("audit_")
+                and entry.name.endswith((".jsonl", ".jsonl.gz"))
+                and entry.is_file()
+            }
+        # A month being sealed briefly exists in both forms; the sealed copy
+        # is complete once it exists
+        return [
+            self.audit_path / name
+            for name in sorted(names)
+            if not (name.endswith(".jsonl") and name + ".gz" in names)
+        ]
+
+    def _seal_past_months(self) -> None:
+        """Compress audit files of months before the previous one to ``.jsonl.gz``.
+
+        Runs on the sealer thread started by __init__. The previous month is
+        left as is, since other processes may still append to it until they
+        notice the month changed. Several processes may seal at once: each
+        compresses to its own temp file, fsyncs it and renames it over the
+        sealed path before the original is removed, so a crash at any point
+        leaves at least one complete copy.
+        """
+        cutoff = _previous_month(self._get_month_key())
+        with os.scandir(self.audit_path) as it:
+            names = sorted(entry.name for entry in it if entry.is_file())
+
+        for name in names:
+            file_path = self.audit_path / name
+            try:
+                if name.endswith(".tmp") and (".jsonl.gz." in name or ".summary.json." in name):
+                    self._remove_stale_tmp(file_path)
+                elif (
+                    name.startswith("audit_")
+                    and name.endswith(".jsonl")
+                    and _file_month(file_path) < cutoff
+                ):
+                    self._seal_file(file_path)
+            except OSError as e:
+                logger.warning(f"Failed to seal audit file {name}: {e}")
+
+    def _seal_file(self, file_path: Path) -> None:
+        """Seal one past month's audit file, tolerating concurrent sealers."""
+        sealed_path = _sealed_path(file_path)
+        if not sealed_path.exists():
+            tmp_path = sealed_path.with_name(
+                f"{sealed_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            try:
+                with open(file_path, "rb") as src, open(tmp_path, "wb") as raw:
+                    with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as gz:
+                        shutil.copyfileobj(src, gz)
+                    raw.flush()
+                    os.fsync(raw.fileno())
+            except FileNotFoundError:
+                # Another process sealed and removed it first
+                tmp_path.unlink(missing_ok=True)
+                return
+            os.replace(tmp_path, sealed_path)
+
+        file_path.unlink(missing_ok=True)
+        logger.debug(f"Sealed audit file {file_path.name}")
+
+    @staticmethod
+    def _remove_stale_tmp(tmp_path: Path) -> None:
+        """Remove a sealing or summary temp file left by a process that died mid-write."""
+        try:
+            age = time.time() - tmp_path.stat().st_mtime
+        except FileNotFoundError:  # renamed into place by a live sealer
+            return
+        if age > STALE_SEAL_TMP_SECONDS:
+            tmp_path.unlink(missing_ok=True)
+
+    def _wait_for_sealer(self) -> None:
+        """Block until sealing started by __init__ has finished."""
+        self._sealer.join()
+
+    def _ensure_open(self) -> None:
+        """Make sure a writer is running for the current month's file.
+
+        The file is opened once as a raw O_APPEND descriptor and reused for
+        every batch until the month rolls over. While the writer thread is
+        alive the rollover is queued for it, so the descriptor is never
+        closed under a batch it is still writing.
+        """
+        month_str = self._get_month_key()
+        writer = self._writer
+        if month_str == self._open_month and writer is not None and writer.is_alive():
+            return
+
+        with self._open_lock:
+            alive = self._writer is not None and self._writer.is_alive()
+            if month_str != self._open_month:
+                file_path = self.audit_path / f"audit_{month_str}.jsonl"
+                if alive:
+                    # Lines queued before this point still go to the old file
+                    self._queue.put(file_path)
+                else:
+                    self._rotate(file_path)
+                self._open_month = month_str
+
+            if not alive:
+                self._writer = threading.Thread(
+                    target=self._run_writer, name="audit-writer", daemon=True
+                )
+                self._writer.start()
+                # Also after close(), so events logged later are drained at exit
+                _open_logs.add(self)
+
+    def _rotate(self, file_path: Path) -> None:
+        """Close the current descriptor and open file_path in its place.
+
+        Only called by the thread that owns the descriptor: the writer
+        thread, or the caller while no writer is running.
+        """
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        try:
+            self._fd = os.open(
+                file_path,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_CLOEXEC", 0),
+                0o644,
+            )
+        except OSError as e:
+            logger.error(f"Failed to open audit file {file_path}: {e}")
+
+    def _run_writer(self) -> None:
+        """Drain the queue in batches and write them (writer thread)."""
+        q = self._queue
+        while True:
+            item = q.get()
+            batch: list[bytes] = []
+            waiters: list[threading.Event] = []
+            rotate_to: Path | None = None
+            stop = False
+            deadline = time.monotonic() + self.flush_interval
+
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                if isinstance(item, Path):
+                    rotate_to = item
+                    break
+                batch.append(item)
+                if len(batch) >= self.flush_every:
+                    break
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = q.get(timeout=timeout)
+                except queue.Empty:
+                    break
+
+            self._write_logged(batch)
+            if rotate_to is not None:
+                self._rotate(rotate_to)
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+
+    def _write_logged(self, batch: list[bytes]) -> None:
+        """Write a batch, logging instead of raising on I/O errors."""
+        if not batch:
+            return
+        try:
+            self._write_batch(batch)
+        except OSError as e:
+            logger.error(f"Failed to write {len(batch)} audit events: {e}")
+
+    def _write_batch(self, batch: list[bytes]) -> None:
+        """Write a batch with a single gather-write and fsync.
+
+        Uses os.writev where available so the lines are submitted in one
+        syscall without first being copied into a joined buffer.
+        """
+        fd = self._fd
+        if fd is None:
+            return
+
+        if _HAS_WRITEV:
+            for i in range(0, len(batch), _IOV_MAX):
+                chunk = batch[i : i + _IOV_MAX]
+                written = os.writev(fd, chunk)
+                if written < sum(map(len, chunk)):
+                    _write_all(fd, memoryview(b"".join(chunk))[written:])
+        else:
+            _write_all(fd, memoryview(b"".join(batch)))
+        os.fsync(fd)
 
     def log(self, event: AuditEvent) -> None:
         """Log an audit event.
 
+        Slow path for callers holding an AuditEvent; the ``log_*`` helpers use
+        ``_emit`` and skip model construction.
+
         Args:
             event: The event to log.
         """
-        file_path = self._get_current_file()
-        with open(file_path, "a") as f:
-            f.write(event.to_json_line() + "\n")
+        self._append(event.to_json_bytes())
         logger.debug(f"Audit: {event.event_type} - {event.currency or 'N/A'}")
 
+    def _emit(
+        self,
+        event_type: AuditEventType,
+        currency: str | None,
+        details: dict[str, Any],
+    ) -> None:
+        """Serialize and buffer an event without building an AuditEvent model.
+
+        Produces the same compact JSON as ``AuditEvent.to_json_bytes`` by
+        splicing precomputed fragments around the serialized details.
+        """
+        head = _TIMESTAMP_PREFIX + datetime.now(timezone.utc).isoformat().encode()
+        body = fastjson.dumps(details) if details else b"{}"
+        line = b"".join(
+            (
+                head,
+                b'",',
+                _EVENT_TYPE_FRAGMENTS[event_type],
+                b',"currency":',
+                fastjson.dumps(currency),
+                b"," + body[1:] if len(body) > 2 else b"}",
+                b"\n",
+            )
+        )
+        self._append(line)
+        logger.debug(f"Audit: {event_type} - {currency or 'N/A'}")
+
+    def _append(self, line: bytes) -> None:
+        """Queue a serialized line for the writer thread, rotating as needed."""
+        self._ensure_open()
+        self._queue.put(line)
+
+    def flush(self) -> None:
+        """Block until every queued event has been written and fsynced."""
+        if self._writer is None or not self._writer.is_alive():
+            return
+
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        """Drain pending events, stop the writer thread and close the file.
+
+        If the writer does not finish within CLOSE_TIMEOUT, the file is left
+        open for it and the log stays registered for the exit drain.
+        """
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=CLOSE_TIMEOUT)
+            if self._writer.is_alive():
+                logger.warning(
+                    f"Audit writer still busy after {CLOSE_TIMEOUT}s; events are still pending"
+                )
+                return
+        self._writer = None
+        self._write_leftovers()
+
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._open_month = None
+        _open_logs.discard(self)
+
+    def _write_leftovers(self) -> None:
+        """Write lines still queued after the writer thread has exited.
+
+        Lines logged while close() was stopping the writer are queued behind
+        its stop sentinel and would otherwise be lost. Queued rotations are
+        applied in order so each line still lands in its month's file.
+        """
+        batch: list[bytes] = []
+        waiters: list[threading.Event] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, bytes):
+                batch.append(item)
+            elif isinstance(item, Path):
+                self._write_logged(batch)
+                batch = []
+                self._rotate(item)
+            elif isinstance(item, threading.Event):
+                waiters.append(item)
+
+        self._write_logged(batch)
+        for waiter in waiters:
+            waiter.set()
+
     def log_backfill_start(
         self,
         currency: str,
@@ -100,15 +633,13 @@ class AuditLog:
     ) -> None:
         """Log backfill start event."""
         event_type = AuditEventType.BACKFILL_RESUME if resume else AuditEventType.BACKFILL_START
-        self.log(
-            AuditEvent(
-                event_type=event_type,
-                currency=currency,
-                details={
-                    "start_date": start_date.isoformat(),
-                    "end_date": end_date.isoformat(),
-                },
-            )
+        self._emit(
+            event_type,
+            currency,
+            {
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+            },
         )
 
     def log_backfill_complete(
@@ -120,50 +651,36 @@ class AuditLog:
         dlq_failures: int = 0,
     ) -> None:
         """Log backfill completion."""
-        self.log(
-            AuditEvent(
-                event_type=AuditEventType.BACKFILL_COMPLETE,
-                currency=currency,
-                details={
-                    "trades_count": trades_count,
-                    "files_count": files_count,
-                    "duration_seconds": round(duration_seconds, 2),
-                    "dlq_failures": dlq_failures,
-                },
-            )
+        self._emit(
+            AuditEventType.BACKFILL_COMPLETE,
+            currency,
+            {
+                "trades_count": trades_count,
+                "files_count": files_count,
+                "duration_seconds": round(duration_seconds, 2),
+                "dlq_failures": dlq_failures,
+            },
         )
 
     def log_backfill_error(self, currency: str, error: str) -> None:
         """Log backfill error."""
-        self.log(
-            AuditEvent(
-                event_type=AuditEventType.BACKFILL_ERROR,
-                currency=currency,
-                details={"error": error},
-            )
-        )
+        self._emit(AuditEventType.BACKFILL_ERROR, currency, {"error": error})
 
     def log_sync_start(self, currency: str, from_timestamp: datetime) -> None:
         """Log sync start event."""
-        self.log(
-            AuditEvent(
-                event_type=AuditEventType.SYNC_START,
-                currency=currency,
-                details={"from_timestamp": from_timestamp.isoformat()},
-            )
+        self._emit(
+            AuditEventType.SYNC_START, currency, {"from_timestamp": from_timestamp.isoformat()}
         )
 
     def log_sync_complete(self, currency: str, trades_count: int, duration_seconds: float) -> None:
         """Log sync completion."""
-        self.log(
-            AuditEvent(
-                event_type=AuditEventType.SYNC_COMPLETE,
-                currency=currency,
-                details={
-                    "trades_count": trades_count,
-                    "duration_seconds": round(duration_seconds, 2),
-                },
-            )
+        self._emit(
+            AuditEventType.SYNC_COMPLETE,
+            currency,
+            {
+                "trades_count": trades_count,
+                "duration_seconds": round(duration_seconds, 2),
+            },
         )
 
     def log_file_written(
@@ -174,16 +691,14 @@ class AuditLog:
         sha256: str | None = None,
     ) -> None:
         """Log file write event."""
-        self.log(
-            AuditEvent(
-                event_type=AuditEventType.FILE_WRITTEN,
-                currency=currency,
-                details={
-                    "file_path": str(file_path),
-                    "rows": rows,
-                    "sha256": sha256,
-                },
-            )
+        self._emit(
+            AuditEventType.FILE_WRITTEN,
+            currency,
+            {
+                "file_path": str(file_path),
+                "rows": rows,
+                "sha256": sha256,
+            },
         )
 
     def log_validation_run(
@@ -194,33 +709,27 @@ class AuditLog:
         stats: dict,
     ) -> None:
         """Log validation run."""
-        self.log(
-            AuditEvent(
-                event_type=AuditEventType.VALIDATION_RUN,
-                currency=currency,
-                details={
-                    "passed": passed,
-                    "issues_count": issues_count,
-                    "stats": stats,
-                },
-            )
+        self._emit(
+            AuditEventType.VALIDATION_RUN,
+            currency,
+            {
+                "passed": passed,
+                "issues_count": issues_count,
+                "stats": stats,
+            },
         )
 
     def log_dlq_failure(self, currency: str, error: str, instrument: str | None) -> None:
         """Log dead letter queue failure."""
-        self.log(
-            AuditEvent(
-                event_type=AuditEventType.DLQ_FAILURE,
-                currency=currency,
-                details={"error": error, "instrument": instrument},
-            )
-        )
+        self._emit(AuditEventType.DLQ_FAILURE, currency, {"error": error, "instrument": instrument})
 
     def get_recent_events(
         self,
         limit: int = 100,
         event_type: AuditEventType | None = None,
         currency: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
     ) -> list[dict]:
         """Get recent audit events.
 
@@ -228,80 +737,201 @@ class AuditLog:
             limit: Maximum events to return.
             event_type: Filter by event type (optional).
             currency: Filter by currency (optional).
+            since: Only events at or after this time (optional).
+            until: Only events at or before this time (optional).
 
         Returns:
             List of event dicts (most recent first).
         """
+        self.flush()
+        self._wait_for_sealer()
         events: list[dict] = []
 
-        # Read from most recent files first
-        for file_path in sorted(self.audit_path.glob("audit_*.jsonl"), reverse=True):
-            with open(file_path) as f:
-                for line in f:
-                    try:
-                        event = json.loads(line.strip())
+        since_month, until_month = _month_key(since), _month_key(until)
+        since_key, until_key = _timestamp_key(since), _timestamp_key(until)
+
+        # Files are append-only and chronological: read newest file first, newest line first
+        for file_path in reversed(self._iter_audit_files()):
+            month = _file_month(file_path)
+            if until_month and month > until_month:
+                continue
+            if since_month and month < since_month:
+                break
 
-                        # Apply filters
-                        if event_type and event.get("event_type") != event_type.value:
+            for line in _iter_lines_reversed(file_path):
+                event = None
+                if since_key or until_key:
+                    ts = _line_timestamp(line)
+                    if ts is None:
+                        try:
+                            event = fastjson.loads(line)
+                        except fastjson.JSONDecodeError:
                             continue
-                        if currency and event.get("currency") != currency:
+                        ts = _event_timestamp(event)
+                        if ts is None:
                             continue
+                    if until_key and ts > until_key:
+                        continue
+                    if since_key and ts < since_key:
+                        return events
+
+                if event is None:
+                    try:
+                        event = fastjson.loads(line)
+                    except fastjson.JSONDecodeError:
+                        continue
+
+                # Apply filters
+                if event_type and event.get("event_type") != event_type.value:
+                    continue
+                if currency and event.get("currency") != currency:
+                    continue
 
-                        events.append(event)
+                events.append(event)
+                if len(events) >= limit:
+                    return events
 
-                        if len(events) >= limit:
-                            break
-                    except json.JSONDecodeError:
+        return events
+
+    def _summary_cache_path(self, file_path: Path) -> Path:
+        """Get sidecar summary cache path for an audit file (plain or sealed)."""
+        month_stem = file_path.name.split(".", 1)[0]
+        return file_path.with_name(f"{month_stem}.summary.json")
+
+    def _summarize_file(
+        self,
+        file_path: Path,
+        since_key: bytes | None = None,
+        until_key: bytes | None = None,
+    ) -> dict[str, Any]:
+        """Count events in a single audit file, optionally within a time window."""
+        by_event_type: Counter[str] = Counter()
+        by_currency: Counter[str] = Counter()
+        errors: list[dict[str, Any]] = []
+
+        with _open_audit_file(file_path) as f:
+            for line in f:
+                event = None
+                if since_key or until_key:
+                    ts = _line_timestamp(line)
+                    if ts is None:
+                        try:
+                            event = fastjson.loads(line)
+                        except fastjson.JSONDecodeError:
+                            continue
+                        ts = _event_timestamp(event)
+                    if (
+                        ts is None
+                        or (since_key and ts < since_key)
+                        or (until_key and ts > until_key)
+                    ):
                         continue
 
-            if len(events) >= limit:
-                break
+                if event is None:
+                    try:
+                        event = fastjson.loads(line)
+                    except fastjson.JSONDecodeError:
+                        continue
 
-        # Sort by timestamp descending
-        events.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-        return events[:limit]
+                etype = event.get("event_type", "unknown")
+                by_event_type[etype] += 1
 
-    def get_summary(self) -> dict[str, Any]:
+                currency = event.get("currency", "N/A")
+                if currency:
+                    by_currency[currency] += 1
+
+                if "error" in etype.lower() and len(errors) < 10:
+                    errors.append(event)
+
+        return {
+            "total_events": sum(by_event_type.values()),
+            "by_event_type": dict(by_event_type),
+            "by_currency": dict(by_currency),
+            "errors": errors,
+        }
+
+    def _get_file_summary(self, file_path: Path, current_file: Path) -> dict[str, Any]:
+        """Get summary for one audit file, using the sidecar cache for sealed months.
+
+        Files from past months are never appended to again, so their summary is
+        written once to ``audit_YYYY-MM.summary.json`` and reused afterwards.
+        """
+        if file_path == current_file:
+            return self._summarize_file(file_path)
+
+        cache_path = self._summary_cache_path(file_path)
+        try:
+            if cache_path.stat().st_mtime >= file_path.stat().st_mtime:
+                cached: dict[str, Any] = fastjson.loads(cache_path.read_bytes())
+                return cached
+        except (OSError, fastjson.JSONDecodeError):
+            pass
+
+        summary = self._summarize_file(file_path)
+
+        # Processes summarizing the same month write identical caches; a
+        # private temp name keeps their writes apart
+        tmp_path = cache_path.with_name(
+            f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            tmp_path.write_bytes(fastjson.dumps(summary))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.debug(f"Failed to cache audit summary for {file_path.name}: {e}")
+
+        return summary
+
+    def get_summary(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> dict[str, Any]:
         """Get audit log summary.
 
+        Months outside the window are skipped by filename without being opened.
+
+        Args:
+            since: Only count events at or after this time (optional).
+            until: Only count events at or before this time (optional).
+
         Returns:
             Summary dict with counts and recent activity.
         """
+        self.flush()
+        self._wait_for_sealer()
         total_files = 0
         total_events = 0
-        by_event_type: dict[str, int] = {}
-        by_currency: dict[str, int] = {}
+        by_event_type: Counter[str] = Counter()
+        by_currency: Counter[str] = Counter()
         recent_errors: list[dict[str, Any]] = []
 
-        for file_path in self.audit_path.glob("audit_*.jsonl"):
-            total_files += 1
-
-            with open(file_path) as f:
-                for line in f:
-                    try:
-                        event = json.loads(line.strip())
-                        total_events += 1
-
-                        # Count by type
-                        etype = event.get("event_type", "unknown")
-                        by_event_type[etype] = by_event_type.get(etype, 0) + 1
+        current_file = self._get_current_file()
+        since_month, until_month = _month_key(since), _month_key(until)
+        since_key, until_key = _timestamp_key(since), _timestamp_key(until)
 
-                        # Count by currency
-                        currency = event.get("currency", "N/A")
-                        if currency:
-                            by_currency[currency] = by_currency.get(currency, 0) + 1
+        for file_path in self._iter_audit_files():
+            month = _file_month(file_path)
+            if (since_month and month < since_month) or (until_month and month > until_month):
+                continue
 
-                        # Track recent errors
-                        if "error" in etype.lower() and len(recent_errors) < 10:
-                            recent_errors.append(event)
+            if (since_month and month == since_month) or (until_month and month == until_month):
+                # Partially covered month: filter line by line
+                summary = self._summarize_file(file_path, since_key, until_key)
+            else:
+                summary = self._get_file_summary(file_path, current_file)
 
-                    except json.JSONDecodeError:
-                        continue
+            total_files += 1
+            total_events += summary["total_events"]
+            by_event_type.update(summary["by_event_type"])
+            by_currency.update(summary["by_currency"])
+            recent_errors.extend(summary["errors"][: 10 - len(recent_errors)])
 
         return {
             "total_files": total_files,
             "total_events": total_events,
-            "by_event_type": by_event_type,
-            "by_currency": by_currency,
+            "by_event_type": dict(by_event_type),
+            "by_currency": dict(by_currency),
             "recent_errors": recent_errors,
         }
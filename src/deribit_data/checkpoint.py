@@ -5,27 +5,36 @@ Provides atomic save/load operations for download state.
 
 from __future__ import annotations
 
-import json
 import logging
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
+from pydantic import ValidationError
+
 from deribit_data.models import CheckpointState
 
 logger = logging.getLogger(__name__)
 
 
-def _parse_isoformat(dt_str: str) -> datetime:
-    """Parse ISO format string with 'Z' suffix support for Python < 3.11."""
-    if dt_str.endswith("Z"):
-        dt_str = dt_str.replace("Z", "+00:00")
-    return datetime.fromisoformat(dt_str)
+def _fsync_dir(dir_path: Path) -> None:
+    """Fsync a directory so a rename inside it survives a crash."""
+    fd = os.open(dir_path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        os.fsync(fd)
+    except OSError:  # not supported on some platforms/filesystems
+        pass
+    finally:
+        os.close(fd)
 
 
 class CheckpointManager:
     """Manages checkpoint files for crash recovery.
 
     Uses atomic writes (tmp + rename) to prevent corruption on crash.
+
+    Checkpoints are only written by this manager, so loaded and saved states
+    are cached in memory per currency and later loads skip the disk.
     """
 
     def __init__(self, checkpoint_dir: Path) -> None:
@@ -36,13 +45,16 @@ class CheckpointManager:
         """
         self.checkpoint_dir = checkpoint_dir
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self._cache: dict[str, CheckpointState | None] = {}
 
         # Clean up stale temp files on init
         self._cleanup_stale_temps()
 
     def _cleanup_stale_temps(self) -> None:
         """Remove any stale .tmp files from previous crashes."""
-        for tmp_file in self.checkpoint_dir.glob("*.tmp"):
+        with os.scandir(self.checkpoint_dir) as it:
+            stale = [Path(entry.path) for entry in it if entry.name.endswith(".tmp")]
+        for tmp_file in stale:
             logger.info(f"Cleaning up stale temp file: {tmp_file}")
             tmp_file.unlink()
 
@@ -53,7 +65,8 @@ class CheckpointManager:
     def save(self, state: CheckpointState) -> None:
         """Atomically save checkpoint state.
 
-        Uses tmp file + rename pattern for crash safety.
+        Uses tmp file + fsync + rename pattern, then fsyncs the directory so
+        the new entry is durable.
 
         Args:
             state: Checkpoint state to save.
@@ -61,20 +74,23 @@ class CheckpointManager:
         file_path = self._get_checkpoint_path(state.currency)
         tmp_path = file_path.with_suffix(".tmp")
 
-        # Serialize state
-        data = state.model_dump(mode="json")
-
-        # Convert datetime to ISO format
-        if isinstance(data.get("started_at"), datetime):
-            data["started_at"] = data["started_at"].isoformat()
-        if isinstance(data.get("last_flush_at"), datetime):
-            data["last_flush_at"] = data["last_flush_at"].isoformat()
-
-        # Write to temp file
-        tmp_path.write_text(json.dumps(data, indent=2))
+        # Serialize state in one pass (pydantic-core, datetimes as ISO-8601)
+        data = state.model_dump_json().encode()
 
-        # Atomic rename (POSIX guarantees atomicity)
-        tmp_path.rename(file_path)
+        # Write to temp file and flush to disk
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            payload = memoryview(data)
+            while payload:
+                payload = payload[os.write(fd, payload) :]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        # Atomic rename (os.replace also overwrites on Windows)
+        os.replace(tmp_path, file_path)
+        _fsync_dir(self.checkpoint_dir)
+        self._cache[state.currency.lower()] = state
 
         logger.debug(f"Saved checkpoint for {state.currency}: page={state.last_page}")
 
@@ -87,28 +103,27 @@ class CheckpointManager:
         Returns:
             CheckpointState if found, None otherwise.
         """
+        key = currency.lower()
+        if key in self._cache:
+            return self._cache[key]
+
         file_path = self._get_checkpoint_path(currency)
 
         if not file_path.exists():
+            self._cache[key] = None
             return None
 
         try:
-            data = json.loads(file_path.read_text())
-
-            # Parse datetime strings
-            if isinstance(data.get("started_at"), str):
-                data["started_at"] = _parse_isoformat(data["started_at"])
-            if isinstance(data.get("last_flush_at"), str):
-                data["last_flush_at"] = _parse_isoformat(data["last_flush_at"])
-
-            state = CheckpointState(**data)
+            # Pydantic parses JSON and ISO-8601 datetimes (incl. "Z") in one pass
+            state = CheckpointState.model_validate_json(file_path.read_bytes())
             logger.info(
                 f"Loaded checkpoint for {currency}: "
                 f"page={state.last_page}, trades={state.trades_fetched}"
             )
+            self._cache[key] = state
             return state
 
-        except (json.JSONDecodeError, ValueError) as e:
+        except ValidationError as e:
             logger.warning(f"Invalid checkpoint file for {currency}: {e}")
             return None
 
@@ -121,6 +136,7 @@ class CheckpointManager:
         Returns:
             True if deleted, False if not found.
         """
+        self._cache[currency.lower()] = None
         file_path = self._get_checkpoint_path(currency)
 
         if file_path.exists():
@@ -139,6 +155,9 @@ class CheckpointManager:
         Returns:
             True if checkpoint exists.
         """
+        key = currency.lower()
+        if key in self._cache:
+            return self._cache[key] is not None
         return self._get_checkpoint_path(currency).exists()
 
     def create_initial(self, currency: str) -> CheckpointState:
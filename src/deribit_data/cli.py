@@ -13,10 +13,13 @@ from __future__ import annotations
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
+from itertools import islice
 from pathlib import Path
 
 import click
+import httpx
 from rich.console import Console
 from rich.logging import RichHandler
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -26,7 +29,7 @@ from deribit_data.audit import AuditLog
 from deribit_data.checkpoint import CheckpointManager
 from deribit_data.config import DeribitConfig
 from deribit_data.dead_letter import DeadLetterQueue
-from deribit_data.fetcher import DeribitFetcher
+from deribit_data.fetcher import DeribitFetcher, create_http_client
 from deribit_data.manifest import ManifestManager
 from deribit_data.reconciliation import DataReconciler
 from deribit_data.storage import ParquetStorage
@@ -34,6 +37,34 @@ from deribit_data.validator import DataValidator
 
 console = Console()
 
+# Minimum seconds between progress line refreshes
+PROGRESS_INTERVAL = 0.25
+
+# Rich style per validation issue severity
+SEVERITY_COLORS = {
+    "critical": "red",
+    "high": "red",
+    "medium": "yellow",
+    "low": "dim",
+    "info": "dim",
+}
+
+
+class CurrencyParamType(click.ParamType):
+    """Currency option: validated case-insensitively and normalized to upper case."""
+
+    name = "currency"
+    choices = ("BTC", "ETH")
+
+    def convert(self, value: str, param: click.Parameter | None, ctx: click.Context | None) -> str:
+        currency = value.upper()
+        if currency not in self.choices:
+            self.fail(f"{value!r} is not one of {', '.join(self.choices)}.", param, ctx)
+        return currency
+
+
+CURRENCY = CurrencyParamType()
+
 
 def setup_logging(verbose: bool) -> None:
     """Configure logging."""
@@ -55,12 +86,40 @@ def main(ctx: click.Context, verbose: bool) -> None:
     setup_logging(verbose)
 
 
+def load_config(catalog: Path | None, config: Path | None = None) -> DeribitConfig:
+    """Load configuration from a file or the environment, with a catalog override.
+
+    Without an override the cached from_env() instance is returned as is.
+    model_copy(update=...) does not re-run validation; catalog is already a
+    Path from click.
+    """
+    cfg = DeribitConfig.from_file(config) if config else DeribitConfig.from_env()
+    if catalog is None:
+        return cfg
+    return cfg.model_copy(update={"catalog_path": catalog})
+
+
+def get_http_client(ctx: click.Context, cfg: DeribitConfig) -> httpx.Client:
+    """Get the HTTP connection pool shared by this CLI invocation.
+
+    Created on first use and closed when the root context closes.
+    """
+    root = ctx.find_root()
+    root.ensure_object(dict)
+    client: httpx.Client | None = root.obj.get("client")
+    if client is None:
+        client = create_http_client(cfg)
+        root.obj["client"] = client
+        root.call_on_close(client.close)
+    return client
+
+
 @main.command()
 @click.option(
     "-c",
     "--currency",
     required=True,
-    type=click.Choice(["BTC", "ETH"], case_sensitive=False),
+    type=CURRENCY,
     help="Currency to download",
 )
 @click.option(
@@ -104,11 +163,7 @@ def backfill(
         deribit-data backfill --currency ETH --catalog ./data
     """
     # Load config
-    cfg = DeribitConfig.from_file(config) if config else DeribitConfig.from_env()
-    if catalog:
-        cfg = cfg.model_copy(update={"catalog_path": catalog})
-
-    currency = currency.upper()
+    cfg = load_config(catalog, config)
 
     # Date range
     start_date = (
@@ -161,53 +216,75 @@ def backfill(
 
     # Fetch and save
     total_trades = checkpoint.trades_fetched
-    total_files: list[str] = list(checkpoint.files_written)
+    total_files: set[str] = set(checkpoint.files_written)
 
     try:
         with (
-            DeribitFetcher(cfg) as fetcher,
+            DeribitFetcher(cfg, get_http_client(ctx, cfg)) as fetcher,
             Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
                 console=console,
             ) as progress,
+            storage.open_trade_writer(currency) as writer,
         ):
             task = progress.add_task(f"Fetching {currency}...", total=None)
 
-            for batch in fetcher.fetch_trades_streaming(
-                currency=currency,
-                start_date=start_date,
-                end_date=end_date,
-                resume_from_ms=resume_from_ms,
-                dead_letter_queue=dlq,
-            ):
-                # Save batch
-                written_files = storage.save_trades(batch, currency)
-
-                # Update manifest
-                for f in written_files:
-                    manifest.update_file(f)
-                    if str(f) not in total_files:
-                        total_files.append(str(f))
-
-                # Update checkpoint
-                last_ts = int(batch[-1].timestamp.timestamp() * 1000)
+            # Checkpoints are persisted at most every checkpoint_interval seconds and
+            # only cover finalized daily files; replaying trades on resume is safe
+            # since merges dedup by trade_id.
+            last_checkpoint_save = time.monotonic()
+            last_progress_update = 0.0
+            try:
+                for table in fetcher.fetch_trade_tables_streaming(
+                    currency=currency,
+                    start_date=start_date,
+                    end_date=end_date,
+                    resume_from_ms=resume_from_ms,
+                    dead_letter_queue=dlq,
+                ):
+                    # Append batch (files are returned once their day is complete)
+                    written_files = writer.write_table(table)
+
+                    # Stage manifest updates (hashed when the manifest is saved)
+                    manifest.update_files_batch(written_files)
+                    total_files.update(str(f) for f in written_files)
+
+                    # Update checkpoint
+                    checkpoint = checkpoint.update_progress(
+                        timestamp_ms=writer.committed_ms or checkpoint.last_timestamp_ms,
+                        page=checkpoint.last_page + cfg.flush_every_pages,
+                        trades_count=table.num_rows,
+                        file_written=str(written_files[-1]) if written_files else None,
+                    )
+                    now = time.monotonic()
+                    if now - last_checkpoint_save >= cfg.checkpoint_interval:
+                        manifest.save()
+                        checkpoint_mgr.save(checkpoint)
+                        last_checkpoint_save = now = time.monotonic()
+
+                    total_trades += table.num_rows
+                    # Re-render the progress line at most every PROGRESS_INTERVAL
+                    if now - last_progress_update >= PROGRESS_INTERVAL:
+                        progress.update(
+                            task,
+                            description=f"Fetching {currency}... {total_trades:,} trades",
+                        )
+                        last_progress_update = now
+            finally:
+                # Finalize the open day and persist progress (also on error/interrupt)
+                written_files = writer.close()
+                manifest.update_files_batch(written_files)
+                total_files.update(str(f) for f in written_files)
                 checkpoint = checkpoint.update_progress(
-                    timestamp_ms=last_ts,
-                    page=checkpoint.last_page + cfg.flush_every_pages,
-                    trades_count=len(batch),
+                    timestamp_ms=writer.committed_ms or checkpoint.last_timestamp_ms,
+                    page=checkpoint.last_page,
+                    trades_count=0,
                     file_written=str(written_files[-1]) if written_files else None,
                 )
+                manifest.save()
                 checkpoint_mgr.save(checkpoint)
-
-                total_trades += len(batch)
-                progress.update(
-                    task,
-                    description=f"Fetching {currency}... {total_trades:,} trades",
-                )
-
-        # Save manifest
-        manifest.save()
+                dlq.flush()
 
         # Delete checkpoint on success
         checkpoint_mgr.delete(currency)
@@ -253,7 +330,7 @@ def backfill(
     "-c",
     "--currency",
     required=True,
-    type=click.Choice(["BTC", "ETH"], case_sensitive=False),
+    type=CURRENCY,
     help="Currency to sync",
 )
 @click.option("--catalog", type=click.Path(path_type=Path), default=None, help="Catalog path")
@@ -263,14 +340,9 @@ def sync(ctx: click.Context, currency: str, catalog: Path | None) -> None:
 
     Fetches new trades since last download.
     """
-    cfg = DeribitConfig.from_env()
-    if catalog:
-        cfg = cfg.model_copy(update={"catalog_path": catalog})
+    cfg = load_config(catalog)
 
-    currency = currency.upper()
     storage = ParquetStorage(cfg.catalog_path, cfg.compression, cfg.compression_level)
-    manifest = ManifestManager(cfg.catalog_path)
-    dlq = DeadLetterQueue(cfg.catalog_path)
 
     # Get last timestamp
     last_ts = storage.get_last_trade_timestamp(currency)
@@ -281,21 +353,33 @@ def sync(ctx: click.Context, currency: str, catalog: Path | None) -> None:
     start_date = last_ts + timedelta(seconds=1)
     end_date = datetime.now(timezone.utc)
 
+    # Skip the API round-trip entirely when the data is already fresh
+    if (end_date - start_date).total_seconds() < cfg.sync_min_interval_seconds:
+        console.print(
+            f"[dim]No sync needed for {currency} (last trade {last_ts.isoformat()})[/dim]"
+        )
+        return
+
+    manifest = ManifestManager(cfg.catalog_path)
+
     console.print(f"[bold]Sync {currency}[/bold]")
     console.print(f"  From: {start_date.isoformat()}")
 
     total_trades = 0
-    with DeribitFetcher(cfg) as fetcher:
-        for batch in fetcher.fetch_trades_streaming(
+    with (
+        DeadLetterQueue(cfg.catalog_path) as dlq,
+        DeribitFetcher(cfg, get_http_client(ctx, cfg)) as fetcher,
+        storage.open_trade_writer(currency) as writer,
+    ):
+        for table in fetcher.fetch_trade_tables_streaming(
             currency=currency,
             start_date=start_date,
             end_date=end_date,
             dead_letter_queue=dlq,
         ):
-            written_files = storage.save_trades(batch, currency)
-            for f in written_files:
-                manifest.update_file(f)
-            total_trades += len(batch)
+            manifest.update_files_batch(writer.write_table(table))
+            total_trades += table.num_rows
+        manifest.update_files_batch(writer.close())
 
     manifest.save()
     console.print(f"[green]Synced {total_trades:,} new trades[/green]")
@@ -311,7 +395,7 @@ def sync(ctx: click.Context, currency: str, catalog: Path | None) -> None:
     "-c",
     "--currency",
     required=True,
-    type=click.Choice(["BTC", "ETH"], case_sensitive=False),
+    type=CURRENCY,
     help="Currency",
 )
 @click.option(
@@ -327,7 +411,9 @@ def sync(ctx: click.Context, currency: str, catalog: Path | None) -> None:
     help="End date (default: today)",
 )
 @click.option("--catalog", type=click.Path(path_type=Path), default=None, help="Catalog path")
+@click.pass_context
 def dvol(
+    ctx: click.Context,
     currency: str,
     start: datetime,
     end: datetime | None,
@@ -338,11 +424,8 @@ def dvol(
     Example:
         deribit-data dvol --currency BTC --start 2024-01-01
     """
-    cfg = DeribitConfig.from_env()
-    if catalog:
-        cfg = cfg.model_copy(update={"catalog_path": catalog})
+    cfg = load_config(catalog)
 
-    currency = currency.upper()
     start_date = start.replace(tzinfo=timezone.utc)
     end_date = (end or datetime.now(timezone.utc)).replace(tzinfo=timezone.utc)
 
@@ -352,14 +435,15 @@ def dvol(
     storage = ParquetStorage(cfg.catalog_path, cfg.compression, cfg.compression_level)
     manifest = ManifestManager(cfg.catalog_path)
 
-    with DeribitFetcher(cfg) as fetcher:
-        candles = fetcher.fetch_dvol(currency, start_date, end_date)
+    with DeribitFetcher(cfg, get_http_client(ctx, cfg)) as fetcher:
+        file_path, count = storage.save_dvol_stream(
+            fetcher.iter_dvol(currency, start_date, end_date), currency
+        )
 
-    if candles:
-        file_path = storage.save_dvol(candles, currency)
+    if file_path:
         manifest.update_file(file_path)
         manifest.save()
-        console.print(f"[green]Saved {len(candles)} DVOL candles[/green]")
+        console.print(f"[green]Saved {count} DVOL candles[/green]")
     else:
         console.print("[yellow]No DVOL data found[/yellow]")
 
@@ -368,74 +452,80 @@ def dvol(
 @click.option(
     "-c",
     "--currency",
-    type=click.Choice(["BTC", "ETH"], case_sensitive=False),
+    type=CURRENCY,
     default=None,
     help="Currency to validate (default: all)",
 )
 @click.option("--catalog", type=click.Path(path_type=Path), default=None, help="Catalog path")
 @click.option("--verify-checksums", is_flag=True, help="Verify SHA256 checksums")
+@click.option(
+    "--deep", is_flag=True, help="Hash every file, even if size and mtime match the manifest"
+)
 def validate(
     currency: str | None,
     catalog: Path | None,
     verify_checksums: bool,
+    deep: bool,
 ) -> None:
     """Validate data integrity.
 
     Checks data quality and optionally verifies checksums.
     """
-    cfg = DeribitConfig.from_env()
-    if catalog:
-        cfg = cfg.model_copy(update={"catalog_path": catalog})
+    cfg = load_config(catalog)
 
-    currencies = [currency.upper()] if currency else cfg.currencies
+    currencies = [currency] if currency else cfg.currencies
     validator = DataValidator(cfg.validation)
 
-    all_passed = True
-    for curr in currencies:
-        console.print(f"\n[bold]Validating {curr}[/bold]")
-
-        result = validator.validate_trades(cfg.catalog_path, curr)
-
-        # Show stats
-        table = Table(show_header=False, box=None)
-        table.add_column("Key", style="dim")
-        table.add_column("Value")
-        table.add_row("Total rows", f"{result.stats.get('total_rows', 0):,}")
-        table.add_row("Total files", str(result.stats.get("total_files", 0)))
-        if result.stats.get("date_range"):
-            table.add_row(
-                "Date range", f"{result.stats['date_range'][0]} to {result.stats['date_range'][1]}"
-            )
-        console.print(table)
-
-        # Show issues
-        if result.issues:
-            console.print(f"\n[yellow]Issues ({len(result.issues)}):[/yellow]")
-            for issue in result.issues[:10]:  # Show first 10
-                color = {
-                    "critical": "red",
-                    "high": "red",
-                    "medium": "yellow",
-                    "low": "dim",
-                    "info": "dim",
-                }.get(issue.severity.value, "white")
-                console.print(
-                    f"  [{color}]{issue.severity.value.upper()}[/{color}]: {issue.message}"
+    # Currencies are independent and pyarrow releases the GIL while reading,
+    # so scan them concurrently and report in input order.
+    with ThreadPoolExecutor(max_workers=max(len(currencies), 1)) as pool:
+        futures = [
+            pool.submit(validator.validate_trades, cfg.catalog_path, curr) for curr in currencies
+        ]
+
+        all_passed = True
+        for curr, future in zip(currencies, futures, strict=True):
+            console.print(f"\n[bold]Validating {curr}[/bold]")
+
+            result = future.result()
+
+            # Show stats
+            table = Table(show_header=False, box=None)
+            table.add_column("Key", style="dim")
+            table.add_column("Value")
+            table.add_row("Total rows", f"{result.stats.get('total_rows', 0):,}")
+            table.add_row("Total files", str(result.stats.get("total_files", 0)))
+            if result.stats.get("date_range"):
+                table.add_row(
+                    "Date range",
+                    f"{result.stats['date_range'][0]} to {result.stats['date_range'][1]}",
                 )
-            if len(result.issues) > 10:
-                console.print(f"  ... and {len(result.issues) - 10} more")
-
-        if result.passed:
-            console.print("[green]PASSED[/green]")
-        else:
-            console.print("[red]FAILED[/red]")
-            all_passed = False
+            console.print(table)
+
+            # Show issues
+            if result.issues:
+                console.print(f"\n[yellow]Issues ({len(result.issues)}):[/yellow]")
+                lines = []
+                for issue in islice(result.issues, 10):  # Show first 10
+                    color = SEVERITY_COLORS.get(issue.severity.value, "white")
+                    lines.append(
+                        f"  [{color}]{issue.severity.value.upper()}[/{color}]: {issue.message}"
+                    )
+                console.print("\n".join(lines))
+                if len(result.issues) > 10:
+                    console.print(f"  ... and {len(result.issues) - 10} more")
+
+            if result.passed:
+                console.print("[green]PASSED[/green]")
+            else:
+                console.print("[red]FAILED[/red]")
+                all_passed = False
 
     # Verify checksums
     if verify_checksums:
         console.print("\n[bold]Verifying checksums[/bold]")
         manifest = ManifestManager(cfg.catalog_path)
-        passed, failed, failed_files = manifest.verify_all()
+        passed, failed, failed_files = manifest.verify_all(deep=deep)
         console.print(f"  Passed: {passed}, Failed: {failed}")
         if failed_files:
             for f in failed_files[:5]:
@@ -450,13 +540,15 @@ def validate(
     "-c",
     "--currency",
     required=True,
-    type=click.Choice(["BTC", "ETH"], case_sensitive=False),
+    type=CURRENCY,
     help="Currency to reconcile",
 )
 @click.option("--catalog", type=click.Path(path_type=Path), default=None, help="Catalog path")
 @click.option("--sample", type=int, default=None, help="Sample N random days (faster)")
 @click.option("--full", is_flag=True, help="Full reconciliation (slow)")
+@click.pass_context
 def reconcile(
+    ctx: click.Context,
     currency: str,
     catalog: Path | None,
     sample: int | None,
@@ -469,16 +561,12 @@ def reconcile(
     Example:
         deribit-data reconcile --currency BTC --sample 10
     """
-    cfg = DeribitConfig.from_env()
-    if catalog:
-        cfg = cfg.model_copy(update={"catalog_path": catalog})
-
-    currency = currency.upper()
+    cfg = load_config(catalog)
 
     console.print(f"[bold]Reconciling {currency}[/bold]")
     console.print(f"  Catalog: {cfg.catalog_path}")
 
-    with DataReconciler(cfg, cfg.catalog_path) as reconciler:
+    with DataReconciler(cfg, cfg.catalog_path, get_http_client(ctx, cfg)) as reconciler:
         if full:
             console.print("  Mode: Full (this may take a while)")
             report = reconciler.quick_reconcile(currency, sample_days=1000)
@@ -538,9 +626,7 @@ def reconcile(
 @click.option("--catalog", type=click.Path(path_type=Path), default=None, help="Catalog path")
 def info(catalog: Path | None) -> None:
     """Show catalog information."""
-    cfg = DeribitConfig.from_env()
-    if catalog:
-        cfg = cfg.model_copy(update={"catalog_path": catalog})
+    cfg = load_config(catalog)
 
     console.print(f"[bold]Catalog: {cfg.catalog_path}[/bold]")
 
@@ -558,8 +644,12 @@ def info(catalog: Path | None) -> None:
     table.add_column("Size")
     table.add_column("Date Range")
 
+    # Manifest already holds row counts; read footers only where it is stale
+    summary = manifest.summary()
     for curr in cfg.currencies:
-        stats = storage.get_stats(curr)
+        stats = summary.get(curr) if manifest.is_current(curr) else None
+        if stats is None:
+            stats = storage.get_stats(curr)
         if stats["file_count"] > 0:
             size_mb = stats["size_bytes"] / (1024 * 1024)
             date_range = ""
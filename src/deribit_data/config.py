@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 import os
+from collections.abc import Callable
 from datetime import date
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
+from deribit_data import fastjson
+
 
 class ValidationConfig(BaseModel):
     """Data validation thresholds."""
@@ -44,6 +48,69 @@ class ValidationConfig(BaseModel):
     )
 
 
+# Immutable field defaults, shared by every config instance
+_DEFAULT_START_DATE = date(2016, 1, 1)
+_DEFAULT_CHECKPOINT_DIR = Path(".checkpoints")
+_DEFAULT_CATALOG_PATH = Path("./data/deribit_options")
+
+
+def _parse_csv(val: str) -> list[str]:
+    """Parse a comma-separated env value into a list."""
+    return [c.strip() for c in val.split(",")]
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON config file (orjson-accelerated when installed)."""
+    return fastjson.loads(path.read_bytes())
+
+
+def _load_yaml(path: Path) -> Any:
+    """Parse a YAML config file."""
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError("PyYAML required for YAML config files") from None
+    return yaml.safe_load(path.read_text())
+
+
+# Config file parser by suffix (anything else is read as JSON)
+_FILE_LOADERS: dict[str, Callable[[Path], Any]] = {
+    ".json": _load_json,
+    ".yaml": _load_yaml,
+    ".yml": _load_yaml,
+}
+
+
+# (environment variable, config field, parser)
+_ENV_SPEC: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+    # API settings
+    ("DERIBIT_BASE_URL", "base_url", str),
+    ("DERIBIT_HTTP_TIMEOUT", "http_timeout", float),
+    ("DERIBIT_MAX_RETRIES", "max_retries", int),
+    ("DERIBIT_RATE_LIMIT_DELAY", "rate_limit_delay", float),
+    ("DERIBIT_RATE_LIMIT_BURST", "rate_limit_burst", int),
+    ("DERIBIT_BATCH_SIZE", "batch_size", int),
+    ("DERIBIT_MAX_PAGES", "max_pages", int),
+    ("DERIBIT_BACKOFF_BASE", "backoff_base", float),
+    ("DERIBIT_MAX_CONCURRENT_REQUESTS", "max_concurrent_requests", int),
+    ("DERIBIT_HTTP_POOL_SIZE", "http_pool_size", int),
+    ("DERIBIT_HTTP_BURST_LIMIT", "http_burst_limit", int),
+    ("DERIBIT_HTTP_KEEPALIVE_EXPIRY", "http_keepalive_expiry", float),
+    ("DERIBIT_HTTP2", "http2", str),
+    # Backfill settings
+    ("DERIBIT_FLUSH_EVERY_PAGES", "flush_every_pages", int),
+    ("DERIBIT_CHECKPOINT_DIR", "checkpoint_dir", Path),
+    ("DERIBIT_CHECKPOINT_INTERVAL", "checkpoint_interval", float),
+    ("DERIBIT_SYNC_MIN_INTERVAL_SECONDS", "sync_min_interval_seconds", float),
+    # Storage settings
+    ("DERIBIT_CATALOG_PATH", "catalog_path", Path),
+    ("DERIBIT_COMPRESSION", "compression", str),
+    ("DERIBIT_COMPRESSION_LEVEL", "compression_level", int),
+    # Currencies
+    ("DERIBIT_CURRENCIES", "currencies", _parse_csv),
+)
+
+
 class DeribitConfig(BaseModel):
     """Main configuration for Deribit data downloader."""
 
@@ -59,25 +126,45 @@ class DeribitConfig(BaseModel):
     rate_limit_delay: float = Field(
         default=0.1, ge=0.0, le=5.0, description="Delay between requests"
     )
+    rate_limit_burst: int = Field(
+        default=1, ge=1, le=100, description="Requests allowed back-to-back (reconcile)"
+    )
     batch_size: int = Field(default=10000, ge=100, le=100000, description="Trades per page")
     max_pages: int = Field(default=20000, ge=100, description="Safety limit on pages")
     backoff_base: float = Field(default=2.0, ge=1.0, le=5.0, description="Exponential backoff base")
+    max_concurrent_requests: int = Field(
+        default=4, ge=1, le=32, description="Max parallel API requests (reconcile)"
+    )
+    http_pool_size: int = Field(
+        default=16, ge=1, le=256, description="Idle keep-alive connections to retain"
+    )
+    http_burst_limit: int = Field(
+        default=32, ge=1, le=512, description="Max open connections during bursts"
+    )
+    http_keepalive_expiry: float = Field(
+        default=30.0, ge=1.0, le=300.0, description="Seconds an idle connection is kept alive"
+    )
+    http2: bool = Field(default=True, description="Use HTTP/2 when the h2 package is installed")
 
     # Backfill settings
     historical_start_date: date = Field(
-        default=date(2016, 1, 1), description="Start date for historical backfill"
+        default=_DEFAULT_START_DATE, description="Start date for historical backfill"
     )
     flush_every_pages: int = Field(
         default=100, ge=10, le=1000, description="Flush to disk every N pages"
     )
     checkpoint_dir: Path = Field(
-        default=Path(".checkpoints"), description="Directory for checkpoint files"
+        default=_DEFAULT_CHECKPOINT_DIR, description="Directory for checkpoint files"
+    )
+    checkpoint_interval: float = Field(
+        default=30.0, ge=0.0, description="Minimum seconds between checkpoint saves"
+    )
+    sync_min_interval_seconds: float = Field(
+        default=30.0, ge=0.0, description="Skip sync if the last trade is newer than this"
     )
 
     # Storage settings
-    catalog_path: Path = Field(
-        default=Path("./data/deribit_options"), description="Output catalog path"
-    )
+    catalog_path: Path = Field(default=_DEFAULT_CATALOG_PATH, description="Output catalog path")
     compression: Literal["zstd", "snappy", "gzip", "none"] = Field(
         default="zstd", description="Parquet compression codec"
     )
@@ -99,60 +186,30 @@ class DeribitConfig(BaseModel):
 
     @classmethod
     def from_env(cls) -> DeribitConfig:
-        """Load configuration from environment variables."""
-        env_values: dict = {}
-
-        # API settings
-        if val := os.getenv("DERIBIT_BASE_URL"):
-            env_values["base_url"] = val
-        if val := os.getenv("DERIBIT_HTTP_TIMEOUT"):
-            env_values["http_timeout"] = float(val)
-        if val := os.getenv("DERIBIT_MAX_RETRIES"):
-            env_values["max_retries"] = int(val)
-        if val := os.getenv("DERIBIT_RATE_LIMIT_DELAY"):
-            env_values["rate_limit_delay"] = float(val)
-        if val := os.getenv("DERIBIT_BATCH_SIZE"):
-            env_values["batch_size"] = int(val)
-        if val := os.getenv("DERIBIT_MAX_PAGES"):
-            env_values["max_pages"] = int(val)
-        if val := os.getenv("DERIBIT_BACKOFF_BASE"):
-            env_values["backoff_base"] = float(val)
-
-        # Backfill settings
-        if val := os.getenv("DERIBIT_FLUSH_EVERY_PAGES"):
-            env_values["flush_every_pages"] = int(val)
-        if val := os.getenv("DERIBIT_CHECKPOINT_DIR"):
-            env_values["checkpoint_dir"] = Path(val)
-
-        # Storage settings
-        if val := os.getenv("DERIBIT_CATALOG_PATH"):
-            env_values["catalog_path"] = Path(val)
-        if val := os.getenv("DERIBIT_COMPRESSION"):
-            env_values["compression"] = val
-        if val := os.getenv("DERIBIT_COMPRESSION_LEVEL"):
-            env_values["compression_level"] = int(val)
-
-        # Currencies
-        if val := os.getenv("DERIBIT_CURRENCIES"):
-            env_values["currencies"] = [c.strip() for c in val.split(",")]
-
-        return cls(**env_values)
+        """Load configuration from environment variables.
+
+        Results are cached per distinct set of DERIBIT_* values, so repeated
+        calls in one process return the same (frozen) instance.
+        """
+        env_items = tuple(
+            (env_key, val) for env_key, _, _ in _ENV_SPEC if (val := os.environ.get(env_key))
+        )
+        return _config_from_env_items(cls, env_items)
 
     @classmethod
     def from_file(cls, path: Path) -> DeribitConfig:
         """Load configuration from YAML or JSON file."""
-        import json
-
-        content = path.read_text()
-
-        if path.suffix in (".yaml", ".yml"):
-            try:
-                import yaml
-
-                data = yaml.safe_load(content)
-            except ImportError:
-                raise ImportError("PyYAML required for YAML config files") from None
-        else:
-            data = json.loads(content)
-
-        return cls(**data)
+        loader = _FILE_LOADERS.get(path.suffix, _load_json)
+        return cls(**loader(path))
+
+
+@functools.lru_cache(maxsize=8)
+def _config_from_env_items(
+    cls: type[DeribitConfig], env_items: tuple[tuple[str, str], ...]
+) -> DeribitConfig:
+    """Build a config from DERIBIT_* environment values (cached)."""
+    env = dict(env_items)
+    env_values = {
+        field: parse(env[env_key]) for env_key, field, parse in _ENV_SPEC if env_key in env
+    }
+    return cls(**env_values)
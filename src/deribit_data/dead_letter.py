@@ -6,16 +6,43 @@ Enables debugging, recovery, and data quality monitoring.
 
 from __future__ import annotations
 
-import json
 import logging
-from datetime import datetime, timezone
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+from deribit_data import fastjson
 from deribit_data.models import FailedTrade
 
 logger = logging.getLogger(__name__)
 
+# Buffered records per file before they are appended to disk
+FLUSH_EVERY = 1000
+
+# Read size when counting lines in large dead letter files
+_COUNT_CHUNK_BYTES = 1024 * 1024
+
+# Buffer size when reading dead letter records back
+_READ_BUFFER_BYTES = 1024 * 1024
+
+
+def _count_lines(file_path: Path) -> int:
+    """Count newline-terminated records in a file.
+
+    Counts newline bytes in raw chunks with bytes.count() (a C memchr loop)
+    rather than iterating decoded lines in Python.
+    """
+    with open(file_path, "rb", buffering=0) as f:
+        if os.fstat(f.fileno()).st_size <= _COUNT_CHUNK_BYTES:
+            return f.read().count(b"\n")
+        count = 0
+        while chunk := f.read(_COUNT_CHUNK_BYTES):
+            count += chunk.count(b"\n")
+        return count
+
 
 class DeadLetterQueue:
     """Dead letter queue for failed trades.
@@ -28,17 +55,49 @@ class DeadLetterQueue:
     - Daily rotation
     - JSON Lines format for easy processing
     - Statistics tracking
+
+    Records are buffered in memory and appended in batches of flush_every;
+    call flush() or close() (or use the queue as a context manager) to write
+    the remainder. Reads flush first.
     """
 
-    def __init__(self, catalog_path: Path) -> None:
+    def __init__(self, catalog_path: Path, flush_every: int = FLUSH_EVERY) -> None:
         """Initialize dead letter queue.
 
         Args:
             catalog_path: Root path for catalog (creates _dead_letters subdir).
+            flush_every: Buffered records per file that trigger a write.
         """
         self.dlq_path = catalog_path / "_dead_letters"
         self.dlq_path.mkdir(parents=True, exist_ok=True)
+        self.flush_every = flush_every
         self._stats: dict[str, int] = {}
+        self._pending: dict[Path, list[bytes]] = {}
+        self._day_files: dict[tuple[str, int, int, int], tuple[Path, str]] = {}
+        # Record counts of files seen by get_summary(), keyed by (mtime_ns, size)
+        self._line_counts: dict[Path, tuple[tuple[int, int], int]] = {}
+
+    def __enter__(self) -> DeadLetterQueue:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Write all buffered records."""
+        self.flush()
+
+    def flush(self) -> None:
+        """Append buffered records to their files, one write per file."""
+        for file_path, lines in self._pending.items():
+            self._append(file_path, lines)
+        self._pending.clear()
+
+    @staticmethod
+    def _append(file_path: Path, lines: Iterable[bytes]) -> None:
+        """Append encoded lines to a file (creates if not exists)."""
+        with open(file_path, "ab") as f:
+            f.write(b"".join(lines))
 
     def add(self, failed_trade: FailedTrade) -> None:
         """Add a failed trade to the queue.
@@ -46,10 +105,19 @@ class DeadLetterQueue:
         Args:
             failed_trade: The failed trade to save.
         """
-        date_str = failed_trade.timestamp.strftime("%Y-%m-%d")
-        file_path = self.dlq_path / f"{failed_trade.currency.lower()}_dead_letters_{date_str}.jsonl"
+        ts = failed_trade.timestamp
+        day_key = (failed_trade.currency, ts.year, ts.month, ts.day)
+        cached = self._day_files.get(day_key)
+        if cached is None:
+            # Formatted once per currency and day rather than per record
+            date_str = f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d}"
+            file_name = f"{failed_trade.currency.lower()}_dead_letters_{date_str}.jsonl"
+            cached = self._day_files[day_key] = (
+                self.dlq_path / file_name,
+                f"{failed_trade.currency}:{date_str}",
+            )
+        file_path, key = cached
 
-        # Append to file (creates if not exists)
         record = {
             "raw_data": failed_trade.raw_data,
             "error": failed_trade.error,
@@ -57,11 +125,13 @@ class DeadLetterQueue:
             "currency": failed_trade.currency,
         }
 
-        with open(file_path, "a") as f:
-            f.write(json.dumps(record) + "\n")
+        lines = self._pending.setdefault(file_path, [])
+        lines.append(fastjson.dumps(record) + b"\n")
+        if len(lines) >= self.flush_every:
+            self._append(file_path, lines)
+            del self._pending[file_path]
 
         # Update stats
-        key = f"{failed_trade.currency}:{date_str}"
         self._stats[key] = self._stats.get(key, 0) + 1
 
         logger.warning(
@@ -106,27 +176,15 @@ class DeadLetterQueue:
         Returns:
             List of FailedTrade objects.
         """
+        self.flush()
         failures: list[FailedTrade] = []
-        pattern = f"{currency.lower()}_dead_letters_*.jsonl"
-
-        for file_path in sorted(self.dlq_path.glob(pattern)):
-            # Extract date from filename
-            date_str = file_path.stem.split("_")[-1]
-            try:
-                file_date = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-            except ValueError:
-                continue
-
-            # Date filtering
-            if start_date and file_date.date() < start_date.date():
-                continue
-            if end_date and file_date.date() > end_date.date():
-                continue
 
-            with open(file_path) as f:
+        for file_path in self._failure_files(currency, start_date, end_date):
+            # Raw bytes lines go straight to the decoder (trailing newline is fine)
+            with open(file_path, "rb", buffering=_READ_BUFFER_BYTES) as f:
                 for line in f:
                     try:
-                        record = json.loads(line.strip())
+                        record = fastjson.loads(line)
                         failures.append(
                             FailedTrade(
                                 raw_data=record["raw_data"],
@@ -135,25 +193,89 @@ class DeadLetterQueue:
                                 currency=record["currency"],
                             )
                         )
-                    except (json.JSONDecodeError, KeyError) as e:
+                    except (fastjson.JSONDecodeError, KeyError) as e:
                         logger.debug(f"Error loading dead letter: {e}")
 
         return failures
 
+    def _failure_files(
+        self,
+        currency: str,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> list[Path]:
+        """List a currency's dead letter files within a date range, in date order.
+
+        With both bounds set, paths are built per day and checked directly
+        instead of listing the whole directory.
+        """
+        prefix = f"{currency.lower()}_dead_letters_"
+
+        if start_date and end_date:
+            paths = []
+            day = start_date.date()
+            while day <= end_date.date():
+                file_path = self.dlq_path / f"{prefix}{day.isoformat()}.jsonl"
+                if file_path.is_file():
+                    paths.append(file_path)
+                day += timedelta(days=1)
+            return paths
+
+        paths = []
+        for file_path in sorted(self.dlq_path.glob(f"{prefix}*.jsonl")):
+            # Extract date from filename
+            date_str = file_path.stem.split("_")[-1]
+            try:
+                file_date = datetime.fromisoformat(date_str).replace(tzinfo=timezone.utc)
+            except ValueError:
+                continue
+
+            # Date filtering
+            if start_date and file_date.date() < start_date.date():
+                continue
+            if end_date and file_date.date() > end_date.date():
+                continue
+            paths.append(file_path)
+        return paths
+
+    def _count_records(self, paths: list[Path]) -> list[int]:
+        """Count records per file, re-reading only files changed since the last call.
+
+        Files are only ever appended to, so a file with the same modification
+        time and size still holds the same number of records.
+        """
+        keys = [(st.st_mtime_ns, st.st_size) for st in map(os.stat, paths)]
+        stale = [
+            (file_path, key)
+            for file_path, key in zip(paths, keys, strict=True)
+            if file_path not in self._line_counts or self._line_counts[file_path][0] != key
+        ]
+        if stale:
+            stale_paths = [file_path for file_path, _ in stale]
+            workers = min(len(stale_paths), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                counts = pool.map(_count_lines, stale_paths)
+                for (file_path, key), count in zip(stale, counts, strict=True):
+                    self._line_counts[file_path] = (key, count)
+
+        return [self._line_counts[file_path][1] for file_path in paths]
+
     def get_summary(self) -> dict[str, Any]:
         """Get summary of all dead letter files.
 
         Returns:
             Dict with file counts, total failures, and breakdown by currency.
         """
+        self.flush()
         total_files = 0
         total_failures = 0
         by_currency: dict[str, int] = {}
         files: list[dict[str, Any]] = []
 
-        for file_path in sorted(self.dlq_path.glob("*_dead_letters_*.jsonl")):
-            with open(file_path) as f:
-                line_count = sum(1 for _ in f)
+        paths = sorted(self.dlq_path.glob("*_dead_letters_*.jsonl"))
+        line_counts = self._count_records(paths)
+
+        for file_path, line_count in zip(paths, line_counts, strict=True):
             currency = file_path.stem.split("_")[0].upper()
 
             total_files += 1
@@ -0,0 +1,67 @@
+"""JSON serialization helpers with optional orjson acceleration.
+
+Uses orjson when installed (``pip install deribit-data-downloader[fast]``),
+otherwise falls back to the stdlib json module with equivalent output.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on environment
+    HAS_ORJSON = False
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types stdlib json does not handle natively."""
+    if isinstance(obj, datetime | date):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize object to JSON bytes.
+
+    Output is compact (no whitespace) unless indented, whichever backend is
+    used. Datetimes are written in ISO 8601 format, matching
+    ``datetime.isoformat()``.
+
+    Args:
+        obj: Object to serialize.
+        indent: Pretty-print with 2-space indentation.
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    if indent:
+        return json.dumps(obj, default=_default, indent=2).encode()
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Deserialize JSON bytes or text.
+
+    Raises:
+        JSONDecodeError: If data is not valid JSON.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
@@ -6,22 +6,32 @@ Supports checkpointing for crash recovery.
 
 from __future__ import annotations
 
+import functools
+import importlib.util
 import logging
 import re
 import time
 from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 import httpx
+import pyarrow as pa
+import pyarrow.compute as pc
 
+from deribit_data import fastjson
 from deribit_data.models import (
+    ALLOWED_UNDERLYINGS,
     DVOLCandle,
     FailedTrade,
     OptionTrade,
     OptionType,
+    TradeBatch,
     TradeDirection,
 )
+from deribit_data.schema import TRADES_SCHEMA_V1
+from deribit_data.storage import trades_to_table
 
 if TYPE_CHECKING:
     from deribit_data.config import DeribitConfig
@@ -29,6 +39,56 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# httpx only speaks HTTP/2 with the optional h2 package
+HAS_H2 = importlib.util.find_spec("h2") is not None
+
+_TIMESTAMP_US = pa.timestamp("us", tz="UTC")
+_DIRECTIONS = pa.array([d.value for d in TradeDirection])
+
+# Per-trade front cache of parsed instruments: a plain dict hit is about twice
+# as cheap as going through the lru_cache wrapper of _parse_instrument
+_INSTRUMENT_CACHE_SIZE = 8192
+_INSTRUMENT_CACHE: dict[str, dict[str, Any]] = {}
+
+# Expiry month codes in instrument names (DDMMMYY); strptime's %b is slower
+# and depends on the process locale
+_EXPIRY_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"),
+        start=1,
+    )
+}
+
+# Enum construction goes through EnumMeta.__call__; a dict lookup is ~10x cheaper
+_DIRECTION_BY_VALUE = {d.value: d for d in TradeDirection}
+
+
+def create_http_client(config: DeribitConfig) -> httpx.Client:
+    """Create an HTTP client with a keep-alive connection pool.
+
+    Up to http_burst_limit connections may be open at once, of which
+    http_pool_size are kept alive for http_keepalive_expiry seconds when
+    idle. Share one client between
+    fetchers and reconcilers to reuse connections (and TLS sessions).
+
+    With config.http2 and the h2 package installed
+    (``pip install deribit-data-downloader[http2]``), requests are
+    multiplexed over HTTP/2; otherwise HTTP/1.1 is used.
+
+    Args:
+        config: Deribit configuration.
+
+    Returns:
+        Configured httpx client; the caller is responsible for closing it.
+    """
+    limits = httpx.Limits(
+        max_connections=max(config.http_burst_limit, config.http_pool_size),
+        max_keepalive_connections=config.http_pool_size,
+        keepalive_expiry=config.http_keepalive_expiry,
+    )
+    return httpx.Client(timeout=config.http_timeout, limits=limits, http2=config.http2 and HAS_H2)
+
 
 class DeribitFetcher:
     """Streaming fetcher for Deribit historical data.
@@ -59,19 +119,23 @@ class DeribitFetcher:
         r"(?P<type>[CP])$"
     )
 
-    def __init__(self, config: DeribitConfig) -> None:
+    def __init__(self, config: DeribitConfig, client: httpx.Client | None = None) -> None:
         """Initialize fetcher.
 
         Args:
             config: Deribit configuration.
+            client: Shared HTTP client. If omitted, the fetcher creates and
+                owns one.
         """
         self.config = config
-        self._client = httpx.Client(timeout=config.http_timeout)
+        self._owns_client = client is None
+        self._client = client if client is not None else create_http_client(config)
         self._last_request_time: float = 0.0
 
     def close(self) -> None:
-        """Close HTTP client."""
-        self._client.close()
+        """Close HTTP client, unless it is shared."""
+        if self._owns_client:
+            self._client.close()
 
     def __enter__(self) -> DeribitFetcher:
         return self
@@ -106,7 +170,7 @@ class DeribitFetcher:
             try:
                 response = self._client.get(url, params=params)
                 response.raise_for_status()
-                result: dict[str, Any] = response.json()
+                result: dict[str, Any] = fastjson.loads(response.content)
                 return result
 
             except httpx.HTTPStatusError as e:
@@ -140,26 +204,38 @@ class DeribitFetcher:
 
         raise RuntimeError(f"Max retries ({self.config.max_retries}) exceeded for {url}")
 
-    def _parse_instrument(self, instrument_name: str) -> dict[str, Any] | None:
-        """Parse instrument name to extract details."""
-        match = self.INSTRUMENT_PATTERN.match(instrument_name)
+    @staticmethod
+    @functools.lru_cache(maxsize=_INSTRUMENT_CACHE_SIZE)
+    def _parse_instrument(instrument_name: str) -> dict[str, Any] | None:
+        """Parse instrument name to extract details.
+
+        Cached per instrument name, since a dataset only has a few thousand
+        distinct instruments; the returned dict is shared and must not be
+        modified.
+        """
+        match = DeribitFetcher.INSTRUMENT_PATTERN.match(instrument_name)
         if not match:
             return None
 
-        groups = match.groupdict()
+        # Positional groups (underlying, expiry, strike, type) avoid a groupdict()
+        underlying, expiry_str, strike, option_type = match.group(1, 2, 3, 4)
 
         # Parse expiry: DDMMMYY -> datetime (08:00 timezone.utc)
+        month = _EXPIRY_MONTHS.get(expiry_str[-5:-2])
+        if month is None:
+            return None
         try:
-            expiry = datetime.strptime(groups["expiry"], "%d%b%y")
-            expiry = expiry.replace(hour=8, minute=0, second=0, tzinfo=timezone.utc)
-        except ValueError:
+            expiry = datetime(
+                2000 + int(expiry_str[-2:]), month, int(expiry_str[:-5]), 8, tzinfo=timezone.utc
+            )
+        except ValueError:  # No such day, e.g. 30FEB24
             return None
 
         return {
-            "underlying": groups["underlying"],
+            "underlying": underlying,
             "expiry": expiry,
-            "strike": float(groups["strike"]),
-            "option_type": OptionType.CALL if groups["type"] == "C" else OptionType.PUT,
+            "strike": float(strike),
+            "option_type": OptionType.CALL if option_type == "C" else OptionType.PUT,
         }
 
     def _parse_trade(self, trade_data: dict[str, Any]) -> tuple[OptionTrade | None, str | None]:
@@ -169,7 +245,13 @@ class DeribitFetcher:
             Tuple of (trade, error). If trade is None, error contains the reason.
         """
         instrument_name = trade_data.get("instrument_name", "")
-        parsed = self._parse_instrument(instrument_name)
+        parsed = _INSTRUMENT_CACHE.get(instrument_name)
+        if parsed is None:
+            parsed = self._parse_instrument(instrument_name)
+            if parsed is not None:
+                if len(_INSTRUMENT_CACHE) >= _INSTRUMENT_CACHE_SIZE:
+                    _INSTRUMENT_CACHE.clear()
+                _INSTRUMENT_CACHE[instrument_name] = parsed
         if not parsed:
             return None, f"Invalid instrument format: {instrument_name}"
 
@@ -178,49 +260,149 @@ class DeribitFetcher:
         iv_decimal = iv / 100.0 if iv and iv > 0 else None
 
         trade_id = str(trade_data.get("trade_id", trade_data.get("timestamp", "")))
+        index_price = trade_data.get("index_price")
+        mark_price = trade_data.get("mark_price")
 
         try:
-            trade = OptionTrade(
+            direction = trade_data["direction"]
+            # Values are converted here, so skip pydantic's per-field validation
+            trade = OptionTrade.construct_checked(
                 trade_id=trade_id,
                 instrument_id=instrument_name,
                 timestamp=datetime.fromtimestamp(trade_data["timestamp"] / 1000, tz=timezone.utc),
                 price=float(trade_data["price"]),
                 iv=iv_decimal,
                 amount=float(trade_data["amount"]),
-                direction=TradeDirection(trade_data["direction"]),
+                direction=_DIRECTION_BY_VALUE.get(direction) or TradeDirection(direction),
                 underlying=parsed["underlying"],
                 strike=parsed["strike"],
                 expiry=parsed["expiry"],
                 option_type=parsed["option_type"],
-                index_price=trade_data.get("index_price"),
-                mark_price=trade_data.get("mark_price"),
+                index_price=float(index_price) if index_price is not None else None,
+                mark_price=float(mark_price) if mark_price is not None else None,
             )
             return trade, None
         except (KeyError, ValueError, TypeError) as e:
             return None, f"Parse error: {e}"
 
-    def fetch_trades_streaming(
+    def _parse_trades_batch(
+        self, trades_data: list[dict[str, Any]]
+    ) -> tuple[pa.Table, list[tuple[dict[str, Any], str]]]:
+        """Parse a page of raw trades column-wise into an Arrow table.
+
+        Builds one Arrow array per field and validates with Arrow compute
+        kernels instead of constructing an OptionTrade per trade. Instruments
+        are parsed once per distinct name. If any trade is malformed, the
+        page falls back to per-trade _parse_trade() so failures get the same
+        error messages.
+
+        Args:
+            trades_data: Raw trades from one API page.
+
+        Returns:
+            Tuple of (table with TRADES_SCHEMA_V1, list of (raw trade, error)).
+        """
+        try:
+            table = self._trades_table_fast(trades_data)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError, OverflowError):
+            table = None
+        if table is not None:
+            return table, []
+
+        trades: list[OptionTrade] = []
+        failures: list[tuple[dict[str, Any], str]] = []
+        for trade_data in trades_data:
+            trade, error = self._parse_trade(trade_data)
+            if trade:
+                trades.append(trade)
+            elif error:
+                failures.append((trade_data, error))
+        return trades_to_table(trades), failures
+
+    def _trades_table_fast(self, trades_data: list[dict[str, Any]]) -> pa.Table | None:
+        """Vectorized page parse; returns None if any trade needs the slow path."""
+
+        def column(key: str, type_: pa.DataType | None = None) -> pa.Array:
+            return pa.array([t.get(key) for t in trades_data], type=type_)
+
+        # Instrument details: parse each distinct name once, then gather
+        names = column("instrument_name", pa.string())
+        distinct = pc.unique(names)
+        parsed = [self._parse_instrument(name) for name in distinct.to_pylist() if name]
+        if len(parsed) != len(distinct) or any(
+            p is None or p["underlying"] not in ALLOWED_UNDERLYINGS for p in parsed
+        ):
+            return None
+        instruments = [p for p in parsed if p is not None]
+        index = pc.index_in(names, value_set=distinct)
+
+        def gather(key: str, type_: pa.DataType) -> pa.Array:
+            values = [p[key].value if key == "option_type" else p[key] for p in instruments]
+            return pa.array(values, type=type_).take(index)
+
+        trade_ids = column("trade_id")
+        if trade_ids.null_count or not (
+            pa.types.is_string(trade_ids.type) or pa.types.is_integer(trade_ids.type)
+        ):
+            return None
+        timestamps = column("timestamp", pa.int64())
+        price = column("price", pa.float64())
+        amount = column("amount", pa.float64())
+        direction = column("direction", pa.string())
+        iv_raw = column("iv", pa.float64())
+        index_price = column("index_price", pa.float64())
+        mark_price = column("mark_price", pa.float64())
+        strike = gather("strike", pa.float64())
+
+        # IV arrives in percent; missing or non-positive IV is stored as null
+        iv = pc.if_else(pc.greater(iv_raw, 0), pc.divide(iv_raw, 100.0), None)
+
+        # Same constraints as OptionTrade; nulls in optional columns are allowed
+        required = (timestamps, price, amount, direction)
+        if any(arr.null_count for arr in required):
+            return None
+        checks = (
+            pc.greater_equal(price, 0),
+            pc.greater(amount, 0),
+            pc.greater(strike, 0),
+            pc.is_in(direction, value_set=_DIRECTIONS),
+            pc.less_equal(iv, 10.0),
+            pc.greater_equal(index_price, 0),
+            pc.greater_equal(mark_price, 0),
+        )
+        if not all(pc.all(check).as_py() is not False for check in checks):
+            return None
+
+        return pa.table(
+            {
+                "timestamp": pc.multiply(timestamps, 1000).cast(_TIMESTAMP_US),
+                "trade_id": trade_ids.cast(pa.string()),
+                "instrument_id": names,
+                "underlying": gather("underlying", pa.string()),
+                "strike": strike,
+                "expiry": gather("expiry", _TIMESTAMP_US),
+                "option_type": gather("option_type", pa.string()),
+                "price": price,
+                "iv": iv,
+                "amount": amount,
+                "direction": direction,
+                "index_price": index_price,
+                "mark_price": mark_price,
+            },
+            schema=TRADES_SCHEMA_V1,
+        )
+
+    def _iter_trade_pages(
         self,
         currency: str,
         start_date: datetime,
         end_date: datetime,
         resume_from_ms: int | None = None,
-        dead_letter_queue: DeadLetterQueue | None = None,
-    ) -> Generator[list[OptionTrade], None, None]:
-        """Fetch trades as a generator (streaming).
+    ) -> Generator[list[dict[str, Any]], None, None]:
+        """Page through get_last_trades_by_currency, yielding raw trade lists.
 
-        Yields batches of trades instead of accumulating all in memory.
-        Each yield contains approximately flush_every_pages * batch_size trades.
-
-        Args:
-            currency: Currency (BTC, ETH).
-            start_date: Start date (timezone.utc).
-            end_date: End date (timezone.utc).
-            resume_from_ms: Resume from this timestamp (milliseconds).
-            dead_letter_queue: Optional DLQ for failed trade parsing.
-
-        Yields:
-            Batches of OptionTrade objects.
+        The next page is fetched in the background while the caller processes
+        the current one, so parsing and writing overlap with network time.
         """
         url = f"{self.config.base_url}/get_last_trades_by_currency"
 
@@ -242,36 +424,95 @@ class DeribitFetcher:
             "end_timestamp": end_ts,
         }
 
+        def fetch_page(page: int, start_timestamp: int) -> tuple[list[dict[str, Any]], bool]:
+            logger.debug(f"Fetching page {page}")
+            response = self._request_with_backoff(
+                url, {**params, "start_timestamp": start_timestamp}
+            )
+            result = response.get("result", {})
+            return result.get("trades", []), result.get("has_more", False)
+
+        # Pages are chained by timestamp, so only one request can be in flight;
+        # it runs on a worker thread while the caller processes the previous page
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="deribit-prefetch")
+        future: Future[tuple[list[dict[str, Any]], bool]] | None = pool.submit(
+            fetch_page, 0, start_ts
+        )
         page = 0
-        batch: list[OptionTrade] = []
-        has_more = True
 
-        while has_more:
-            logger.debug(f"Fetching page {page}")
+        try:
+            while future is not None:
+                trades_data, has_more = future.result()
+                future = None
 
-            response = self._request_with_backoff(url, params)
-            result = response.get("result", {})
-            trades_data = result.get("trades", [])
-            has_more = result.get("has_more", False)
+                if not trades_data:
+                    break
 
-            if not trades_data:
-                break
+                page += 1
 
-            for trade_data in trades_data:
-                trade, error = self._parse_trade(trade_data)
-                if trade:
-                    batch.append(trade)
-                elif error and dead_letter_queue:
-                    dead_letter_queue.add(
-                        FailedTrade(raw_data=trade_data, error=error, currency=currency)
-                    )
+                # Request the next page before handing this one out
+                if has_more and page <= self.config.max_pages:
+                    last_ts = trades_data[-1].get("timestamp", 0)
+                    future = pool.submit(fetch_page, page, last_ts + 1)
 
-            # Update pagination
-            if has_more and trades_data:
-                last_ts = trades_data[-1].get("timestamp", 0)
-                params["start_timestamp"] = last_ts + 1
+                yield trades_data
 
-            page += 1
+                # Safety limit
+                if page > self.config.max_pages:
+                    logger.warning(f"Reached page limit ({self.config.max_pages})")
+                    break
+        finally:
+            # Let an in-flight request finish so it never outlives the client
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def fetch_trades_streaming(
+        self,
+        currency: str,
+        start_date: datetime,
+        end_date: datetime,
+        resume_from_ms: int | None = None,
+        dead_letter_queue: DeadLetterQueue | None = None,
+    ) -> Generator[TradeBatch, None, None]:
+        """Fetch trades as a generator (streaming).
+
+        Yields batches of trades instead of accumulating all in memory.
+        Each yield contains approximately flush_every_pages * batch_size trades.
+
+        Args:
+            currency: Currency (BTC, ETH).
+            start_date: Start date (timezone.utc).
+            end_date: End date (timezone.utc).
+            resume_from_ms: Resume from this timestamp (milliseconds).
+            dead_letter_queue: Optional DLQ for failed trade parsing.
+
+        Yields:
+            Batches of OptionTrade objects, with the last trade's timestamp in
+            milliseconds as ``last_timestamp_ms``.
+        """
+        batch = TradeBatch()
+
+        pages = self._iter_trade_pages(currency, start_date, end_date, resume_from_ms)
+        for page, trades_data in enumerate(pages, start=1):
+            # Parse the page in one comprehension and append it with a single
+            # extend, instead of a per-trade append on the growing batch
+            parsed = [self._parse_trade(trade_data) for trade_data in trades_data]
+            page_trades = [trade for trade, _ in parsed if trade is not None]
+
+            if len(page_trades) == len(parsed):
+                last_ok = len(parsed) - 1
+            else:
+                last_ok = -1
+                for i, (trade, error) in enumerate(parsed):
+                    if trade is not None:
+                        last_ok = i
+                    elif error and dead_letter_queue:
+                        dead_letter_queue.add(
+                            FailedTrade(raw_data=trades_data[i], error=error, currency=currency)
+                        )
+
+            if page_trades:
+                batch.extend(page_trades)
+                batch.last_timestamp_ms = trades_data[last_ok]["timestamp"]
 
             # Yield batch every N pages
             if page % self.config.flush_every_pages == 0 and batch:
@@ -280,29 +521,76 @@ class DeribitFetcher:
                     f"(last: {batch[-1].timestamp.isoformat()})"
                 )
                 yield batch
-                batch = []
-
-            # Safety limit
-            if page > self.config.max_pages:
-                logger.warning(f"Reached page limit ({self.config.max_pages})")
-                break
+                batch = TradeBatch()
 
         # Yield remaining trades
         if batch:
             logger.info(f"Final batch: {len(batch)} trades")
             yield batch
 
-    def fetch_dvol(
+    def fetch_trade_tables_streaming(
+        self,
+        currency: str,
+        start_date: datetime,
+        end_date: datetime,
+        resume_from_ms: int | None = None,
+        dead_letter_queue: DeadLetterQueue | None = None,
+    ) -> Generator[pa.Table, None, None]:
+        """Fetch trades as Arrow tables (streaming, columnar).
+
+        Like fetch_trades_streaming(), but pages are parsed column-wise with
+        _parse_trades_batch() and yielded as TRADES_SCHEMA_V1 tables, skipping
+        per-trade OptionTrade objects entirely.
+
+        Args:
+            currency: Currency (BTC, ETH).
+            start_date: Start date (timezone.utc).
+            end_date: End date (timezone.utc).
+            resume_from_ms: Resume from this timestamp (milliseconds).
+            dead_letter_queue: Optional DLQ for failed trade parsing.
+
+        Yields:
+            Tables of roughly flush_every_pages * batch_size trades.
+        """
+        tables: list[pa.Table] = []
+        rows = 0
+
+        pages = self._iter_trade_pages(currency, start_date, end_date, resume_from_ms)
+        for page, trades_data in enumerate(pages, start=1):
+            table, failures = self._parse_trades_batch(trades_data)
+            if dead_letter_queue:
+                for trade_data, error in failures:
+                    dead_letter_queue.add(
+                        FailedTrade(raw_data=trade_data, error=error, currency=currency)
+                    )
+            if table.num_rows:
+                tables.append(table)
+                rows += table.num_rows
+
+            # Yield batch every N pages
+            if page % self.config.flush_every_pages == 0 and tables:
+                logger.info(f"Page {page}: yielding {rows} trades")
+                yield pa.concat_tables(tables)
+                tables = []
+                rows = 0
+
+        # Yield remaining trades
+        if tables:
+            logger.info(f"Final batch: {rows} trades")
+            yield pa.concat_tables(tables)
+
+    def iter_dvol(
         self,
         currency: str,
         start_date: datetime,
         end_date: datetime,
         resolution: int = 3600,
-    ) -> list[DVOLCandle]:
-        """Fetch DVOL (Deribit Volatility Index) data with pagination.
+    ) -> Generator[list[DVOLCandle], None, None]:
+        """Fetch DVOL (Deribit Volatility Index) data page by page.
 
         Deribit DVOL API returns the most recent data first and uses a
-        continuation token for backward pagination.
+        continuation token for backward pagination, so pages are yielded
+        newest first (candles within a page keep API order).
 
         Args:
             currency: Currency (BTC, ETH).
@@ -310,8 +598,8 @@ class DeribitFetcher:
             end_date: End date (timezone.utc).
             resolution: Candle resolution in seconds (default: 1 hour).
 
-        Returns:
-            List of DVOLCandle objects sorted by timestamp ascending.
+        Yields:
+            Non-empty lists of DVOLCandle objects, one per API page.
         """
         # DVOL endpoint on main API
         url = "https://www.deribit.com/api/v2/public/get_volatility_index_data"
@@ -319,7 +607,7 @@ class DeribitFetcher:
         start_ts = int(start_date.timestamp() * 1000)
         current_end_ts = int(end_date.timestamp() * 1000)
 
-        all_candles: list[DVOLCandle] = []
+        total = 0
         page = 0
         max_pages = 100  # Safety limit (~100K candles max)
 
@@ -343,7 +631,7 @@ class DeribitFetcher:
             for row in data:
                 # row format: [timestamp, open, high, low, close]
                 try:
-                    candle = DVOLCandle(
+                    candle = DVOLCandle.construct_checked(
                         timestamp=datetime.fromtimestamp(row[0] / 1000, tz=timezone.utc),
                         open=float(row[1]),
                         high=float(row[2]),
@@ -351,18 +639,17 @@ class DeribitFetcher:
                         close=float(row[4]),
                     )
                     batch_candles.append(candle)
-                except (IndexError, ValueError, TypeError) as e:
+                except (IndexError, KeyError, ValueError, TypeError) as e:
                     logger.debug(f"Failed to parse DVOL candle: {e}")
 
             if not batch_candles:
                 break
 
-            all_candles.extend(batch_candles)
+            total += len(batch_candles)
             page += 1
 
-            logger.info(
-                f"DVOL page {page}: fetched {len(batch_candles)} candles, total {len(all_candles)}"
-            )
+            logger.info(f"DVOL page {page}: fetched {len(batch_candles)} candles, total {total}")
+            yield batch_candles
 
             # Use continuation token as new end_timestamp for backward pagination
             if not continuation or continuation <= start_ts:
@@ -370,6 +657,31 @@ class DeribitFetcher:
 
             current_end_ts = continuation
 
+    def fetch_dvol(
+        self,
+        currency: str,
+        start_date: datetime,
+        end_date: datetime,
+        resolution: int = 3600,
+    ) -> list[DVOLCandle]:
+        """Fetch DVOL (Deribit Volatility Index) data with pagination.
+
+        Collects all pages from iter_dvol(); prefer iter_dvol() for long
+        ranges to avoid holding every candle in memory.
+
+        Args:
+            currency: Currency (BTC, ETH).
+            start_date: Start date (timezone.utc).
+            end_date: End date (timezone.utc).
+            resolution: Candle resolution in seconds (default: 1 hour).
+
+        Returns:
+            List of DVOLCandle objects sorted by timestamp ascending.
+        """
+        all_candles: list[DVOLCandle] = []
+        for batch_candles in self.iter_dvol(currency, start_date, end_date, resolution):
+            all_candles.extend(batch_candles)
+
         # Sort by timestamp ascending (data comes newest-first)
         all_candles.sort(key=lambda c: c.timestamp)
 
@@ -3,15 +3,30 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
+import mmap
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import repeat
 from pathlib import Path
+from typing import Any
 
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
+from deribit_data import fastjson
+
 logger = logging.getLogger(__name__)
 
+# Files at least this large are memory-mapped for hashing
+MMAP_MIN_BYTES = 4 * 1024 * 1024
+
+# Read-ahead hints are only available on some platforms
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+_HAS_MADVISE = hasattr(mmap, "MADV_SEQUENTIAL")
+
 
 class ManifestEntry:
     """Single file entry in manifest."""
@@ -22,11 +37,13 @@ class ManifestEntry:
         size_bytes: int,
         row_count: int,
         timestamp_range: tuple[str, str] | None = None,
+        mtime_ns: int | None = None,
     ) -> None:
         self.sha256 = sha256
         self.size_bytes = size_bytes
         self.row_count = row_count
         self.timestamp_range = timestamp_range
+        self.mtime_ns = mtime_ns
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -35,6 +52,7 @@ class ManifestEntry:
             "size_bytes": self.size_bytes,
             "row_count": self.row_count,
             "timestamp_range": list(self.timestamp_range) if self.timestamp_range else None,
+            "mtime_ns": self.mtime_ns,
         }
 
     @classmethod
@@ -45,6 +63,7 @@ class ManifestEntry:
             size_bytes=data["size_bytes"],
             row_count=data["row_count"],
             timestamp_range=tuple(data["timestamp_range"]) if data.get("timestamp_range") else None,
+            mtime_ns=data.get("mtime_ns"),
         )
 
 
@@ -60,7 +79,8 @@ class ManifestManager:
                 "sha256": "abc123...",
                 "size_bytes": 1234567,
                 "row_count": 15000,
-                "timestamp_range": ["2024-01-01T00:00:00Z", "2024-01-01T23:59:59Z"]
+                "timestamp_range": ["2024-01-01T00:00:00Z", "2024-01-01T23:59:59Z"],
+                "mtime_ns": 1704153600000000000
             }
         }
     }
@@ -75,6 +95,7 @@ class ManifestManager:
         self.catalog_path = catalog_path
         self.manifest_path = catalog_path / "manifest.json"
         self._manifest: dict[str, ManifestEntry] = {}
+        self._pending: set[Path] = set()
         self._load()
 
     def _load(self) -> None:
@@ -83,15 +104,19 @@ class ManifestManager:
             return
 
         try:
-            data = json.loads(self.manifest_path.read_text())
+            data = fastjson.loads(self.manifest_path.read_bytes())
             for rel_path, entry_data in data.get("files", {}).items():
                 self._manifest[rel_path] = ManifestEntry.from_dict(entry_data)
             logger.debug(f"Loaded manifest with {len(self._manifest)} files")
-        except (json.JSONDecodeError, KeyError) as e:
+        except (fastjson.JSONDecodeError, KeyError) as e:
             logger.warning(f"Failed to load manifest: {e}")
 
     def save(self) -> None:
-        """Atomically save manifest to file."""
+        """Atomically save manifest to file.
+
+        Files staged with update_files_batch are hashed first.
+        """
+        self.commit_pending()
         tmp_path = self.manifest_path.with_suffix(".json.tmp")
 
         data = {
@@ -100,34 +125,107 @@ class ManifestManager:
             "files": {path: entry.to_dict() for path, entry in sorted(self._manifest.items())},
         }
 
-        tmp_path.write_text(json.dumps(data, indent=2))
+        tmp_path.write_bytes(fastjson.dumps(data, indent=True))
         tmp_path.rename(self.manifest_path)
 
         logger.debug(f"Saved manifest with {len(self._manifest)} files")
 
     def _compute_sha256(self, file_path: Path) -> str:
-        """Compute SHA256 hash of a file."""
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
+        """Compute SHA256 hash of a file.
+
+        Small files go through hashlib.file_digest(); larger ones are
+        memory-mapped and hashed in one update() call, so OpenSSL reads them
+        in place with no userspace copies. Both paths release the GIL and use
+        the CPU's SHA extensions where available. The kernel is told the file
+        is read sequentially, so it reads ahead aggressively.
+        """
+        with open(file_path, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < MMAP_MIN_BYTES:
+                if _HAS_FADVISE:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            try:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Some filesystems (FUSE, network mounts) do not support mmap
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            sha256 = hashlib.sha256()
+            with mapping as mm:
+                if _HAS_MADVISE:
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                sha256.update(mm)
         return sha256.hexdigest()
 
-    def _get_timestamp_range(self, file_path: Path) -> tuple[str, str] | None:
-        """Get timestamp range from Parquet file."""
+    def _get_timestamp_range(
+        self, file_path: Path, metadata: pq.FileMetaData | None = None
+    ) -> tuple[str, str] | None:
+        """Get timestamp range from Parquet file.
+
+        Uses the timestamp column's row group statistics, so no data pages
+        are decoded; the column is only read if statistics are missing.
+
+        Args:
+            file_path: Path to Parquet file.
+            metadata: File metadata, if already read.
+        """
         try:
-            table = pq.read_table(file_path, columns=["timestamp"])
-            if table.num_rows == 0:
+            if metadata is None:
+                metadata = pq.read_metadata(file_path)
+            if metadata.num_rows == 0:
                 return None
-            timestamps = table.column("timestamp").to_pylist()
-            min_ts = min(timestamps).isoformat() if timestamps else None
-            max_ts = max(timestamps).isoformat() if timestamps else None
-            if min_ts and max_ts:
-                return (min_ts, max_ts)
+            col_idx = metadata.schema.names.index("timestamp")
+
+            mins, maxs = [], []
+            for i in range(metadata.num_row_groups):
+                row_group = metadata.row_group(i)
+                if row_group.num_rows == 0:
+                    continue
+                stats = row_group.column(col_idx).statistics
+                if stats is None or not stats.has_min_max:
+                    return self._scan_timestamp_range(file_path)
+                mins.append(stats.min)
+                maxs.append(stats.max)
+
+            if mins and maxs:
+                return (min(mins).isoformat(), max(maxs).isoformat())
             return None
         except Exception:
             return None
 
+    def _scan_timestamp_range(self, file_path: Path) -> tuple[str, str] | None:
+        """Get timestamp range by reading the timestamp column."""
+        table = pq.read_table(file_path, columns=["timestamp"], memory_map=True)
+        result = pc.min_max(table.column("timestamp")).as_py()
+        if result["min"] is None or result["max"] is None:
+            return None
+        return (result["min"].isoformat(), result["max"].isoformat())
+
+    def _build_entry(self, file_path: Path) -> ManifestEntry:
+        """Compute SHA256 and metadata for a file without recording it."""
+        # Stat before hashing: a write during hashing then changes the
+        # mtime, so verify_file() cannot take its fast path on this entry
+        stat = file_path.stat()
+        sha256 = self._compute_sha256(file_path)
+
+        # One footer read serves both row count and timestamp statistics
+        try:
+            metadata = pq.read_metadata(file_path)
+        except Exception:
+            metadata = None
+        row_count = metadata.num_rows if metadata is not None else 0
+        timestamp_range = (
+            self._get_timestamp_range(file_path, metadata) if metadata is not None else None
+        )
+
+        return ManifestEntry(
+            sha256=sha256,
+            size_bytes=stat.st_size,
+            row_count=row_count,
+            timestamp_range=timestamp_range,
+            mtime_ns=stat.st_mtime_ns,
+        )
+
     def update_file(self, file_path: Path) -> ManifestEntry:
         """Update manifest entry for a file.
 
@@ -140,35 +238,69 @@ class ManifestManager:
             ManifestEntry for the file.
         """
         rel_path = str(file_path.relative_to(self.catalog_path))
+        entry = self._build_entry(file_path)
 
-        sha256 = self._compute_sha256(file_path)
-        size_bytes = file_path.stat().st_size
+        self._manifest[rel_path] = entry
+        logger.debug(f"Updated manifest for {rel_path}: {entry.sha256[:16]}...")
 
-        try:
-            metadata = pq.read_metadata(file_path)
-            row_count = metadata.num_rows
-        except Exception:
-            row_count = 0
+        return entry
 
-        timestamp_range = self._get_timestamp_range(file_path)
+    def update_files(self, file_paths: Iterable[Path]) -> list[ManifestEntry]:
+        """Update manifest entries for several files in parallel.
 
-        entry = ManifestEntry(
-            sha256=sha256,
-            size_bytes=size_bytes,
-            row_count=row_count,
-            timestamp_range=timestamp_range,
-        )
+        Hashing releases the GIL and metadata reads are I/O-bound, so files
+        are processed on a thread pool; entries are recorded in input order.
 
-        self._manifest[rel_path] = entry
-        logger.debug(f"Updated manifest for {rel_path}: {sha256[:16]}...")
+        Args:
+            file_paths: Paths to Parquet files.
 
-        return entry
+        Returns:
+            ManifestEntry for each file.
+        """
+        paths = list(file_paths)
+        if len(paths) <= 1:
+            return [self.update_file(p) for p in paths]
+
+        with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as pool:
+            entries = list(pool.map(self._build_entry, paths))
+
+        for file_path, entry in zip(paths, entries, strict=True):
+            self._manifest[str(file_path.relative_to(self.catalog_path))] = entry
+        logger.debug(f"Updated manifest for {len(paths)} files")
 
-    def verify_file(self, file_path: Path) -> bool:
+        return entries
+
+    def update_files_batch(self, file_paths: Iterable[Path]) -> None:
+        """Stage files for a deferred manifest update.
+
+        Hashing is postponed until commit_pending() or save(), so a file that is
+        rewritten by several consecutive batches is hashed only once.
+
+        Args:
+            file_paths: Paths to Parquet files.
+        """
+        self._pending.update(file_paths)
+
+    def commit_pending(self) -> list[ManifestEntry]:
+        """Hash and record all staged files.
+
+        Returns:
+            ManifestEntry for each committed file.
+        """
+        entries = self.update_files(p for p in sorted(self._pending) if p.exists())
+        self._pending.clear()
+        return entries
+
+    def verify_file(self, file_path: Path, deep: bool = False) -> bool:
         """Verify a file against manifest.
 
+        A file whose size and modification time both match the entry is
+        taken as unchanged without hashing it.
+
         Args:
             file_path: Path to Parquet file.
+            deep: Always compare the SHA256, e.g. to detect on-disk
+                corruption that leaves the modification time untouched.
 
         Returns:
             True if file matches manifest, False otherwise.
@@ -181,27 +313,34 @@ class ManifestManager:
 
         entry = self._manifest[rel_path]
 
-        # Verify SHA256
-        actual_sha256 = self._compute_sha256(file_path)
-        if actual_sha256 != entry.sha256:
+        # Verify size first; a mismatch makes reading the file unnecessary
+        stat = file_path.stat()
+        if stat.st_size != entry.size_bytes:
             logger.error(
-                f"SHA256 mismatch for {rel_path}: expected {entry.sha256}, got {actual_sha256}"
+                f"Size mismatch for {rel_path}: expected {entry.size_bytes}, got {stat.st_size}"
             )
             return False
 
-        # Verify size
-        actual_size = file_path.stat().st_size
-        if actual_size != entry.size_bytes:
+        if not deep and entry.mtime_ns == stat.st_mtime_ns:
+            return True
+
+        # Verify SHA256
+        actual_sha256 = self._compute_sha256(file_path)
+        if actual_sha256 != entry.sha256:
             logger.error(
-                f"Size mismatch for {rel_path}: expected {entry.size_bytes}, got {actual_size}"
+                f"SHA256 mismatch for {rel_path}: expected {entry.sha256}, got {actual_sha256}"
             )
             return False
 
         return True
 
-    def verify_all(self) -> tuple[int, int, list[str]]:
+    def verify_all(self, deep: bool = False) -> tuple[int, int, list[str]]:
         """Verify all files in manifest.
 
+        Args:
+            deep: Hash every file, even those whose size and modification
+                time match the manifest.
+
         Returns:
             Tuple of (passed_count, failed_count, failed_files).
         """
@@ -209,24 +348,31 @@ class ManifestManager:
         failed = 0
         failed_files: list[str] = []
 
-        for rel_path in self._manifest:
-            file_path = self.catalog_path / rel_path
-
-            if not file_path.exists():
-                logger.error(f"Missing file: {rel_path}")
-                failed += 1
-                failed_files.append(rel_path)
-                continue
+        # Hashing releases the GIL, so verify files in parallel
+        rel_paths = list(self._manifest)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            results = pool.map(self._verify_rel_path, rel_paths, repeat(deep))
 
-            if self.verify_file(file_path):
-                passed += 1
-            else:
-                failed += 1
-                failed_files.append(rel_path)
+            for rel_path, ok in zip(rel_paths, results, strict=True):
+                if ok:
+                    passed += 1
+                else:
+                    failed += 1
+                    failed_files.append(rel_path)
 
         logger.info(f"Verification complete: {passed} passed, {failed} failed")
         return passed, failed, failed_files
 
+    def _verify_rel_path(self, rel_path: str, deep: bool) -> bool:
+        """Verify a manifest entry's file, treating a missing file as failed."""
+        file_path = self.catalog_path / rel_path
+
+        if not file_path.exists():
+            logger.error(f"Missing file: {rel_path}")
+            return False
+
+        return self.verify_file(file_path, deep)
+
     def get_entry(self, rel_path: str) -> ManifestEntry | None:
         """Get manifest entry for a file.
 
@@ -253,6 +399,77 @@ class ManifestManager:
             return True
         return False
 
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Summarize trade files per currency in a single pass over the manifest.
+
+        Returns:
+            Dict of currency to a dict with row_count, file_count, date_range
+            and size_bytes (the shape of ParquetStorage.get_stats()).
+        """
+        totals: dict[str, dict[str, Any]] = {}
+        for rel_path, entry in self._manifest.items():
+            currency, _, rest = rel_path.partition("/trades/")
+            if not rest or "/" in currency:
+                continue
+
+            stats = totals.get(currency)
+            if stats is None:
+                stats = totals[currency] = {
+                    "row_count": 0,
+                    "file_count": 0,
+                    "date_range": (rest, rest),
+                    "size_bytes": 0,
+                }
+            stats["row_count"] += entry.row_count
+            stats["file_count"] += 1
+            stats["size_bytes"] += entry.size_bytes
+            first, last = stats["date_range"]
+            stats["date_range"] = (min(first, rest), max(last, rest))
+
+        for stats in totals.values():
+            first, last = stats["date_range"]
+            try:
+                stats["date_range"] = (
+                    datetime.fromisoformat(first.removesuffix(".parquet")),
+                    datetime.fromisoformat(last.removesuffix(".parquet")),
+                )
+            except ValueError:
+                stats["date_range"] = None
+
+        return totals
+
+    def is_current(self, currency: str) -> bool:
+        """Check the manifest lists exactly a currency's trade files on disk.
+
+        Compares names, sizes and modification times from one os.scandir
+        pass, like verify_file()'s fast path; no file is read. Entries from
+        older manifests have no modification time and count as stale.
+
+        Args:
+            currency: Currency (BTC, ETH).
+
+        Returns:
+            True if summary() figures for the currency can be trusted.
+        """
+        prefix = f"{currency}/trades/"
+        recorded = {
+            rel_path[len(prefix) :]: (entry.size_bytes, entry.mtime_ns)
+            for rel_path, entry in self._manifest.items()
+            if rel_path.startswith(prefix)
+        }
+
+        on_disk: dict[str, tuple[int, int | None]] = {}
+        try:
+            with os.scandir(self.catalog_path / currency / "trades") as it:
+                for e in it:
+                    if e.name.endswith(".parquet") and e.is_file():
+                        st = e.stat()
+                        on_disk[e.name] = (st.st_size, st.st_mtime_ns)
+        except FileNotFoundError:
+            pass
+
+        return on_disk == recorded
+
     @property
     def file_count(self) -> int:
         """Get number of files in manifest."""
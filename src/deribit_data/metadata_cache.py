@@ -0,0 +1,92 @@
+"""In-process cache of Parquet file footers.
+
+Stats, reconciliation and loads read the same footers repeatedly; decoding
+a footer (Thrift) is pure CPU. Entries are keyed by path plus the file's
+inode, size and mtime, so a rewritten file (atomic rename) is never served
+a stale footer.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+# Default budget for cached footers (by serialized size)
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+_CacheKey = tuple[str, int, int, int]
+
+
+class FileMetadataCache:
+    """LRU cache of pq.FileMetaData bounded by total footer size.
+
+    Example:
+        ```python
+        metadata = metadata_cache.get(path)
+        table = pq.ParquetFile(path, metadata=metadata).read()
+        ```
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Initialize cache.
+
+        Args:
+            max_bytes: Maximum total serialized footer size to keep.
+        """
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[_CacheKey, tuple[pq.FileMetaData, int]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: str | Path, stat: os.stat_result | None = None) -> pq.FileMetaData:
+        """Get a file's footer, reading it only if the file changed.
+
+        Args:
+            path: Path to Parquet file.
+            stat: The file's stat result, if already known (e.g. from scandir).
+
+        Returns:
+            File metadata.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        path = os.fspath(path)
+        if stat is None:
+            stat = os.stat(path)
+        key = (path, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached[0]
+
+        metadata = pq.read_metadata(path)
+        size = metadata.serialized_size
+
+        with self._lock:
+            if key not in self._entries and size <= self.max_bytes:
+                self._entries[key] = (metadata, size)
+                self._size += size
+                while self._size > self.max_bytes:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self._size -= evicted
+        return metadata
+
+    def clear(self) -> None:
+        """Drop all cached footers."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide cache shared by storage and reconciliation
+metadata_cache = FileMetadataCache()
@@ -5,11 +5,16 @@ Provides Pydantic models for option trades, DVOL candles, and checkpoint state.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from enum import Enum
+from typing import Any
 
 from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
+# Underlying assets accepted on OptionTrade
+ALLOWED_UNDERLYINGS = frozenset({"BTC", "ETH", "SOL", "USDC"})
+
 
 class OptionType(str, Enum):
     """Option type enum."""
@@ -64,11 +69,50 @@ class OptionTrade(BaseModel):
     @classmethod
     def validate_underlying(cls, v: str) -> str:
         """Validate underlying is a known currency."""
-        allowed = {"BTC", "ETH", "SOL", "USDC"}
-        if v not in allowed:
-            raise ValueError(f"Unknown underlying: {v}, expected one of {allowed}")
+        if v not in ALLOWED_UNDERLYINGS:
+            raise ValueError(f"Unknown underlying: {v}, expected one of {set(ALLOWED_UNDERLYINGS)}")
         return v
 
+    @classmethod
+    def construct_checked(cls, **fields: Any) -> OptionTrade:
+        """Build a trade without pydantic validation, enforcing the same constraints.
+
+        Ingest hot path: callers must pass already-typed values (floats, aware
+        datetimes, enum members). Bounds are checked in plain Python, which
+        is several times cheaper than running the model validators.
+
+        Raises:
+            ValueError: If a field violates the model's constraints.
+        """
+        for name in ("price", "index_price", "mark_price"):
+            value = fields.get(name)
+            if value is not None and not value >= 0:
+                raise ValueError(f"{name} must be >= 0, got {value}")
+        for name in ("amount", "strike"):
+            if not fields[name] > 0:
+                raise ValueError(f"{name} must be > 0, got {fields[name]}")
+        iv = fields.get("iv")
+        if iv is not None and not 0 <= iv <= 10.0:
+            raise ValueError(f"iv must be between 0 and 10.0, got {iv}")
+        cls.validate_underlying(fields["underlying"])
+        return cls.model_construct(**fields)
+
+
+class TradeBatch(list[OptionTrade]):
+    """Batch of trades yielded by the streaming fetcher.
+
+    A plain list of OptionTrade that also carries the raw millisecond
+    timestamp of its last trade, so consumers need not convert it back from
+    the datetime.
+
+    Attributes:
+        last_timestamp_ms: Timestamp of the last trade in milliseconds.
+    """
+
+    def __init__(self, trades: Iterable[OptionTrade] = (), last_timestamp_ms: int = 0) -> None:
+        super().__init__(trades)
+        self.last_timestamp_ms = last_timestamp_ms
+
 
 class DVOLCandle(BaseModel):
     """DVOL (Deribit Volatility Index) OHLC candle.
@@ -97,6 +141,23 @@ class DVOLCandle(BaseModel):
             raise ValueError(f"high ({v}) must be >= low ({info.data['low']})")
         return v
 
+    @classmethod
+    def construct_checked(cls, **fields: Any) -> DVOLCandle:
+        """Build a candle without pydantic validation, enforcing the same constraints.
+
+        Same contract as OptionTrade.construct_checked(): callers pass floats
+        and an aware datetime.
+
+        Raises:
+            ValueError: If a field violates the model's constraints.
+        """
+        for name in ("open", "high", "low", "close"):
+            if not fields[name] > 0:
+                raise ValueError(f"{name} must be > 0, got {fields[name]}")
+        if fields["high"] < fields["low"]:
+            raise ValueError(f"high ({fields['high']}) must be >= low ({fields['low']})")
+        return cls.model_construct(**fields)
+
 
 class FailedTrade(BaseModel):
     """Failed trade for dead letter queue.
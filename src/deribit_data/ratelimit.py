@@ -0,0 +1,77 @@
+"""Thread-safe credit bucket rate limiter.
+
+Models Deribit's credit system: each request spends credits, credits refill
+at a fixed rate up to a capacity, so short bursts are allowed while the
+sustained rate stays bounded. The refill rate adapts to the server (AIMD):
+it is halved on every 429 response and creeps back after successes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+# Lowest refill rate throttle() backs off to, as a fraction of the configured rate
+MIN_REFILL_FRACTION = 1 / 16
+
+# Successes needed to recover the full configured rate from zero
+RECOVERY_STEPS = 20
+
+
+class CreditBucket:
+    """Token bucket shared by worker threads.
+
+    Callers that find the bucket empty reserve their credits (the balance
+    goes negative) and sleep until the refill covers them, so concurrent
+    callers are spaced out instead of all waking at once.
+
+    Example:
+        ```python
+        bucket = CreditBucket(capacity=5, refill_per_sec=10.0)
+        bucket.acquire()  # Blocks until a credit is available
+        ```
+    """
+
+    def __init__(self, capacity: float, refill_per_sec: float | None) -> None:
+        """Initialize bucket, starting full.
+
+        Args:
+            capacity: Maximum credits that can accumulate (burst size).
+            refill_per_sec: Credits added per second, or None for no limit.
+        """
+        self.capacity = capacity
+        self.max_refill_per_sec = refill_per_sec
+        self.refill_per_sec = refill_per_sec
+        self._credits = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, cost: float = 1.0) -> None:
+        """Spend credits, sleeping until the bucket can cover them."""
+        if self.refill_per_sec is None:
+            return
+        with self._lock:
+            now = time.monotonic()
+            refill = self.refill_per_sec
+            self._credits = min(self.capacity, self._credits + (now - self._updated) * refill)
+            self._updated = now
+            self._credits -= cost
+            wait = -self._credits / refill if self._credits < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def throttle(self) -> None:
+        """Halve the refill rate after the server rejected a request (429)."""
+        if self.max_refill_per_sec is None or self.refill_per_sec is None:
+            return
+        with self._lock:
+            floor = self.max_refill_per_sec * MIN_REFILL_FRACTION
+            self.refill_per_sec = max(floor, self.refill_per_sec / 2)
+
+    def recover(self) -> None:
+        """Step the refill rate back towards the configured rate after a success."""
+        if self.max_refill_per_sec is None or self.refill_per_sec is None:
+            return
+        with self._lock:
+            step = self.max_refill_per_sec / RECOVERY_STEPS
+            self.refill_per_sec = min(self.max_refill_per_sec, self.refill_per_sec + step)
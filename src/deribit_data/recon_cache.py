@@ -0,0 +1,81 @@
+"""On-disk cache of API trade counts for reconciliation.
+
+Trade counts for settled days never change, so reconciliation only needs
+to ask the API about each past day once. Days from yesterday onward may
+still receive trades and are never cached.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from deribit_data import fastjson
+
+logger = logging.getLogger(__name__)
+
+# Cache file name inside the catalog
+CACHE_FILENAME = "reconciliation_cache.json"
+
+
+def is_settled(date: datetime) -> bool:
+    """Check if a day is old enough for its API trade count to be final."""
+    return date.date() < datetime.now(timezone.utc).date() - timedelta(days=1)
+
+
+class ReconciliationCache:
+    """API trade counts per (currency, day), persisted as JSON.
+
+    Cache format:
+    {
+        "BTC": {"2024-01-01": 15000, "2024-01-02": 14210}
+    }
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize cache.
+
+        Args:
+            path: Path to cache file.
+        """
+        self.path = path
+        self._counts: dict[str, dict[str, int]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load cache from file if it exists."""
+        if not self.path.exists():
+            return
+
+        try:
+            data = fastjson.loads(self.path.read_bytes())
+            self._counts = {
+                currency: {day: int(count) for day, count in days.items()}
+                for currency, days in data.items()
+            }
+        except (fastjson.JSONDecodeError, AttributeError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to load reconciliation cache: {e}")
+
+    def get(self, currency: str, date: datetime) -> int | None:
+        """Get the cached API trade count for a day, if known."""
+        return self._counts.get(currency, {}).get(date.strftime("%Y-%m-%d"))
+
+    def put(self, currency: str, date: datetime, count: int) -> None:
+        """Record a day's API trade count. Unsettled days are ignored."""
+        if not is_settled(date):
+            return
+        self._counts.setdefault(currency, {})[date.strftime("%Y-%m-%d")] = count
+        self._dirty = True
+
+    def save(self) -> None:
+        """Atomically save cache to file, if anything changed."""
+        if not self._dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(fastjson.dumps(self._counts, indent=True))
+        tmp_path.rename(self.path)
+        self._dirty = False
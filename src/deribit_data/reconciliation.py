@@ -6,19 +6,93 @@ Verifies data completeness by comparing local trade counts with API reported cou
 from __future__ import annotations
 
 import logging
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import httpx
-import pyarrow.parquet as pq
+
+from deribit_data import fastjson
+from deribit_data.fetcher import create_http_client
+from deribit_data.metadata_cache import metadata_cache
+from deribit_data.ratelimit import CreditBucket
+from deribit_data.recon_cache import CACHE_FILENAME, ReconciliationCache
 
 if TYPE_CHECKING:
     from deribit_data.config import DeribitConfig
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of windows a day's API count is split into
+MAX_DAY_SLICES = 24
+
+# Maximum number of consecutive days counted by one paginated API walk
+MAX_SPAN_DAYS = 7
+
+_MS_PER_DAY = 86_400_000
+
+
+def _split_day(date: datetime, slices: int) -> list[tuple[int, int]]:
+    """Split a UTC day into contiguous inclusive millisecond windows.
+
+    Args:
+        date: Any time on the day.
+        slices: Number of windows.
+
+    Returns:
+        List of (start_ms, end_ms) pairs covering the whole day.
+    """
+    start = int(date.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()) * 1000
+    bounds = [start + _MS_PER_DAY * i // slices for i in range(slices + 1)]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(slices)]
+
+
+def _plan_windows(dates: list[datetime], workers: int) -> list[tuple[int, int]]:
+    """Plan the millisecond windows whose API trades are counted in parallel.
+
+    With fewer days than workers, each day is split into up to
+    MAX_DAY_SLICES windows. Otherwise runs of consecutive days are merged
+    into windows of up to MAX_SPAN_DAYS days, so quiet days share pages
+    instead of costing a request each, while keeping about one window per
+    worker.
+
+    Args:
+        dates: Sorted midnight UTC dates.
+        workers: Number of parallel workers.
+
+    Returns:
+        List of inclusive (start_ms, end_ms) windows covering every date.
+    """
+    if not dates:
+        return []
+    if len(dates) < workers:
+        slices = min(MAX_DAY_SLICES, -(-workers // len(dates)))
+        return [window for d in dates for window in _split_day(d, slices)]
+
+    span_days = min(MAX_SPAN_DAYS, -(-len(dates) // workers))
+    windows: list[tuple[int, int]] = []
+    run_start = dates[0]
+    run_days = 1
+    for prev, current in zip(dates, dates[1:], strict=False):
+        if current - prev == timedelta(days=1) and run_days < span_days:
+            run_days += 1
+            continue
+        windows.append(_span_ms(run_start, prev))
+        run_start = current
+        run_days = 1
+    windows.append(_span_ms(run_start, dates[-1]))
+    return windows
+
+
+def _span_ms(first: datetime, last: datetime) -> tuple[int, int]:
+    """Inclusive millisecond window from the start of one day to the end of another."""
+    start = int(first.timestamp()) * 1000
+    return start, int(last.timestamp()) * 1000 + _MS_PER_DAY - 1
+
 
 @dataclass
 class ReconciliationResult:
@@ -85,22 +159,34 @@ class DataReconciler:
     - Detailed mismatch reporting
 
     Note: Uses Deribit public API to get trade counts without downloading full data.
+    API counts for settled days are cached in the catalog and not re-fetched.
     """
 
-    def __init__(self, config: DeribitConfig, catalog_path: Path) -> None:
+    def __init__(
+        self, config: DeribitConfig, catalog_path: Path, client: httpx.Client | None = None
+    ) -> None:
         """Initialize reconciler.
 
         Args:
             config: Deribit configuration.
             catalog_path: Path to local data catalog.
+            client: Shared HTTP client. If omitted, the reconciler creates and
+                owns one.
         """
         self.config = config
         self.catalog_path = catalog_path
-        self._client = httpx.Client(timeout=config.http_timeout)
+        self._owns_client = client is None
+        self._client = client if client is not None else create_http_client(config)
+        delay = config.rate_limit_delay
+        self._bucket = CreditBucket(
+            capacity=config.rate_limit_burst, refill_per_sec=1 / delay if delay > 0 else None
+        )
+        self._cache = ReconciliationCache(catalog_path / CACHE_FILENAME)
 
     def close(self) -> None:
-        """Close HTTP client."""
-        self._client.close()
+        """Close HTTP client, unless it is shared."""
+        if self._owns_client:
+            self._client.close()
 
     def __enter__(self) -> DataReconciler:
         return self
@@ -108,6 +194,32 @@ class DataReconciler:
     def __exit__(self, *args: object) -> None:
         self.close()
 
+    def _get_page(self, url: str, params: dict[str, str | int]) -> dict[str, Any]:
+        """Fetch one API page, sharing the request budget across worker threads.
+
+        A 429 response halves the request rate and is retried with
+        exponential backoff; each success lets the rate recover.
+
+        Raises:
+            httpx.HTTPStatusError: On other error responses.
+            RuntimeError: If still rate limited after max_retries attempts.
+        """
+        for attempt in range(self.config.max_retries):
+            self._bucket.acquire()
+            response = self._client.get(url, params=params)
+            if response.status_code == 429:
+                self._bucket.throttle()
+                wait_time = self.config.backoff_base ** (attempt + 1)
+                logger.warning(f"Rate limited, waiting {wait_time:.1f}s")
+                time.sleep(wait_time)
+                continue
+            response.raise_for_status()
+            self._bucket.recover()
+            data: dict[str, Any] = fastjson.loads(response.content)
+            return data
+
+        raise RuntimeError(f"Max retries ({self.config.max_retries}) exceeded for {url}")
+
     def _get_api_trade_count(
         self,
         currency: str,
@@ -119,10 +231,30 @@ class DataReconciler:
         Uses the trades endpoint with count=1 to get has_more info,
         then estimates based on pagination.
         """
-        url = f"{self.config.base_url}/get_last_trades_by_currency"
-
         start_ts = int(start_date.timestamp() * 1000)
         end_ts = int(end_date.timestamp() * 1000)
+        return self._count_api_trades(currency, start_ts, end_ts)
+
+    def _count_api_trades(self, currency: str, start_ts: int, end_ts: int) -> int | None:
+        """Count trades reported by the API between two millisecond timestamps (inclusive)."""
+        by_day = self._count_api_trades_by_day(currency, start_ts, end_ts)
+        return sum(by_day.values()) if by_day is not None else None
+
+    def _count_api_trades_by_day(
+        self, currency: str, start_ts: int, end_ts: int
+    ) -> Counter[int] | None:
+        """Count API trades between two millisecond timestamps (inclusive) per UTC day.
+
+        The window is paged in full. Counts cannot be derived from the
+        first and last trade_id: ids are allocated per currency across
+        futures, perpetuals and options, so the span of option trade ids
+        overstates the option trade count.
+
+        Returns:
+            Trade counts keyed by day number (milliseconds // ms per day),
+            or None on API error.
+        """
+        url = f"{self.config.base_url}/get_last_trades_by_currency"
 
         params: dict[str, str | int] = {
             "currency": currency,
@@ -135,20 +267,23 @@ class DataReconciler:
         }
 
         try:
-            total_count = 0
+            counts: Counter[int] = Counter()
             page = 0
             max_pages = 1000  # Safety limit for reconciliation
 
             while page < max_pages:
-                response = self._client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
+                data = self._get_page(url, params)
 
                 result = data.get("result", {})
                 trades = result.get("trades", [])
                 has_more = result.get("has_more", False)
 
-                total_count += len(trades)
+                if trades:
+                    first_day = trades[0].get("timestamp", 0) // _MS_PER_DAY
+                    if trades[-1].get("timestamp", 0) // _MS_PER_DAY == first_day:
+                        counts[first_day] += len(trades)
+                    else:
+                        counts.update(t.get("timestamp", 0) // _MS_PER_DAY for t in trades)
 
                 if not has_more or not trades:
                     break
@@ -158,22 +293,21 @@ class DataReconciler:
                 params["start_timestamp"] = last_ts + 1
                 page += 1
 
-            return total_count
+            return counts
 
         except Exception as e:
-            logger.warning(f"API error for {currency} {start_date.date()}: {e}")
+            day = datetime.fromtimestamp(start_ts / 1000, tz=timezone.utc).date()
+            logger.warning(f"API error for {currency} {day}: {e}")
             return None
 
     def _get_local_trade_count(self, currency: str, date: datetime) -> int:
         """Get trade count from local parquet file."""
         file_path = self.catalog_path / currency / "trades" / f"{date.strftime('%Y-%m-%d')}.parquet"
 
-        if not file_path.exists():
-            return 0
-
         try:
-            metadata = pq.read_metadata(file_path)
-            return int(metadata.num_rows)
+            return int(metadata_cache.get(file_path).num_rows)
+        except FileNotFoundError:
+            return 0
         except Exception as e:
             logger.warning(f"Error reading {file_path}: {e}")
             return 0
@@ -199,8 +333,19 @@ class DataReconciler:
         start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_of_day = date.replace(hour=23, minute=59, second=59, microsecond=999999)
 
-        api_count = self._get_api_trade_count(currency, start_of_day, end_of_day)
+        api_count = self._cache.get(currency, date)
+        if api_count is None:
+            api_count = self._get_api_trade_count(currency, start_of_day, end_of_day)
+            if api_count is not None:
+                self._cache.put(currency, date, api_count)
+                self._cache.save()
+
+        return self._build_result(currency, date, local_count, api_count)
 
+    def _build_result(
+        self, currency: str, date: datetime, local_count: int, api_count: int | None
+    ) -> ReconciliationResult:
+        """Compare local and API counts for a date."""
         if api_count is None:
             return ReconciliationResult(
                 currency=currency,
@@ -271,9 +416,46 @@ class DataReconciler:
             total_api_trades=0,
         )
 
-        # Reconcile each date
-        for date in dates:
-            result = self.reconcile_date(currency, date)
+        # Count API trades concurrently (bounded, rate limited) for days not
+        # already cached. Pagination within a window is sequential; see
+        # _plan_windows for how days are split or merged into windows.
+        api_counts: list[int | None] = [self._cache.get(currency, d) for d in dates]
+        uncached = [i for i, count in enumerate(api_counts) if count is None]
+
+        max_workers = self.config.max_concurrent_requests
+        windows = _plan_windows([dates[i] for i in uncached], max_workers)
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, max(len(windows), len(dates))))
+        ) as pool:
+            local_counts = list(pool.map(lambda d: self._get_local_trade_count(currency, d), dates))
+            window_counts = list(
+                pool.map(lambda w: self._count_api_trades_by_day(currency, *w), windows)
+            )
+
+        day_counts: Counter[int] = Counter()
+        failed_days: set[int] = set()
+        for (start_ms, end_ms), counts in zip(windows, window_counts, strict=True):
+            if counts is None:
+                failed_days.update(range(start_ms // _MS_PER_DAY, end_ms // _MS_PER_DAY + 1))
+            else:
+                day_counts.update(counts)
+
+        for i in uncached:
+            day = int(dates[i].timestamp()) * 1000 // _MS_PER_DAY
+            if day in failed_days:
+                api_counts[i] = None
+            else:
+                api_counts[i] = day_counts[day]
+                self._cache.put(currency, dates[i], day_counts[day])
+        self._cache.save()
+
+        results = [
+            self._build_result(currency, d, local, api)
+            for d, local, api in zip(dates, local_counts, api_counts, strict=True)
+        ]
+
+        for date, result in zip(dates, results, strict=True):
             report.results.append(result)
 
             report.total_local_trades += result.local_count
@@ -338,8 +520,8 @@ class DataReconciler:
                 errors=["No parquet files found"],
             )
 
-        start_date = datetime.strptime(files[0].stem, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-        end_date = datetime.strptime(files[-1].stem, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        start_date = datetime.fromisoformat(files[0].stem).replace(tzinfo=timezone.utc)
+        end_date = datetime.fromisoformat(files[-1].stem).replace(tzinfo=timezone.utc)
 
         return self.reconcile_range(
             currency=currency,
@@ -9,7 +9,9 @@ import pyarrow as pa
 # Schema version for compatibility checking
 SCHEMA_VERSION = "1"
 
-# Options trades schema
+# Options trades schema. Numeric columns stay float64: float32 keeps only ~7
+# significant digits, so index prices (43251.37 -> 43251.371) and contract
+# sizes (0.1 -> 0.10000000149) would not round-trip.
 TRADES_SCHEMA_V1 = pa.schema(
     [
         pa.field("timestamp", pa.timestamp("us", tz="UTC"), nullable=False),
@@ -47,6 +49,12 @@ DVOL_SCHEMA_V1 = pa.schema(
     },
 )
 
+# Columns a file must have to be read as trades / DVOL
+_TRADES_REQUIRED_FIELDS = frozenset(
+    {"timestamp", "instrument_id", "underlying", "strike", "price", "amount"}
+)
+_DVOL_REQUIRED_FIELDS = frozenset({"timestamp", "open", "high", "low", "close"})
+
 
 def get_schema_version(schema: pa.Schema) -> str | None:
     """Extract schema version from metadata."""
@@ -57,13 +65,9 @@ def get_schema_version(schema: pa.Schema) -> str | None:
 
 def validate_trades_schema(schema: pa.Schema) -> bool:
     """Check if a schema is compatible with TRADES_SCHEMA_V1."""
-    required_fields = {"timestamp", "instrument_id", "underlying", "strike", "price", "amount"}
-    schema_fields = {field.name for field in schema}
-    return required_fields.issubset(schema_fields)
+    return _TRADES_REQUIRED_FIELDS.issubset(schema.names)
 
 
 def validate_dvol_schema(schema: pa.Schema) -> bool:
     """Check if a schema is compatible with DVOL_SCHEMA_V1."""
-    required_fields = {"timestamp", "open", "high", "low", "close"}
-    schema_fields = {field.name for field in schema}
-    return required_fields.issubset(schema_fields)
+    return _DVOL_REQUIRED_FIELDS.issubset(schema.names)
@@ -5,22 +5,170 @@ Provides crash-safe writes using tmp + rename pattern.
 
 from __future__ import annotations
 
+import itertools
 import logging
-from datetime import datetime, timezone
+import operator
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
-from deribit_data.models import DVOLCandle, OptionTrade
+from deribit_data.metadata_cache import metadata_cache
+from deribit_data.models import DVOLCandle, OptionTrade, TradeBatch
 from deribit_data.schema import DVOL_SCHEMA_V1, TRADES_SCHEMA_V1
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
 
 logger = logging.getLogger(__name__)
 
+# Microseconds per day, for splitting timestamp columns into daily partitions
+_US_PER_DAY = 86_400_000_000
+
+# Maximum threads used to read daily files (load_trades, get_stats)
+MAX_LOAD_WORKERS = 32
+
+# Rows per record batch yielded by iter_trades
+ITER_BATCH_ROWS = 65_536
+
+# Columns written with delta encoding instead of a dictionary. Rows are
+# time-sorted within every file, so timestamp deltas pack into a few bits;
+# this is smaller and decodes several times faster than the dictionary.
+DELTA_ENCODED_COLUMNS = ("timestamp",)
+
+# Low-cardinality string columns that load_trades(read_dictionary=True)
+# returns dictionary encoded, straight from the files' dictionary pages
+DICTIONARY_COLUMNS = ("instrument_id", "underlying", "option_type", "direction")
+
+
+class _NotAppendable(Exception):
+    """New trades overlap a daily file's existing trades."""
+
+
+def _timestamp_range(metadata: pq.FileMetaData) -> tuple[datetime, datetime] | None:
+    """Get the smallest and largest timestamp in a file from its footer statistics.
+
+    Returns:
+        (min, max) timestamps, or None if the file is empty or lacks statistics.
+    """
+    if metadata.num_rows == 0:
+        return None
+    col_idx = metadata.schema.names.index("timestamp")
+    lo: datetime | None = None
+    hi: datetime | None = None
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        if row_group.num_rows == 0:
+            continue
+        stats = row_group.column(col_idx).statistics
+        if stats is None or not stats.has_min_max:
+            return None
+        if lo is None or stats.min < lo:
+            lo = stats.min
+        if hi is None or stats.max > hi:
+            hi = stats.max
+    if lo is None or hi is None:
+        return None
+    return lo, hi
+
+
+def _file_timestamp_range(entry: os.DirEntry[str]) -> tuple[datetime, datetime] | None:
+    """Get a daily trades file's timestamp range from its (cached) footer.
+
+    Files without statistics fall back to the whole day in their name.
+
+    Returns:
+        (min, max) timestamps, or None if the file name is not a date.
+    """
+    ts_range = _timestamp_range(metadata_cache.get(entry.path, entry.stat()))
+    if ts_range is not None:
+        return ts_range
+    return _file_day_range(entry)
+
+
+def _file_day_range(entry: os.DirEntry[str]) -> tuple[datetime, datetime] | None:
+    """Get the whole day a daily trades file is named after, without opening it.
+
+    Returns:
+        (start, end) of the day, or None if the file name is not a date.
+    """
+    try:
+        day = datetime.fromisoformat(entry.name.removesuffix(".parquet"))
+    except ValueError:
+        return None
+    day = day.replace(tzinfo=timezone.utc)
+    return day, day + timedelta(days=1) - timedelta(microseconds=1)
+
+
+def _day_runs(ts_us: np.ndarray) -> Iterator[tuple[int, int, int]]:
+    """Split timestamps (us) into runs of consecutive same-day trades.
+
+    Yields:
+        (days since epoch, start row, end row) per run.
+    """
+    days = ts_us // _US_PER_DAY
+    bounds = [0, *(np.flatnonzero(np.diff(days)) + 1).tolist(), len(ts_us)]
+    for start, end in itertools.pairwise(bounds):
+        yield int(days[start]), start, end
+
+
+def dedup_and_sort(table: pa.Table, key: str, schema: pa.Schema) -> pa.Table:
+    """Drop duplicate keys (keeping the last row) and sort by timestamp.
+
+    Pure Arrow: the last row per key is found with a hash group-by on row
+    numbers, so no column is converted to pandas or Python objects.
+
+    Args:
+        table: Table with a ``timestamp`` column.
+        key: Column whose values must be unique.
+        schema: Schema of the result.
+
+    Returns:
+        Deduplicated table, stably sorted by timestamp.
+    """
+    rows = pa.table({key: table.column(key), "row": np.arange(table.num_rows)})
+    last_rows = rows.group_by(key, use_threads=False).aggregate([("row", "max")])
+    keep = np.sort(last_rows.column("row_max").to_numpy())
+
+    deduped = table.take(keep)
+    order = pc.sort_indices(deduped, sort_keys=[("timestamp", "ascending")])
+    return deduped.take(order).cast(schema)
+
+
+# One attribute getter per schema column, in schema order
+_TRADE_COLUMN_GETTERS = tuple((name, operator.attrgetter(name)) for name in TRADES_SCHEMA_V1.names)
+
+
+def trades_to_table(trades: Sequence[OptionTrade]) -> pa.Table:
+    """Convert trades to PyArrow table.
+
+    Args:
+        trades: Sequence of OptionTrade objects.
+
+    Returns:
+        PyArrow table with trades schema.
+    """
+    if not trades:
+        # Create empty table with correct schema
+        return TRADES_SCHEMA_V1.empty_table()
+
+    # Each column is gathered by map() over a C attrgetter, so the loops run
+    # without Python bytecode per trade. (A single pass yielding a row tuple
+    # per trade is slower: allocating a tuple per trade keeps triggering
+    # cyclic GC passes over the batch.) OptionType/TradeDirection are str enums,
+    # which Arrow stores by value.
+    data: dict[str, Any] = {
+        name: list(map(getter, trades)) for name, getter in _TRADE_COLUMN_GETTERS
+    }
+
+    return pa.table(data, schema=TRADES_SCHEMA_V1)
+
 
 class ParquetStorage:
     """Parquet storage with atomic writes and daily partitioning.
@@ -72,6 +220,24 @@ class ParquetStorage:
         dir_path.mkdir(parents=True, exist_ok=True)
         return dir_path / "dvol.parquet"
 
+    def _write_kwargs(self, schema: pa.Schema) -> dict[str, Any]:
+        """Get Parquet writer options for the configured compression.
+
+        Args:
+            schema: Schema of the file being written.
+        """
+        names = schema.names
+        write_kwargs: dict[str, Any] = {
+            "compression": self.compression,
+            "use_dictionary": [n for n in names if n not in DELTA_ENCODED_COLUMNS],
+            "column_encoding": {
+                n: "DELTA_BINARY_PACKED" for n in DELTA_ENCODED_COLUMNS if n in names
+            },
+        }
+        if self.compression == "zstd":
+            write_kwargs["compression_level"] = self.compression_level
+        return write_kwargs
+
     def _atomic_write(self, table: pa.Table, file_path: Path) -> None:
         """Atomically write Parquet table using tmp + rename.
 
@@ -82,10 +248,7 @@ class ParquetStorage:
         tmp_path = file_path.with_suffix(".parquet.tmp")
 
         # Write to temp file
-        write_kwargs: dict[str, Any] = {"compression": self.compression}
-        if self.compression == "zstd":
-            write_kwargs["compression_level"] = self.compression_level
-        pq.write_table(table, tmp_path, **write_kwargs)
+        pq.write_table(table, tmp_path, **self._write_kwargs(table.schema))
 
         # Atomic rename
         tmp_path.rename(file_path)
@@ -93,35 +256,8 @@ class ParquetStorage:
         logger.debug(f"Wrote {table.num_rows} rows to {file_path}")
 
     def _trades_to_table(self, trades: Sequence[OptionTrade]) -> pa.Table:
-        """Convert trades to PyArrow table.
-
-        Args:
-            trades: Sequence of OptionTrade objects.
-
-        Returns:
-            PyArrow table with trades schema.
-        """
-        if not trades:
-            # Create empty table with correct schema
-            return TRADES_SCHEMA_V1.empty_table()
-
-        data = {
-            "timestamp": [t.timestamp for t in trades],
-            "trade_id": [t.trade_id for t in trades],
-            "instrument_id": [t.instrument_id for t in trades],
-            "underlying": [t.underlying for t in trades],
-            "strike": [t.strike for t in trades],
-            "expiry": [t.expiry for t in trades],
-            "option_type": [t.option_type.value for t in trades],
-            "price": [t.price for t in trades],
-            "iv": [t.iv for t in trades],
-            "amount": [t.amount for t in trades],
-            "direction": [t.direction.value for t in trades],
-            "index_price": [t.index_price for t in trades],
-            "mark_price": [t.mark_price for t in trades],
-        }
-
-        return pa.table(data, schema=TRADES_SCHEMA_V1)
+        """Convert trades to PyArrow table (see trades_to_table)."""
+        return trades_to_table(trades)
 
     def _dvol_to_table(self, candles: Sequence[DVOLCandle]) -> pa.Table:
         """Convert DVOL candles to PyArrow table.
@@ -147,7 +283,7 @@ class ParquetStorage:
 
     def save_trades(
         self,
-        trades: Sequence[OptionTrade],
+        trades: Sequence[OptionTrade] | pa.Table,
         currency: str,
     ) -> list[Path]:
         """Save trades with daily partitioning.
@@ -155,48 +291,148 @@ class ParquetStorage:
         Partitions trades by date and writes each partition atomically.
 
         Args:
-            trades: Trades to save.
+            trades: Trades to save, as models or as a table with
+                TRADES_SCHEMA_V1 (e.g. from the fetcher's batch parser),
+                which is written without building any models.
             currency: Currency (BTC, ETH).
 
         Returns:
             List of file paths written.
         """
+        if isinstance(trades, pa.Table):
+            return self._save_trades_table(trades, currency)
         if not trades:
             return []
 
-        # Group trades by date
-        by_date: dict[str, list[OptionTrade]] = {}
-        for trade in trades:
-            date_key = trade.timestamp.strftime("%Y-%m-%d")
-            if date_key not in by_date:
-                by_date[date_key] = []
-            by_date[date_key].append(trade)
-
-        # Write each partition
-        written_files: list[Path] = []
-        for date_str, date_trades in sorted(by_date.items()):
-            date = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        # Write each day's run of trades as it streams past. Fetched trades
+        # arrive in timestamp order, so each day is normally one run; a day
+        # that reappears later is simply merged into its file again.
+        written_files: set[Path] = set()
+        for day, day_trades in itertools.groupby(trades, key=lambda t: t.timestamp.date()):
+            date = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
             file_path = self._get_trade_file_path(currency, date)
 
-            # If file exists, merge with existing data
-            if file_path.exists():
-                existing_table = pq.read_table(file_path)
-                new_table = self._trades_to_table(date_trades)
-                merged = pa.concat_tables([existing_table, new_table])
-
-                # Deduplicate by trade_id
-                # Convert to pandas for dedup, then back to arrow
-                df = merged.to_pandas()
-                df = df.drop_duplicates(subset=["trade_id"], keep="last")
-                df = df.sort_values("timestamp")
-                merged = pa.Table.from_pandas(df, schema=TRADES_SCHEMA_V1, preserve_index=False)
-            else:
-                merged = self._trades_to_table(date_trades)
+            new_table = self._trades_to_table(list(day_trades))
+            self._write_day(new_table, file_path)
+            written_files.add(file_path)
+
+        return sorted(written_files)
+
+    def _save_trades_table(self, table: pa.Table, currency: str) -> list[Path]:
+        """Save a trades table, one daily file per run of same-day rows."""
+        if table.num_rows == 0:
+            return []
+        if not table.schema.equals(TRADES_SCHEMA_V1):
+            table = table.cast(TRADES_SCHEMA_V1)
+
+        written_files: set[Path] = set()
+        ts_us = table.column("timestamp").cast(pa.int64()).to_numpy()
+        for day, start, end in _day_runs(ts_us):
+            date = datetime.fromtimestamp(day * 86400, tz=timezone.utc)
+            file_path = self._get_trade_file_path(currency, date)
+            self._write_day(table.slice(start, end - start), file_path)
+            written_files.add(file_path)
 
-            self._atomic_write(merged, file_path)
-            written_files.append(file_path)
+        return sorted(written_files)
 
-        return written_files
+    def _write_day(self, new_table: pa.Table, file_path: Path) -> None:
+        """Write trades into a daily file, combining them with any existing rows.
+
+        Trades that all come after the file's last trade are appended (see
+        _append_to_existing); anything else goes through a full merge.
+        """
+        if not (file_path.exists() and self._append_to_existing(new_table, file_path)):
+            self._atomic_write(self._merge_with_existing(new_table, file_path), file_path)
+
+    def _append_to_existing(self, new_table: pa.Table, file_path: Path) -> bool:
+        """Rewrite a daily file as its existing row groups followed by new trades.
+
+        Only valid when every new trade is later than the file's last trade
+        (per the footer's timestamp statistics) and no trade_id repeats; the
+        result then equals a full merge, without concatenating, sorting or
+        deduplicating the whole day in memory. Existing rows are streamed
+        one row group at a time.
+
+        Returns:
+            True if the file was rewritten, False if a full merge is needed.
+        """
+        metadata = metadata_cache.get(file_path)
+        ts_range = _timestamp_range(metadata)
+        new_table = dedup_and_sort(new_table, "trade_id", TRADES_SCHEMA_V1)
+        if ts_range is None or new_table.num_rows == 0:
+            return False
+        if new_table.column("timestamp")[0].as_py() <= ts_range[1]:
+            return False
+
+        new_ids = new_table.column("trade_id")
+        tmp_path = file_path.with_suffix(".parquet.tmp")
+        parquet_file = pq.ParquetFile(file_path, metadata=metadata, memory_map=True)
+        try:
+            with pq.ParquetWriter(
+                tmp_path, TRADES_SCHEMA_V1, **self._write_kwargs(TRADES_SCHEMA_V1)
+            ) as writer:
+                for i in range(parquet_file.num_row_groups):
+                    row_group = parquet_file.read_row_group(i).cast(TRADES_SCHEMA_V1)
+                    if pc.any(pc.is_in(row_group.column("trade_id"), value_set=new_ids)).as_py():
+                        raise _NotAppendable
+                    writer.write_table(row_group)
+                writer.write_table(new_table)
+        except _NotAppendable:
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+        tmp_path.rename(file_path)
+        logger.debug(f"Appended {new_table.num_rows} rows to {file_path}")
+        return True
+
+    def _merge_with_existing(self, new_table: pa.Table, file_path: Path) -> pa.Table:
+        """Merge new trades into an existing daily file's contents, if any.
+
+        Deduplicates by trade_id (keeping the newest) and sorts by timestamp.
+        Stored files are already unique and sorted, so only the new trades
+        are deduplicated; stored rows they replace are dropped with a hash
+        probe, and the result is only re-sorted if the new trades start
+        before the last kept stored trade.
+        """
+        if not file_path.exists():
+            return new_table
+
+        new_table = dedup_and_sort(new_table, "trade_id", TRADES_SCHEMA_V1)
+        existing_table = pq.read_table(file_path, memory_map=True).cast(TRADES_SCHEMA_V1)
+        replaced = pc.is_in(existing_table.column("trade_id"), value_set=new_table["trade_id"])
+        if pc.any(replaced).as_py():
+            existing_table = existing_table.filter(pc.invert(replaced))
+
+        merged = pa.concat_tables([existing_table, new_table])
+        if existing_table.num_rows == 0 or new_table.num_rows == 0:
+            return merged
+        first_new = pc.min(new_table.column("timestamp")).as_py()
+        if first_new >= pc.max(existing_table.column("timestamp")).as_py():
+            return merged
+        return merged.take(pc.sort_indices(merged, sort_keys=[("timestamp", "ascending")]))
+
+    def open_trade_writer(self, currency: str) -> TradeFileWriter:
+        """Open a streaming writer for ascending trade batches.
+
+        Args:
+            currency: Currency (BTC, ETH).
+
+        Returns:
+            TradeFileWriter; use as a context manager.
+        """
+        return TradeFileWriter(self, currency)
+
+    def _merge_dvol_with_existing(self, new_table: pa.Table, file_path: Path) -> pa.Table:
+        """Merge new candles with the existing DVOL file's contents, if any.
+
+        Deduplicates by timestamp (keeping the newest) and sorts by timestamp.
+        """
+        if file_path.exists():
+            merged = pa.concat_tables([pq.read_table(file_path, memory_map=True), new_table])
+        else:
+            merged = new_table
+
+        return dedup_and_sort(merged, "timestamp", DVOL_SCHEMA_V1)
 
     def save_dvol(self, candles: Sequence[DVOLCandle], currency: str) -> Path:
         """Save DVOL candles.
@@ -213,26 +449,58 @@ class ParquetStorage:
         file_path = self._get_dvol_file_path(currency)
 
         if file_path.exists():
-            existing_table = pq.read_table(file_path)
-            new_table = self._dvol_to_table(candles)
-            merged = pa.concat_tables([existing_table, new_table])
-
-            # Deduplicate by timestamp
-            df = merged.to_pandas()
-            df = df.drop_duplicates(subset=["timestamp"], keep="last")
-            df = df.sort_values("timestamp")
-            merged = pa.Table.from_pandas(df, schema=DVOL_SCHEMA_V1, preserve_index=False)
+            merged = self._merge_dvol_with_existing(self._dvol_to_table(candles), file_path)
         else:
             merged = self._dvol_to_table(candles)
 
         self._atomic_write(merged, file_path)
         return file_path
 
+    def save_dvol_stream(
+        self, chunks: Iterable[Sequence[DVOLCandle]], currency: str
+    ) -> tuple[Path | None, int]:
+        """Save DVOL candles from an iterable of chunks, e.g. fetcher.iter_dvol().
+
+        Chunks are appended to a partial file as they arrive, so candles are
+        held as Python objects only one chunk at a time. The result is then
+        sorted, deduplicated and merged with existing data like save_dvol().
+
+        Args:
+            chunks: DVOL candle chunks, in any order.
+            currency: Currency (BTC, ETH).
+
+        Returns:
+            Tuple of (file path written or None if no candles, candle count).
+        """
+        file_path = self._get_dvol_file_path(currency)
+        partial_path = file_path.with_suffix(".parquet.partial")
+
+        count = 0
+        try:
+            with pq.ParquetWriter(
+                partial_path, DVOL_SCHEMA_V1, **self._write_kwargs(DVOL_SCHEMA_V1)
+            ) as writer:
+                for chunk in chunks:
+                    if chunk:
+                        writer.write_table(self._dvol_to_table(chunk))
+                        count += len(chunk)
+
+            if count:
+                merged = self._merge_dvol_with_existing(
+                    pq.read_table(partial_path, memory_map=True), file_path
+                )
+                self._atomic_write(merged, file_path)
+        finally:
+            partial_path.unlink(missing_ok=True)
+
+        return (file_path if count else None), count
+
     def load_trades(
         self,
         currency: str,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
+        read_dictionary: bool = False,
     ) -> pa.Table:
         """Load trades for a currency and date range.
 
@@ -240,37 +508,111 @@ class ParquetStorage:
             currency: Currency (BTC, ETH).
             start_date: Start date (inclusive).
             end_date: End date (inclusive).
+            read_dictionary: Return DICTIONARY_COLUMNS as dictionary arrays
+                (int32 indices into each file's distinct strings) instead
+                of plain strings. Several times faster to load and smaller
+                in memory; filters compare integer indices.
 
         Returns:
             PyArrow table with trades.
         """
-        trades_dir = self._get_trades_dir(currency)
-        if not trades_dir.exists():
-            return TRADES_SCHEMA_V1.empty_table()
-
-        # Find matching files
-        files = sorted(trades_dir.glob("*.parquet"))
-
-        if start_date or end_date:
-            filtered_files = []
-            for f in files:
-                try:
-                    file_date = datetime.strptime(f.stem, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-                    if start_date and file_date < start_date:
-                        continue
-                    if end_date and file_date > end_date:
-                        continue
-                    filtered_files.append(f)
-                except ValueError:
-                    continue
-            files = filtered_files
+        files = self._select_files(currency, start_date, end_date)
+        dictionary_columns = list(DICTIONARY_COLUMNS) if read_dictionary else None
 
         if not files:
-            return TRADES_SCHEMA_V1.empty_table()
+            schema = TRADES_SCHEMA_V1
+            for name in dictionary_columns or ():
+                index = schema.get_field_index(name)
+                field = schema.field(index).with_type(pa.dictionary(pa.int32(), pa.string()))
+                schema = schema.set(index, field)
+            return schema.empty_table()
+
+        # Read files concurrently (one thread each, overlapping I/O with
+        # decompression), reusing cached footers. Files are memory-mapped, so
+        # warm reads come straight from the page cache without a read()
+        # copy. map() keeps date order.
+        def read(entry: os.DirEntry[str]) -> pa.Table:
+            metadata = metadata_cache.get(entry.path, entry.stat())
+            parquet_file = pq.ParquetFile(
+                entry.path,
+                metadata=metadata,
+                memory_map=True,
+                read_dictionary=dictionary_columns,
+            )
+            return parquet_file.read(use_threads=False)
+
+        if len(files) == 1:
+            return read(files[0])
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(files))) as pool:
+            return pa.concat_tables(pool.map(read, files))
+
+    def _select_files(
+        self,
+        currency: str,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> list[os.DirEntry[str]]:
+        """List a currency's daily files that may hold trades in a date range.
+
+        File names (days) decide for most files; only days cut by
+        start_date/end_date are pruned by the timestamp range in their
+        (cached) footers.
+        """
+        files = list(self.iter_files(currency))
+        if not (start_date or end_date):
+            return files
+
+        def overlaps(ts_range: tuple[datetime, datetime] | None) -> bool:
+            if ts_range is None:
+                return False
+            if start_date and ts_range[1] < start_date:
+                return False
+            return not (end_date and ts_range[0] > end_date)
+
+        filtered_files = []
+        for f in files:
+            day_range = _file_day_range(f)
+            if day_range is not None and not overlaps(day_range):
+                continue
+            inside = (
+                day_range is not None
+                and (start_date is None or day_range[0] >= start_date)
+                and (end_date is None or day_range[1] <= end_date)
+            )
+            if inside or overlaps(_file_timestamp_range(f)):
+                filtered_files.append(f)
+        return filtered_files
+
+    def iter_trades(
+        self,
+        currency: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        columns: Sequence[str] | None = None,
+        batch_size: int = ITER_BATCH_ROWS,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream trades for a currency and date range as record batches.
 
-        # Read and concatenate
-        tables = [pq.read_table(f) for f in files]
-        return pa.concat_tables(tables)
+        Selects the same files as load_trades() but reads them one after
+        another, so memory stays bounded by a single batch regardless of
+        the size of the range.
+
+        Args:
+            currency: Currency (BTC, ETH).
+            start_date: Start date (inclusive).
+            end_date: End date (inclusive).
+            columns: Columns to read (default: all).
+            batch_size: Maximum rows per batch.
+
+        Yields:
+            Record batches in date order.
+        """
+        for entry in self._select_files(currency, start_date, end_date):
+            metadata = metadata_cache.get(entry.path, entry.stat())
+            parquet_file = pq.ParquetFile(entry.path, metadata=metadata, memory_map=True)
+            yield from parquet_file.iter_batches(
+                batch_size=batch_size, columns=columns, use_threads=False
+            )
 
     def load_dvol(self, currency: str) -> pa.Table:
         """Load DVOL data for a currency.
@@ -284,7 +626,7 @@ class ParquetStorage:
         file_path = self._get_dvol_file_path(currency)
         if not file_path.exists():
             return DVOL_SCHEMA_V1.empty_table()
-        return pq.read_table(file_path)
+        return pq.read_table(file_path, memory_map=True)
 
     def get_last_trade_timestamp(self, currency: str) -> datetime | None:
         """Get timestamp of last trade for a currency.
@@ -297,21 +639,38 @@ class ParquetStorage:
         Returns:
             Last trade timestamp or None if no data.
         """
-        trades_dir = self._get_trades_dir(currency)
-        if not trades_dir.exists():
-            return None
-
-        files = sorted(trades_dir.glob("*.parquet"), reverse=True)
+        files = list(self.iter_files(currency))
         if not files:
             return None
 
-        # Read last file and get max timestamp
-        table = pq.read_table(files[0])
-        if table.num_rows == 0:
-            return None
+        # Max timestamp of the last file, from its footer when possible
+        ts_range = _timestamp_range(metadata_cache.get(files[-1].path, files[-1].stat()))
+        if ts_range is not None:
+            return ts_range[1]
+
+        table = pq.read_table(files[-1].path, columns=["timestamp"], memory_map=True)
+        last_ts: datetime | None = pc.max(table.column("timestamp")).as_py()
+        return last_ts
 
-        timestamps: list[datetime] = table.column("timestamp").to_pylist()
-        return max(timestamps)
+    def iter_files(self, currency: str) -> Iterator[os.DirEntry[str]]:
+        """Iterate over a currency's daily trade files in date order.
+
+        Uses os.scandir, whose entries cache stat results, instead of
+        Path.glob.
+
+        Args:
+            currency: Currency (BTC, ETH).
+
+        Yields:
+            Directory entries of ``*.parquet`` files, sorted by name.
+        """
+        try:
+            with os.scandir(self._get_trades_dir(currency)) as it:
+                entries = [e for e in it if e.name.endswith(".parquet") and e.is_file()]
+        except FileNotFoundError:
+            return
+        entries.sort(key=lambda e: e.name)
+        yield from entries
 
     def get_stats(self, currency: str) -> dict[str, Any]:
         """Get statistics for a currency's data.
@@ -322,29 +681,27 @@ class ParquetStorage:
         Returns:
             Dict with row_count, file_count, date_range, size_bytes.
         """
-        trades_dir = self._get_trades_dir(currency)
-        if not trades_dir.exists():
-            return {
-                "row_count": 0,
-                "file_count": 0,
-                "date_range": None,
-                "size_bytes": 0,
-            }
-
-        files = sorted(trades_dir.glob("*.parquet"))
+        # Single directory pass; sizes come from the scandir entries. Cold
+        # footers are read concurrently, overlapping their I/O.
+        files = list(self.iter_files(currency))
+
+        def rows_and_size(entry: os.DirEntry[str]) -> tuple[int, int]:
+            stat = entry.stat()
+            return metadata_cache.get(entry.path, stat).num_rows, stat.st_size
+
         total_rows = 0
         total_size = 0
-
-        for f in files:
-            metadata = pq.read_metadata(f)
-            total_rows += metadata.num_rows
-            total_size += f.stat().st_size
+        if files:
+            with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(files))) as pool:
+                for rows, size in pool.map(rows_and_size, files):
+                    total_rows += rows
+                    total_size += size
 
         date_range = None
         if files:
             try:
-                start = datetime.strptime(files[0].stem, "%Y-%m-%d")
-                end = datetime.strptime(files[-1].stem, "%Y-%m-%d")
+                start = datetime.fromisoformat(files[0].name.removesuffix(".parquet"))
+                end = datetime.fromisoformat(files[-1].name.removesuffix(".parquet"))
                 date_range = (start, end)
             except ValueError:
                 pass
@@ -355,3 +712,147 @@ class ParquetStorage:
             "date_range": date_range,
             "size_bytes": total_size,
         }
+
+
+class TradeFileWriter:
+    """Streams ascending trade batches into daily Parquet files.
+
+    Keeps one ParquetWriter open for the current day and appends each batch as
+    a row group, instead of rewriting the whole daily file per batch. A day is
+    finalized when a later day starts or on close(): the partial file is
+    renamed into place, or merged (with dedup) if the daily file already
+    exists, e.g. when resuming.
+
+    Data of the day still open lives only in a ``.parquet.partial`` file, so
+    ``committed_ms`` reports the last trade timestamp that is safely on disk;
+    resume checkpoints must not go beyond it.
+    """
+
+    def __init__(self, storage: ParquetStorage, currency: str) -> None:
+        """Initialize writer.
+
+        Args:
+            storage: Storage providing paths and write options.
+            currency: Currency (BTC, ETH).
+        """
+        self._storage = storage
+        self._currency = currency
+        self.committed_ms: int | None = None
+
+        self._date_key: str | None = None
+        self._file_path: Path | None = None
+        self._partial_path: Path | None = None
+        self._writer: pq.ParquetWriter | None = None
+        self._open_last_ms: int | None = None
+
+        # Partial files left by a crashed run were never committed
+        trades_dir = storage._get_trades_dir(currency)
+        if trades_dir.exists():
+            for stale in trades_dir.glob("*.parquet.partial"):
+                logger.info(f"Removing stale partial file: {stale}")
+                stale.unlink()
+
+    def __enter__(self) -> TradeFileWriter:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def write(self, trades: Sequence[OptionTrade]) -> list[Path]:
+        """Append trades (ascending by timestamp) to their daily files.
+
+        Args:
+            trades: Trades to write.
+
+        Returns:
+            Daily files finalized by this call.
+        """
+        if not trades:
+            return []
+
+        # Fetcher already knows the last timestamp in milliseconds
+        last_ms = trades.last_timestamp_ms if isinstance(trades, TradeBatch) else None
+        return self.write_table(trades_to_table(trades), last_ms)
+
+    def write_table(self, table: pa.Table, last_timestamp_ms: int | None = None) -> list[Path]:
+        """Append a trades table (ascending by timestamp) to its daily files.
+
+        Args:
+            table: Trades with TRADES_SCHEMA_V1.
+            last_timestamp_ms: Timestamp of the table's last trade, if known.
+
+        Returns:
+            Daily files finalized by this call.
+        """
+        finalized: list[Path] = []
+        n = table.num_rows
+        if n == 0:
+            return finalized
+
+        # Split into consecutive same-day runs (input is ascending)
+        ts_us = table.column("timestamp").cast(pa.int64()).to_numpy()
+
+        for day, start, end in _day_runs(ts_us):
+            run = table.slice(start, end - start)
+            date = datetime.fromtimestamp(day * 86400, tz=timezone.utc)
+            date_key = date.strftime("%Y-%m-%d")
+
+            if self._date_key is not None and date_key < self._date_key:
+                # Out of order: fall back to a merge write for that day
+                file_path = self._storage._get_trade_file_path(self._currency, date)
+                self._storage._write_day(run, file_path)
+                finalized.append(file_path)
+                continue
+
+            writer = self._writer
+            if date_key != self._date_key or writer is None:
+                finalized.extend(self._finalize())
+                writer = self._open(date_key)
+
+            writer.write_table(run)
+            if end == n and last_timestamp_ms is not None:
+                self._open_last_ms = last_timestamp_ms
+            else:
+                self._open_last_ms = int(ts_us[end - 1]) // 1000
+
+        return finalized
+
+    def close(self) -> list[Path]:
+        """Finalize the day currently open.
+
+        Returns:
+            Daily files finalized by this call.
+        """
+        return self._finalize()
+
+    def _open(self, date_key: str) -> pq.ParquetWriter:
+        """Start a partial file for a new day."""
+        date = datetime.fromisoformat(date_key).replace(tzinfo=timezone.utc)
+        self._date_key = date_key
+        self._file_path = self._storage._get_trade_file_path(self._currency, date)
+        self._partial_path = self._file_path.with_suffix(".parquet.partial")
+        self._writer = pq.ParquetWriter(
+            self._partial_path, TRADES_SCHEMA_V1, **self._storage._write_kwargs(TRADES_SCHEMA_V1)
+        )
+        return self._writer
+
+    def _finalize(self) -> list[Path]:
+        """Close the open day's writer and move its file into place."""
+        if self._writer is None or self._file_path is None or self._partial_path is None:
+            return []
+
+        self._writer.close()
+        self._writer = None
+
+        if self._file_path.exists():
+            partial = pq.read_table(self._partial_path, memory_map=True)
+            self._storage._write_day(partial, self._file_path)
+            self._partial_path.unlink()
+        else:
+            os.replace(self._partial_path, self._file_path)
+
+        if self._open_last_ms is not None:
+            self.committed_ms = self._open_last_ms
+
+        logger.debug(f"Finalized {self._file_path}")
+        return [self._file_path]
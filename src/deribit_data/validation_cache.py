@@ -0,0 +1,113 @@
+"""On-disk cache of per-file validation results.
+
+A daily file that has not changed since it was last validated yields the
+same issues, so repeated validations only need to read new or rewritten
+files. Entries are keyed by file modification time and size, and the
+whole cache is dropped when the validation thresholds change.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from deribit_data import fastjson
+
+logger = logging.getLogger(__name__)
+
+# Cache file name inside each currency directory
+CACHE_FILENAME = "validation_cache.json"
+
+
+def file_key(stat: os.stat_result) -> list[int]:
+    """Identify a file version by modification time and size."""
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class ValidationCache:
+    """Validation results per daily file of one currency, persisted as JSON.
+
+    Cache format:
+    {
+        "config": "<validation thresholds>",
+        "files": {"2024-01-01.parquet": {"key": [mtime_ns, size], "rows": 15000, "issues": []}},
+        "cross": {"key": [["2024-01-01.parquet", mtime_ns, size]], "issues": []}
+    }
+    """
+
+    def __init__(self, path: Path, config: str) -> None:
+        """Initialize cache.
+
+        Args:
+            path: Path to cache file.
+            config: Serialized validation thresholds; a cache written with
+                different thresholds is discarded.
+        """
+        self.path = path
+        self.config = config
+        self._files: dict[str, dict[str, Any]] = {}
+        self._cross: dict[str, Any] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load cache from file if it exists and matches the thresholds."""
+        if not self.path.exists():
+            return
+
+        try:
+            data = fastjson.loads(self.path.read_bytes())
+            if data.get("config") != self.config:
+                return
+            self._files = dict(data.get("files", {}))
+            self._cross = dict(data.get("cross", {}))
+        except (fastjson.JSONDecodeError, AttributeError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to load validation cache: {e}")
+
+    def get_file(self, name: str, key: list[int]) -> tuple[int, list[dict[str, Any]]] | None:
+        """Get a file's cached row count and issues, if the file is unchanged."""
+        entry = self._files.get(name)
+        if entry is None or entry.get("key") != key:
+            return None
+        return entry["rows"], entry["issues"]
+
+    def put_file(self, name: str, key: list[int], rows: int, issues: list[dict[str, Any]]) -> None:
+        """Record a file's row count and issues."""
+        entry = {"key": key, "rows": rows, "issues": issues}
+        if self._files.get(name) != entry:
+            self._files[name] = entry
+            self._dirty = True
+
+    def get_cross(self, key: list[list[Any]]) -> list[dict[str, Any]] | None:
+        """Get cached cross-file issues, if no file was added, removed or changed."""
+        if self._cross.get("key") != key:
+            return None
+        issues: list[dict[str, Any]] = self._cross["issues"]
+        return issues
+
+    def put_cross(self, key: list[list[Any]], issues: list[dict[str, Any]]) -> None:
+        """Record cross-file issues for the current set of files."""
+        entry = {"key": key, "issues": issues}
+        if self._cross != entry:
+            self._cross = entry
+            self._dirty = True
+
+    def prune(self, names: set[str]) -> None:
+        """Drop entries for files that no longer exist."""
+        for name in self._files.keys() - names:
+            del self._files[name]
+            self._dirty = True
+
+    def save(self) -> None:
+        """Atomically save cache to file, if anything changed."""
+        if not self._dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".json.tmp")
+        data = {"config": self.config, "files": self._files, "cross": self._cross}
+        tmp_path.write_bytes(fastjson.dumps(data))
+        tmp_path.rename(self.path)
+        self._dirty = False
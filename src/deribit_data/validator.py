@@ -6,19 +6,39 @@ Validates data quality and integrity with configurable thresholds.
 from __future__ import annotations
 
 import logging
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
+from deribit_data.metadata_cache import metadata_cache
+from deribit_data.storage import MAX_LOAD_WORKERS
+from deribit_data.validation_cache import CACHE_FILENAME, ValidationCache, file_key
+
 if TYPE_CHECKING:
     from deribit_data.config import ValidationConfig
 
 logger = logging.getLogger(__name__)
 
+# The only columns validate_trades() reads; the rest of each file is skipped
+VALIDATED_COLUMNS = ("trade_id", "timestamp", "iv")
+
+# Rows per batch when streaming trade IDs for the cross-file check
+ID_BATCH_ROWS = 65_536
+
+# 64-bit FNV-1a parameters for trade ID fingerprints
+_FNV_OFFSET = np.uint64(0xCBF29CE484222325)
+_FNV_PRIME = np.uint64(0x100000001B3)
+
 
 class Severity(str, Enum):
     """Issue severity level."""
@@ -30,7 +50,7 @@ class Severity(str, Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """Single validation issue."""
 
@@ -49,13 +69,106 @@ class ValidationResult:
     issues: list[ValidationIssue]
     stats: dict[str, Any]
 
+    @cached_property
+    def severity_counts(self) -> Counter[Severity]:
+        """Number of issues per severity (counted once; issues is final)."""
+        return Counter(i.severity for i in self.issues)
+
     @property
     def critical_count(self) -> int:
-        return sum(1 for i in self.issues if i.severity == Severity.CRITICAL)
+        return self.severity_counts[Severity.CRITICAL]
 
     @property
     def high_count(self) -> int:
-        return sum(1 for i in self.issues if i.severity == Severity.HIGH)
+        return self.severity_counts[Severity.HIGH]
+
+
+def _issue_to_dict(issue: ValidationIssue) -> dict[str, Any]:
+    """Serialize an issue for the validation cache (file paths by name)."""
+    return {
+        "severity": issue.severity.value,
+        "category": issue.category,
+        "message": issue.message,
+        "file_path": Path(issue.file_path).name if issue.file_path else None,
+        "details": issue.details,
+    }
+
+
+def _issue_from_dict(data: dict[str, Any], trades_dir: Path) -> ValidationIssue:
+    """Restore a cached issue, resolving its file name against trades_dir."""
+    return ValidationIssue(
+        severity=Severity(data["severity"]),
+        category=data["category"],
+        message=data["message"],
+        file_path=str(trades_dir / data["file_path"]) if data["file_path"] else None,
+        details=data["details"],
+    )
+
+
+def _fingerprint_ids(ids: pa.Array) -> np.ndarray:
+    """Hash trade IDs to 64-bit FNV-1a fingerprints (nulls map to 0).
+
+    Vectorized over the Arrow string buffers: one numpy pass per byte
+    position, so the cost is O(rows * longest ID) without Python objects.
+    """
+    ids = ids.cast(pa.string())
+    offsets = np.frombuffer(ids.buffers()[1], dtype=np.int32)[
+        ids.offset : ids.offset + len(ids) + 1
+    ]
+    data_buffer = ids.buffers()[2]
+    data = np.frombuffer(data_buffer, dtype=np.uint8) if data_buffer else np.empty(0, np.uint8)
+
+    starts = offsets[:-1].astype(np.int64)
+    lengths = np.diff(offsets)
+    prints = np.full(len(ids), _FNV_OFFSET, dtype=np.uint64)
+    for position in range(int(lengths.max(initial=0))):
+        rows = np.flatnonzero(lengths > position)
+        prints[rows] = (prints[rows] ^ data[starts[rows] + position]) * _FNV_PRIME
+    if ids.null_count:
+        prints[ids.is_null().to_numpy(zero_copy_only=False)] = 0
+    return prints
+
+
+def _file_days(files: list[Path]) -> np.ndarray:
+    """Parse daily file names (YYYY-MM-DD) into datetime64[D], NaT where invalid."""
+    stems = np.array([f.stem for f in files])
+    try:
+        days = stems.astype("datetime64[D]")
+    except ValueError:
+        days = np.array([_parse_day(stem) for stem in stems], dtype="datetime64[D]")
+    # Reject names numpy accepts but that are not canonical dates ("2024", ...)
+    days[np.datetime_as_string(days) != stems] = np.datetime64("NaT")
+    return days
+
+
+def _parse_day(stem: str) -> np.datetime64:
+    """Parse one file name as a day, NaT if it is not a date."""
+    try:
+        return np.datetime64(stem, "D")
+    except ValueError:
+        return np.datetime64("NaT")
+
+
+def _count_repeats(file_uniques: list[tuple[Path, pa.Array]]) -> np.ndarray:
+    """Count, per file, distinct IDs that already appeared in an earlier file.
+
+    All files' distinct IDs are sorted once by (trade_id, file order); an
+    ID equal to its predecessor is a repeat from an earlier file.
+    """
+    ids = pa.chunked_array([u.cast(pa.string()) for _, u in file_uniques], type=pa.string())
+    file_index = np.repeat(np.arange(len(file_uniques)), [len(u) for _, u in file_uniques])
+    order = pc.sort_indices(
+        pa.table({"id": ids, "file": file_index}),
+        sort_keys=[("id", "ascending"), ("file", "ascending")],
+    )
+    sorted_ids = ids.take(order).combine_chunks()
+    current, previous = sorted_ids[1:], sorted_ids[:-1]
+    repeated = pc.or_(  # A missing ID repeats a missing ID
+        pc.equal(current, previous).fill_null(False),
+        pc.and_(pc.is_null(current), pc.is_null(previous)),
+    )
+    repeat_files = file_index[order.to_numpy()][1:][repeated.to_numpy(zero_copy_only=False)]
+    return np.bincount(repeat_files, minlength=len(file_uniques))
 
 
 class DataValidator:
@@ -64,18 +177,28 @@ class DataValidator:
     All thresholds are configurable via ValidationConfig.
     """
 
-    def __init__(self, config: ValidationConfig) -> None:
+    def __init__(self, config: ValidationConfig, use_cache: bool = True) -> None:
         """Initialize validator.
 
         Args:
             config: Validation configuration with thresholds.
+            use_cache: Reuse results for unchanged files from the currency's
+                validation cache, and update it.
         """
         self.config = config
+        self.use_cache = use_cache
+        # Gap severities, checked in order (most severe first)
+        self._gap_thresholds = (
+            (config.gap_critical_days, Severity.CRITICAL),
+            (config.gap_high_days, Severity.HIGH),
+            (config.gap_medium_days, Severity.MEDIUM),
+        )
 
     def validate_trades(
         self,
         catalog_path: Path,
         currency: str,
+        fail_fast: bool = False,
     ) -> ValidationResult:
         """Validate trades data for a currency.
 
@@ -87,9 +210,16 @@ class DataValidator:
         - Duplicate detection
         - Completeness
 
+        Files unchanged since the last run (same mtime and size) are not
+        re-validated; their results come from the validation cache.
+
         Args:
             catalog_path: Path to data catalog.
             currency: Currency to validate (BTC, ETH).
+            fail_fast: Return as soon as the result is known to fail,
+                with only the critical issues found so far. Critical gaps
+                and completeness are checked from file names before any
+                file is read.
 
         Returns:
             ValidationResult with issues and stats.
@@ -129,93 +259,263 @@ class DataValidator:
 
         stats["total_files"] = len(files)
 
-        # Track for gap detection
-        prev_date: datetime | None = None
-        all_trade_ids: set[str] = set()
+        days = _file_days(files)
+        if not np.isnat(days[0]) and not np.isnat(days[-1]):
+            stats["date_range"] = (str(days[0]), str(days[-1]))
+
+        if fail_fast:
+            critical = self._critical_from_names(files, days, stats)
+            if critical:
+                return ValidationResult(passed=False, issues=critical, stats=stats)
+
+        cache = ValidationCache(
+            catalog_path / currency / CACHE_FILENAME, self.config.model_dump_json()
+        )
+        keys = [file_key(file_path.stat()) for file_path in files]
+        cross_key = [[f.name, *key] for f, key in zip(files, keys, strict=True)]
+        cached_cross = cache.get_cross(cross_key) if self.use_cache else None
+
+        # Track for gap detection and cross-file duplicates
+        prev_day: np.datetime64 | None = None
+        file_prints: list[tuple[Path, np.ndarray]] = []
+        read_errors = False
+
+        # Files are read and checked concurrently (Arrow releases the GIL while
+        # decoding); results are consumed in date order below
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(files))) as pool:
+            futures = [
+                pool.submit(
+                    self._read_and_validate,
+                    file_path,
+                    cache.get_file(file_path.name, key) if self.use_cache else None,
+                    cached_cross is None,
+                )
+                for file_path, key in zip(files, keys, strict=True)
+            ]
+
+            for file_path, key, day, future in zip(files, keys, days, futures, strict=True):
+                try:
+                    num_rows, file_issues, prints = future.result()
+                    stats["total_rows"] += num_rows
+                    issues.extend(file_issues)
+                    if prints is not None:
+                        file_prints.append((file_path, prints))
+                    cache.put_file(
+                        file_path.name, key, num_rows, [_issue_to_dict(i) for i in file_issues]
+                    )
 
-        for file_path in files:
-            try:
-                table = pq.read_table(file_path)
-                stats["total_rows"] += table.num_rows
-
-                # Check for issues in this file
-                file_issues = self._validate_file(file_path, table, all_trade_ids)
-                issues.extend(file_issues)
-
-                # Gap detection
-                file_date = datetime.strptime(file_path.stem, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-                if prev_date:
-                    gap = (file_date - prev_date).days
-                    if gap > 1:
-                        gap_severity = self._get_gap_severity(gap)
-                        issues.append(
-                            ValidationIssue(
-                                severity=gap_severity,
-                                category="data_gap",
-                                message=f"{gap} day gap between {prev_date.date()} and {file_date.date()}",
-                                file_path=str(file_path),
-                            )
+                    # Gap detection
+                    if np.isnat(day):
+                        raise ValueError(f"Invalid isoformat string: {file_path.stem!r}")
+                    if prev_day is not None:
+                        gap = int((day - prev_day).astype(np.int64))
+                        if gap > 1:
+                            issues.append(self._gap_issue(prev_day, day, gap, file_path))
+                            stats["gaps"].append({"start": str(prev_day), "days": gap})
+                    prev_day = day
+
+                except Exception as e:
+                    read_errors = True
+                    issues.append(
+                        ValidationIssue(
+                            severity=Severity.HIGH,
+                            category="file_error",
+                            message=f"Error reading {file_path.name}: {e}",
+                            file_path=str(file_path),
                         )
-                        stats["gaps"].append({"start": str(prev_date.date()), "days": gap})
-                prev_date = file_date
-
-            except Exception as e:
-                issues.append(
-                    ValidationIssue(
-                        severity=Severity.HIGH,
-                        category="file_error",
-                        message=f"Error reading {file_path.name}: {e}",
-                        file_path=str(file_path),
                     )
-                )
 
-        # Set date range
-        if files:
+                # Unreadable files can widen a gap to critical after the name check
+                if fail_fast and issues and issues[-1].severity == Severity.CRITICAL:
+                    pool.shutdown(cancel_futures=True)
+                    return ValidationResult(passed=False, issues=issues, stats=stats)
+
+        if cached_cross is not None:
+            issues.extend(_issue_from_dict(i, trades_dir) for i in cached_cross)
+        else:
+            cross_issues = self._cross_file_duplicates(file_prints)
+            issues.extend(cross_issues)
+            if not read_errors:
+                cache.put_cross(cross_key, [_issue_to_dict(i) for i in cross_issues])
+
+        if self.use_cache:
+            cache.prune({f.name for f in files})
             try:
-                start = datetime.strptime(files[0].stem, "%Y-%m-%d")
-                end = datetime.strptime(files[-1].stem, "%Y-%m-%d")
-                stats["date_range"] = (str(start.date()), str(end.date()))
-            except ValueError:
-                pass
+                cache.save()
+            except OSError as e:
+                logger.warning(f"Failed to save validation cache: {e}")
 
         # Calculate completeness
-        if stats["date_range"] and prev_date:
-            start_dt = datetime.strptime(files[0].stem, "%Y-%m-%d")
-            end_dt = datetime.strptime(files[-1].stem, "%Y-%m-%d")
-            expected_days = (end_dt - start_dt).days + 1
-            actual_days = len(files)
-            completeness = (actual_days / expected_days) * 100 if expected_days > 0 else 0
-
-            if completeness < self.config.critical_completeness:
-                issues.append(
-                    ValidationIssue(
-                        severity=Severity.CRITICAL,
-                        category="completeness",
-                        message=f"Data completeness {completeness:.1f}% < {self.config.critical_completeness}%",
-                    )
-                )
-            elif completeness < self.config.warning_completeness:
-                issues.append(
-                    ValidationIssue(
-                        severity=Severity.MEDIUM,
-                        category="completeness",
-                        message=f"Data completeness {completeness:.1f}% < {self.config.warning_completeness}%",
-                    )
-                )
+        if stats["date_range"] and prev_day is not None:
+            completeness_issue = self._completeness_issue(days)
+            if completeness_issue is not None:
+                issues.append(completeness_issue)
 
         # Determine pass/fail
-        passed = not any(i.severity == Severity.CRITICAL for i in issues)
+        result = ValidationResult(passed=False, issues=issues, stats=stats)
+        result.passed = result.critical_count == 0
+        return result
+
+    def _critical_from_names(
+        self, files: list[Path], days: np.ndarray, stats: dict[str, Any]
+    ) -> list[ValidationIssue]:
+        """Find critical gap and completeness issues from file names alone.
+
+        These are the only checks that can be critical. An unreadable file
+        only widens the gap around it, so a gap critical by name stays
+        critical after reading.
+        """
+        issues: list[ValidationIssue] = []
+
+        valid = np.flatnonzero(~np.isnat(days))
+        gaps = np.diff(days[valid]).astype(np.int64)
+        critical_gaps = np.flatnonzero((gaps > 1) & (gaps >= self.config.gap_critical_days))
+        if len(critical_gaps):
+            i = critical_gaps[0]
+            prev_day, day, gap = days[valid[i]], days[valid[i + 1]], int(gaps[i])
+            issues.append(self._gap_issue(prev_day, day, gap, files[valid[i + 1]]))
+            stats["gaps"].append({"start": str(prev_day), "days": gap})
 
-        return ValidationResult(passed=passed, issues=issues, stats=stats)
+        if stats["date_range"]:
+            completeness_issue = self._completeness_issue(days)
+            if completeness_issue is not None and completeness_issue.severity == Severity.CRITICAL:
+                issues.append(completeness_issue)
+
+        return issues
+
+    def _gap_issue(
+        self, prev_day: np.datetime64, day: np.datetime64, gap: int, file_path: Path
+    ) -> ValidationIssue:
+        """Build the issue for a gap of more than one day before a file."""
+        return ValidationIssue(
+            severity=self._get_gap_severity(gap),
+            category="data_gap",
+            message=f"{gap} day gap between {prev_day} and {day}",
+            file_path=str(file_path),
+        )
+
+    def _completeness_issue(self, days: np.ndarray) -> ValidationIssue | None:
+        """Check the share of days between the first and last file that have a file."""
+        expected_days = int((days[-1] - days[0]).astype(np.int64)) + 1
+        actual_days = len(days)
+        completeness = (actual_days / expected_days) * 100 if expected_days > 0 else 0
+
+        if completeness < self.config.critical_completeness:
+            return ValidationIssue(
+                severity=Severity.CRITICAL,
+                category="completeness",
+                message=f"Data completeness {completeness:.1f}% < {self.config.critical_completeness}%",
+            )
+        if completeness < self.config.warning_completeness:
+            return ValidationIssue(
+                severity=Severity.MEDIUM,
+                category="completeness",
+                message=f"Data completeness {completeness:.1f}% < {self.config.warning_completeness}%",
+            )
+        return None
+
+    def _read_and_validate(
+        self,
+        file_path: Path,
+        cached: tuple[int, list[dict[str, Any]]] | None,
+        need_uniques: bool,
+    ) -> tuple[int, list[ValidationIssue], np.ndarray | None]:
+        """Read a daily file's validated columns and check them.
+
+        Args:
+            file_path: Daily file to validate.
+            cached: Cached row count and issues if the file is unchanged.
+            need_uniques: Whether the cross-file check needs the file's
+                trade IDs (only read from a cached file if so).
+
+        Returns:
+            Row count, issues, and fingerprints of the file's distinct
+            trade IDs (None if there are none) for the cross-file check.
+        """
+        if cached is not None:
+            rows, cached_issues = cached
+            file_issues = [_issue_from_dict(i, file_path.parent) for i in cached_issues]
+            return rows, file_issues, self._unique_fingerprints(file_path) if need_uniques else None
+
+        metadata = metadata_cache.get(file_path)
+        parquet_file = pq.ParquetFile(file_path, metadata=metadata, memory_map=True)
+        if metadata.num_rows == 0:
+            # Footer says there is nothing to check
+            table = parquet_file.schema_arrow.empty_table()
+        else:
+            table = parquet_file.read(columns=self._columns_to_read(parquet_file))
+        file_issues, uniques = self._validate_file(file_path, table)
+        return table.num_rows, file_issues, None if uniques is None else _fingerprint_ids(uniques)
+
+    def _trade_id_batches(self, file_path: Path) -> Iterator[pa.Array]:
+        """Stream a file's trade IDs (as strings) one batch at a time."""
+        parquet_file = pq.ParquetFile(
+            file_path, metadata=metadata_cache.get(file_path), memory_map=True
+        )
+        if "trade_id" not in parquet_file.schema_arrow.names:
+            return
+        for batch in parquet_file.iter_batches(batch_size=ID_BATCH_ROWS, columns=["trade_id"]):
+            yield batch.column(0).cast(pa.string())
+
+    def _unique_fingerprints(self, file_path: Path) -> np.ndarray | None:
+        """Fingerprints of a file's distinct trade IDs (None if empty or without trade_id).
+
+        Only one batch of IDs is decoded at a time. Deduplicating by
+        fingerprint may merge colliding IDs within the file, which cannot
+        hide a cross-file repeat.
+        """
+        prints = [_fingerprint_ids(pc.unique(ids)) for ids in self._trade_id_batches(file_path)]
+        return np.unique(np.concatenate(prints)) if prints else None
+
+    def _candidate_ids(self, file_path: Path, candidates: np.ndarray) -> pa.Array:
+        """Stream a file's distinct trade IDs whose fingerprint is a candidate."""
+        matches = [
+            ids.filter(pa.array(np.isin(_fingerprint_ids(ids), candidates)))
+            for ids in self._trade_id_batches(file_path)
+        ]
+        return pc.unique(pa.chunked_array(matches, type=pa.string()))
+
+    def _columns_to_read(self, parquet_file: pq.ParquetFile) -> list[str]:
+        """Pick the validated columns present in a file.
+
+        The iv column is dropped when every row group's statistics already
+        lie within [iv_min, iv_max], since it cannot contain outliers.
+        """
+        names = parquet_file.schema_arrow.names
+        columns = [name for name in VALIDATED_COLUMNS if name in names]
+        if "iv" in columns and self._iv_within_bounds(parquet_file.metadata):
+            columns.remove("iv")
+        return columns
+
+    def _iv_within_bounds(self, metadata: pq.FileMetaData) -> bool:
+        """Check from footer statistics that no IV lies outside the configured bounds."""
+        col_idx = metadata.schema.names.index("iv")
+        for i in range(metadata.num_row_groups):
+            column = metadata.row_group(i).column(col_idx)
+            stats = column.statistics
+            if stats is None:
+                return False
+            if not stats.has_min_max:
+                if stats.has_null_count and stats.null_count == column.num_values:
+                    continue  # All null
+                return False
+            if stats.min < self.config.iv_min or stats.max > self.config.iv_max:
+                return False
+        return True
 
     def _validate_file(
         self,
         file_path: Path,
         table: Any,
-        all_trade_ids: set[str],
-    ) -> list[ValidationIssue]:
-        """Validate a single parquet file."""
+    ) -> tuple[list[ValidationIssue], pa.Array | None]:
+        """Validate a single parquet file.
+
+        Returns:
+            Issues found, and the file's distinct trade IDs (None if the
+            file has no trade_id column) for the cross-file check.
+        """
         issues: list[ValidationIssue] = []
+        uniques: pa.Array | None = None
 
         if table.num_rows == 0:
             issues.append(
@@ -226,15 +526,13 @@ class DataValidator:
                     file_path=str(file_path),
                 )
             )
-            return issues
+            return issues, uniques
 
-        # Check IV bounds
+        # Check IV bounds (not read if the footer proves it in bounds)
         if "iv" in table.column_names:
-            iv_col = table.column("iv").to_pylist()
-            iv_valid = [v for v in iv_col if v is not None]
-
-            low_iv = sum(1 for v in iv_valid if v < self.config.iv_min)
-            high_iv = sum(1 for v in iv_valid if v > self.config.iv_max)
+            iv_col = table.column("iv")
+            low_iv = pc.sum(pc.less(iv_col, self.config.iv_min)).as_py() or 0
+            high_iv = pc.sum(pc.greater(iv_col, self.config.iv_max)).as_py() or 0
 
             if low_iv > 0:
                 issues.append(
@@ -256,14 +554,13 @@ class DataValidator:
                     )
                 )
 
-        # Check duplicates
+        # Check duplicates within the file (hashed by Arrow, not in Python)
         if "trade_id" in table.column_names:
-            trade_ids = table.column("trade_id").to_pylist()
-            file_ids = set(trade_ids)
+            trade_ids = table.column("trade_id")
+            uniques = pc.unique(trade_ids)
 
-            # Duplicates within file
-            if len(file_ids) < len(trade_ids):
-                dup_count = len(trade_ids) - len(file_ids)
+            if len(uniques) < len(trade_ids):
+                dup_count = len(trade_ids) - len(uniques)
                 dup_pct = (dup_count / len(trade_ids)) * 100
                 if dup_pct > self.config.duplicate_threshold:
                     issues.append(
@@ -275,26 +572,10 @@ class DataValidator:
                         )
                     )
 
-            # Duplicates across files
-            cross_dups = file_ids & all_trade_ids
-            if cross_dups:
-                issues.append(
-                    ValidationIssue(
-                        severity=Severity.HIGH,
-                        category="cross_duplicates",
-                        message=f"{len(cross_dups)} duplicate trade IDs across files",
-                        file_path=str(file_path),
-                    )
-                )
-
-            all_trade_ids.update(file_ids)
-
         # Check timestamp ordering
         if "timestamp" in table.column_names:
-            timestamps = table.column("timestamp").to_pylist()
-            unsorted = sum(
-                1 for i in range(1, len(timestamps)) if timestamps[i] < timestamps[i - 1]
-            )
+            timestamps = table.column("timestamp")
+            unsorted = pc.sum(pc.less(timestamps[1:], timestamps[:-1])).as_py() or 0
             if unsorted > 0:
                 issues.append(
                     ValidationIssue(
@@ -305,18 +586,53 @@ class DataValidator:
                     )
                 )
 
-        return issues
+        return issues, uniques
+
+    def _cross_file_duplicates(
+        self, file_prints: list[tuple[Path, np.ndarray]]
+    ) -> list[ValidationIssue]:
+        """Report trade IDs that already appeared in an earlier file.
+
+        Only 64-bit fingerprints of each file's distinct IDs are kept in
+        memory. Fingerprints seen in more than one place are candidates;
+        the files holding them are re-read and the candidates confirmed on
+        the actual IDs, so hash collisions never count as duplicates.
+        """
+        if len(file_prints) < 2:
+            return []
+
+        prints = np.concatenate([p for _, p in file_prints])
+        file_index = np.repeat(np.arange(len(file_prints)), [len(p) for _, p in file_prints])
+        sorted_prints = prints[np.lexsort((file_index, prints))]
+        candidates = np.unique(sorted_prints[1:][sorted_prints[1:] == sorted_prints[:-1]])
+        if len(candidates) == 0:
+            return []
+
+        file_candidates: list[tuple[Path, pa.Array]] = []
+        for file_path, file_print in file_prints:
+            if not np.isin(file_print, candidates).any():
+                continue
+            file_candidates.append((file_path, self._candidate_ids(file_path, candidates)))
+
+        return [
+            ValidationIssue(
+                severity=Severity.HIGH,
+                category="cross_duplicates",
+                message=f"{count} duplicate trade IDs across files",
+                file_path=str(file_path),
+            )
+            for (file_path, _), count in zip(
+                file_candidates, _count_repeats(file_candidates), strict=True
+            )
+            if count > 0
+        ]
 
     def _get_gap_severity(self, gap_days: int) -> Severity:
         """Get severity level for a data gap."""
-        if gap_days >= self.config.gap_critical_days:
-            return Severity.CRITICAL
-        elif gap_days >= self.config.gap_high_days:
-            return Severity.HIGH
-        elif gap_days >= self.config.gap_medium_days:
-            return Severity.MEDIUM
-        else:
-            return Severity.LOW
+        for threshold, severity in self._gap_thresholds:
+            if gap_days >= threshold:
+                return severity
+        return Severity.LOW
 
     def quick_check(self, catalog_path: Path, currency: str) -> bool:
         """Quick validation check (no detailed analysis).
@@ -338,8 +654,28 @@ class DataValidator:
 
         # Try reading first and last file
         try:
-            pq.read_metadata(files[0])
-            pq.read_metadata(files[-1])
+            self.quick_check_all([files[0], files[-1]])
             return True
         except Exception:
             return False
+
+    def quick_check_all(self, files: list[Path]) -> list[pq.FileMetaData]:
+        """Read the footers of many files concurrently.
+
+        Footers carry row counts and per-row-group min/max, enough for
+        stats-only checks without reading any column data.
+
+        Args:
+            files: Parquet files to read.
+
+        Returns:
+            File metadata, in the order of files.
+
+        Raises:
+            OSError: If a file cannot be read.
+            pyarrow.ArrowInvalid: If a file is not valid Parquet.
+        """
+        if not files:
+            return []
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(files))) as pool:
+            return list(pool.map(metadata_cache.get, files))
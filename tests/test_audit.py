@@ -1,10 +1,15 @@
 """Tests for audit log."""
 
+import gzip
+import json
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 
+from deribit_data import audit as audit_module
 from deribit_data.audit import AuditEvent, AuditEventType, AuditLog
 
 
@@ -39,6 +44,126 @@ class TestAuditLog:
         files = list(audit.audit_path.glob("audit_*.jsonl"))
         assert len(files) == 1
 
+    def test_log_buffers_until_flush(self, temp_catalog: Path) -> None:
+        """Test events are buffered and written on flush."""
+        audit = AuditLog(temp_catalog, flush_every=10, flush_interval=3600)
+        for _ in range(3):
+            audit.log(AuditEvent(event_type=AuditEventType.FILE_WRITTEN, currency="BTC"))
+
+        file_path = next(audit.audit_path.glob("audit_*.jsonl"))
+        assert file_path.read_text() == ""
+
+        audit.flush()
+        assert len(file_path.read_text().splitlines()) == 3
+
+        audit.close()
+
+    def test_log_after_close_drained_at_exit(self, temp_catalog: Path) -> None:
+        """Test a log reopened by logging after close() is drained at exit."""
+        audit = AuditLog(temp_catalog, flush_interval=3600)
+        audit.close()
+        assert audit not in audit_module._open_logs
+
+        audit.log(AuditEvent(event_type=AuditEventType.SYNC_START, currency="ETH"))
+        assert audit in audit_module._open_logs
+
+        audit_module._close_open_logs()
+        assert len(audit.get_recent_events()) == 1
+
+    def test_close_keeps_file_open_for_busy_writer(
+        self, temp_catalog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test close() does not close the file under a writer that is still writing."""
+        monkeypatch.setattr(audit_module, "CLOSE_TIMEOUT", 0.05)
+        audit = AuditLog(temp_catalog, flush_every=1)
+        release = threading.Event()
+        write_batch = audit._write_batch
+
+        def slow_write_batch(batch: list[bytes]) -> None:
+            release.wait()
+            write_batch(batch)
+
+        monkeypatch.setattr(audit, "_write_batch", slow_write_batch)
+        audit.log(AuditEvent(event_type=AuditEventType.SYNC_START, currency="ETH"))
+        audit.close()
+        assert audit._fd is not None
+
+        # Logged behind the stop sentinel; written when the log is closed
+        audit.log(AuditEvent(event_type=AuditEventType.SYNC_COMPLETE, currency="ETH"))
+        release.set()
+        audit.close()
+        assert audit._fd is None
+        assert len(audit.get_recent_events()) == 2
+
+    def test_month_rollover_waits_for_writer(
+        self, temp_catalog: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a month change does not close the file under a pending batch."""
+        audit = AuditLog(temp_catalog, flush_every=1)
+        month = ["2099-01"]
+        monkeypatch.setattr(audit, "_get_month_key", lambda: month[0])
+        started = threading.Event()
+        release = threading.Event()
+        write_batch = audit._write_batch
+
+        def slow_write_batch(batch: list[bytes]) -> None:
+            started.set()
+            release.wait()
+            write_batch(batch)
+
+        monkeypatch.setattr(audit, "_write_batch", slow_write_batch)
+        audit.log(AuditEvent(event_type=AuditEventType.SYNC_START, currency="ETH"))
+        assert started.wait(5)
+
+        month[0] = "2099-02"
+        audit.log(AuditEvent(event_type=AuditEventType.SYNC_COMPLETE, currency="ETH"))
+        release.set()
+        audit.close()
+
+        old_lines = (audit.audit_path / "audit_2099-01.jsonl").read_text().splitlines()
+        new_lines = (audit.audit_path / "audit_2099-02.jsonl").read_text().splitlines()
+        assert [json.loads(line)["event_type"] for line in old_lines] == ["sync_start"]
+        assert [json.loads(line)["event_type"] for line in new_lines] == ["sync_complete"]
+
+    def test_log_flushes_at_threshold(self, temp_catalog: Path) -> None:
+        """Test buffer is flushed once flush_every events are pending."""
+        with AuditLog(temp_catalog, flush_every=2, flush_interval=3600) as audit:
+            audit.log(AuditEvent(event_type=AuditEventType.SYNC_START, currency="ETH"))
+            audit.log(AuditEvent(event_type=AuditEventType.SYNC_COMPLETE, currency="ETH"))
+
+            # The writer thread flushes without an explicit flush() call
+            file_path = next(audit.audit_path.glob("audit_*.jsonl"))
+            deadline = time.monotonic() + 5
+            while len(file_path.read_text().splitlines()) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert len(file_path.read_text().splitlines()) == 2
+
+    def test_emit_matches_event_format(self, audit: AuditLog) -> None:
+        """Test helpers write the same fields as a logged AuditEvent."""
+        audit.log(
+            AuditEvent(
+                event_type=AuditEventType.DLQ_FAILURE,
+                currency="BTC",
+                details={"error": "x", "instrument": None},
+            )
+        )
+        audit.log_dlq_failure("BTC", "x", None)
+
+        logged, emitted = audit.get_recent_events()
+        assert logged.keys() == emitted.keys()
+        assert {k: v for k, v in logged.items() if k != "timestamp"} == {
+            k: v for k, v in emitted.items() if k != "timestamp"
+        }
+
+    def test_month_key_cached(self, audit: AuditLog) -> None:
+        """Test the month key is reused until the recheck interval elapses."""
+        audit._get_month_key()
+        audit._cached_month_key = "2000-01"
+        assert audit._get_month_key() == "2000-01"
+
+        audit._month_checked_at = 0.0
+        assert audit._get_month_key() == datetime.now(timezone.utc).strftime("%Y-%m")
+
     def test_log_backfill_start(self, audit: AuditLog) -> None:
         """Test logging backfill start."""
         audit.log_backfill_start(
@@ -95,11 +220,15 @@ class TestAuditLog:
         """Test filtering recent events."""
         # Log multiple events
         audit.log_backfill_start(
-            "BTC", datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 12, 31, tzinfo=timezone.utc)
+            "BTC",
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 12, 31, tzinfo=timezone.utc),
         )
         audit.log_backfill_complete("BTC", 1000, 100, 60.0)
         audit.log_backfill_start(
-            "ETH", datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 12, 31, tzinfo=timezone.utc)
+            "ETH",
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 12, 31, tzinfo=timezone.utc),
         )
 
         # Filter by event type
@@ -110,11 +239,21 @@ class TestAuditLog:
         events = audit.get_recent_events(currency="ETH")
         assert len(events) == 1
 
+    def test_get_recent_events_newest_first(self, audit: AuditLog) -> None:
+        """Test recent events are returned newest first and respect limit."""
+        for i in range(5):
+            audit.log_file_written("BTC", Path(f"file_{i}.parquet"), rows=i)
+
+        events = audit.get_recent_events(limit=2)
+        assert [e["file_path"] for e in events] == ["file_4.parquet", "file_3.parquet"]
+
     def test_get_summary(self, audit: AuditLog) -> None:
         """Test getting summary."""
         # Log multiple events
         audit.log_backfill_start(
-            "BTC", datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 12, 31, tzinfo=timezone.utc)
+            "BTC",
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 12, 31, tzinfo=timezone.utc),
         )
         audit.log_backfill_complete("BTC", 1000, 100, 60.0)
         audit.log_backfill_error("ETH", "Test error")
@@ -128,6 +267,132 @@ class TestAuditLog:
         assert summary["by_currency"]["ETH"] == 1
         assert len(summary["recent_errors"]) == 1
 
+    def test_summary_cached_for_sealed_month(self, audit: AuditLog) -> None:
+        """Test past-month files get a sidecar summary that is reused."""
+        sealed = audit.audit_path / "audit_2020-01.jsonl"
+        event = AuditEvent(event_type=AuditEventType.SYNC_ERROR, currency="BTC")
+        sealed.write_bytes(event.to_json_bytes() * 2)
+
+        summary = audit.get_summary()
+        assert summary["total_events"] == 2
+        assert summary["by_event_type"]["sync_error"] == 2
+        assert len(summary["recent_errors"]) == 2
+
+        cache_path = audit.audit_path / "audit_2020-01.summary.json"
+        assert cache_path.exists()
+
+        # Second call is served from cache and gives the same answer
+        assert audit.get_summary() == summary
+
+    def test_past_months_sealed_in_background(self, temp_catalog: Path) -> None:
+        """Test old month files are gzip-sealed and still readable."""
+        audit_dir = temp_catalog / "_audit"
+        audit_dir.mkdir(parents=True)
+        event = AuditEvent(event_type=AuditEventType.SYNC_START, currency="ETH")
+        (audit_dir / "audit_2020-01.jsonl").write_bytes(event.to_json_bytes() * 3)
+
+        audit = AuditLog(temp_catalog)
+
+        assert len(audit.get_recent_events()) == 3
+        assert audit.get_summary()["total_events"] == 3
+        assert not (audit_dir / "audit_2020-01.jsonl").exists()
+        assert (audit_dir / "audit_2020-01.jsonl.gz").exists()
+
+    def test_previous_month_not_sealed(self, audit: AuditLog) -> None:
+        """Test the previous month stays plain while other processes may append."""
+        audit._wait_for_sealer()
+        month = audit_module._previous_month(audit._get_month_key())
+        file_path = audit.audit_path / f"audit_{month}.jsonl"
+        file_path.write_bytes(
+            AuditEvent(event_type=AuditEventType.SYNC_START, currency="ETH").to_json_bytes()
+        )
+
+        audit._seal_past_months()
+
+        assert file_path.exists()
+        assert audit_module._previous_month("2024-01") == "2023-12"
+
+    def test_concurrent_sealing(self, temp_catalog: Path, caplog: pytest.LogCaptureFixture) -> None:
+        """Test logs opened at once on one catalog seal each month exactly once."""
+        audit_dir = temp_catalog / "_audit"
+        audit_dir.mkdir(parents=True)
+        event = AuditEvent(event_type=AuditEventType.SYNC_START, currency="ETH")
+        (audit_dir / "audit_2020-01.jsonl").write_bytes(event.to_json_bytes() * 1000)
+
+        audits = [AuditLog(temp_catalog) for _ in range(4)]
+        for audit in audits:
+            audit._wait_for_sealer()
+
+        assert sorted(p.name for p in audit_dir.iterdir()) == ["audit_2020-01.jsonl.gz"]
+        assert "Failed to seal" not in caplog.text
+        assert audits[0].get_summary()["total_events"] == 1000
+
+    def test_sealing_leftovers(self, audit: AuditLog) -> None:
+        """Test a plain file left next to its sealed copy is read once and removed."""
+        audit._wait_for_sealer()
+        lines = AuditEvent(event_type=AuditEventType.SYNC_START, currency="ETH").to_json_bytes()
+        plain = audit.audit_path / "audit_2020-01.jsonl"
+        plain.write_bytes(lines * 2)
+        with gzip.open(audit.audit_path / "audit_2020-01.jsonl.gz", "wb") as gz:
+            gz.write(lines * 2)
+
+        assert audit.get_summary()["total_events"] == 2
+        assert len(audit.get_recent_events()) == 2
+
+        # Sealing a source another process already removed is a no-op
+        audit._seal_file(audit.audit_path / "audit_2020-02.jsonl")
+
+        audit._seal_past_months()
+        assert not plain.exists()
+        assert not list(audit.audit_path.glob("*.tmp"))
+
+    def test_time_window_filters(self, audit: AuditLog) -> None:
+        """Test since/until prune months and filter events by timestamp."""
+        lines = b"".join(
+            AuditEvent(
+                timestamp=datetime(2020, month, 15, tzinfo=timezone.utc),
+                event_type=AuditEventType.SYNC_START,
+                currency="BTC",
+            ).to_json_bytes()
+            for month in (1, 2)
+        )
+        (audit.audit_path / "audit_2020-01.jsonl").write_bytes(lines[: len(lines) // 2])
+        (audit.audit_path / "audit_2020-02.jsonl").write_bytes(lines[len(lines) // 2 :])
+
+        since = datetime(2020, 2, 1, tzinfo=timezone.utc)
+        until = datetime(2020, 2, 20, tzinfo=timezone.utc)
+
+        events = audit.get_recent_events(since=since, until=until)
+        assert len(events) == 1
+        assert events[0]["timestamp"].startswith("2020-02-15")
+
+        assert audit.get_summary(since=since, until=until)["total_events"] == 1
+        until_feb_10 = datetime(2020, 2, 10, tzinfo=timezone.utc)
+        assert audit.get_summary(until=until_feb_10)["total_events"] == 1
+        assert audit.get_summary()["total_events"] == 2
+
+    def test_time_window_filters_legacy_lines(self, audit: AuditLog) -> None:
+        """Test since/until also apply to events written with json.dumps."""
+        legacy = {
+            "timestamp": datetime(2020, 3, 5, tzinfo=timezone.utc).isoformat(),
+            "event_type": "sync_start",
+            "currency": "BTC",
+        }
+        current = AuditEvent(
+            timestamp=datetime(2020, 3, 20, tzinfo=timezone.utc),
+            event_type=AuditEventType.SYNC_START,
+            currency="ETH",
+        )
+        (audit.audit_path / "audit_2020-03.jsonl").write_bytes(
+            (json.dumps(legacy) + "\n").encode() * 3 + current.to_json_bytes()
+        )
+
+        since = datetime(2020, 3, 10, tzinfo=timezone.utc)
+        events = audit.get_recent_events(since=since)
+        assert [e["currency"] for e in events] == ["ETH"]
+        assert audit.get_summary(since=since)["total_events"] == 1
+        assert audit.get_summary(until=since)["total_events"] == 3
+
     def test_empty_summary(self, audit: AuditLog) -> None:
         """Test summary with no events."""
         summary = audit.get_summary()
@@ -63,6 +63,37 @@ class TestCheckpointManager:
         loaded = mgr.load("ETH")
         assert loaded is None
 
+    def test_load_served_from_cache(self, tmp_checkpoint_dir: Path) -> None:
+        """Test repeated loads reuse the cached state."""
+        mgr = CheckpointManager(tmp_checkpoint_dir)
+        mgr.save(mgr.create_initial("BTC"))
+
+        # Fresh manager reads from disk once, then from memory
+        other = CheckpointManager(tmp_checkpoint_dir)
+        first = other.load("BTC")
+        (tmp_checkpoint_dir / "btc_checkpoint.json").unlink()
+        assert other.load("BTC") is first
+        assert other.exists("BTC")
+
+    def test_load_z_suffix_timestamps(self, tmp_checkpoint_dir: Path) -> None:
+        """Test loading checkpoints with 'Z'-suffixed ISO timestamps."""
+        (tmp_checkpoint_dir / "eth_checkpoint.json").write_text(
+            '{"currency": "ETH", "last_page": 3, "started_at": "2024-01-01T00:00:00Z"}'
+        )
+        mgr = CheckpointManager(tmp_checkpoint_dir)
+
+        loaded = mgr.load("ETH")
+        assert loaded is not None
+        assert loaded.started_at == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert loaded.last_page == 3
+
+    def test_load_corrupt_returns_none(self, tmp_checkpoint_dir: Path) -> None:
+        """Test corrupt checkpoint file is treated as missing."""
+        (tmp_checkpoint_dir / "btc_checkpoint.json").write_text("{not json")
+        mgr = CheckpointManager(tmp_checkpoint_dir)
+
+        assert mgr.load("BTC") is None
+
     def test_exists(self, tmp_checkpoint_dir: Path) -> None:
         """Test exists check."""
         mgr = CheckpointManager(tmp_checkpoint_dir)
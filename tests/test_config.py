@@ -45,6 +45,11 @@ class TestDeribitConfig:
         assert config.compression == "zstd"
         assert config.currencies == ["BTC", "ETH"]
         assert config.historical_start_date == date(2016, 1, 1)
+        assert config.checkpoint_interval == 30.0
+        assert config.sync_min_interval_seconds == 30.0
+        assert config.max_concurrent_requests == 4
+        assert config.http_pool_size <= config.http_burst_limit
+        assert config.http2 is True
 
     def test_frozen(self) -> None:
         """Test config is immutable."""
@@ -83,6 +88,16 @@ class TestDeribitConfig:
         assert config.http_timeout == 45.0
         assert config.max_retries == 5  # default
 
+    def test_from_env_cached(self, monkeypatch) -> None:
+        """Test repeated loads with the same env reuse the instance."""
+        monkeypatch.setenv("DERIBIT_BATCH_SIZE", "500")
+
+        first = DeribitConfig.from_env()
+        assert DeribitConfig.from_env() is first
+
+        monkeypatch.setenv("DERIBIT_BATCH_SIZE", "600")
+        assert DeribitConfig.from_env().batch_size == 600
+
     def test_from_file_json(self, tmp_path: Path) -> None:
         """Test loading from JSON file."""
         config_file = tmp_path / "config.json"
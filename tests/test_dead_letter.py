@@ -2,10 +2,11 @@
 
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from deribit_data.dead_letter import DeadLetterQueue
+from deribit_data.dead_letter import DeadLetterQueue, _count_lines
 from deribit_data.models import FailedTrade
 
 
@@ -105,6 +106,19 @@ class TestDeadLetterQueue:
         assert summary["by_currency"]["ETH"] == 2
         assert summary["total_files"] == 2
 
+    def test_get_summary_recounts_changed_files(self, dlq: DeadLetterQueue) -> None:
+        """Test repeated summaries only re-read files that changed."""
+        for currency in ["BTC", "ETH"]:
+            dlq.add(FailedTrade(raw_data={}, error="Error", currency=currency))
+        assert dlq.get_summary()["total_failures"] == 2
+
+        dlq.add(FailedTrade(raw_data={}, error="Error", currency="BTC"))
+        with patch("deribit_data.dead_letter._count_lines", wraps=_count_lines) as count:
+            summary = dlq.get_summary()
+
+        assert summary["by_currency"] == {"BTC": 2, "ETH": 1}
+        assert [call.args[0].name[:3] for call in count.call_args_list] == ["btc"]
+
     def test_load_with_date_filter(self, dlq: DeadLetterQueue) -> None:
         """Test loading with date filter."""
         # Add failure with specific timestamp
@@ -115,6 +129,7 @@ class TestDeadLetterQueue:
             currency="BTC",
         )
         dlq.add(failed)
+        assert dlq.get_stats() == {"BTC:2024-01-15": 1}
 
         # Load with filter that excludes it
         failures = dlq.load_failures(
@@ -140,3 +155,77 @@ class TestDeadLetterQueue:
         assert summary["total_failures"] == 0
         assert summary["total_files"] == 0
         assert summary["by_currency"] == {}
+
+    def test_add_buffers_until_flush(self, temp_catalog: Path) -> None:
+        """Test records are written in batches and on flush."""
+        dlq = DeadLetterQueue(temp_catalog, flush_every=3)
+        failed = FailedTrade(
+            raw_data={"trade_id": "buffered"},
+            error="Test error",
+            timestamp=datetime(2024, 1, 15, tzinfo=timezone.utc),
+            currency="BTC",
+        )
+        file_path = dlq.dlq_path / "btc_dead_letters_2024-01-15.jsonl"
+
+        dlq.add(failed)
+        dlq.add(failed)
+        assert not file_path.exists()
+
+        dlq.add(failed)
+        assert len(file_path.read_bytes().splitlines()) == 3
+
+        with dlq:
+            dlq.add(failed)
+        assert len(file_path.read_bytes().splitlines()) == 4
+        assert len(dlq.load_failures("BTC")) == 4
+
+    def test_count_lines(self, tmp_path: Path) -> None:
+        """Test line counting across chunk boundaries."""
+        small = tmp_path / "small.jsonl"
+        small.write_bytes(b"{}\n" * 10)
+        large = tmp_path / "large.jsonl"
+        large.write_bytes(b'{"a":1}\n' * 300_000)
+        empty = tmp_path / "empty.jsonl"
+        empty.write_bytes(b"")
+
+        assert _count_lines(small) == 10
+        assert _count_lines(large) == 300_000
+        assert _count_lines(empty) == 0
+
+    def test_load_failures_skips_corrupt_lines(self, dlq: DeadLetterQueue) -> None:
+        """Test malformed lines are skipped when loading."""
+        failed = FailedTrade(
+            raw_data={"trade_id": "ok"},
+            error="Test error",
+            timestamp=datetime(2024, 1, 15, tzinfo=timezone.utc),
+            currency="BTC",
+        )
+        dlq.add(failed)
+        dlq.flush()
+        file_path = dlq.dlq_path / "btc_dead_letters_2024-01-15.jsonl"
+        with open(file_path, "ab") as f:
+            f.write(b"{truncated\n\n")
+
+        failures = dlq.load_failures("BTC")
+
+        assert [f.raw_data["trade_id"] for f in failures] == ["ok"]
+
+    def test_load_with_closed_date_range(self, dlq: DeadLetterQueue) -> None:
+        """Test a start and end date select only the files in range, in order."""
+        for day in (3, 1, 10):
+            dlq.add(
+                FailedTrade(
+                    raw_data={"trade_id": f"day_{day}"},
+                    error="Test error",
+                    timestamp=datetime(2024, 1, day, tzinfo=timezone.utc),
+                    currency="ETH",
+                )
+            )
+
+        failures = dlq.load_failures(
+            "ETH",
+            start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2024, 1, 5, tzinfo=timezone.utc),
+        )
+
+        assert [f.raw_data["trade_id"] for f in failures] == ["day_1", "day_3"]
@@ -0,0 +1,54 @@
+"""Tests for JSON serialization helpers."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from deribit_data import fastjson
+from deribit_data.models import OptionType
+
+
+class TestFastJson:
+    """Test cases for fastjson helpers."""
+
+    def test_dumps_returns_bytes(self) -> None:
+        """Test dumps produces UTF-8 bytes."""
+        raw = fastjson.dumps({"a": 1})
+        assert isinstance(raw, bytes)
+        assert json.loads(raw) == {"a": 1}
+
+    def test_datetime_matches_isoformat(self) -> None:
+        """Test datetimes serialize like datetime.isoformat()."""
+        ts = datetime(2024, 1, 15, 12, 30, 0, 123456, tzinfo=timezone.utc)
+        data = json.loads(fastjson.dumps({"ts": ts}))
+        assert data["ts"] == ts.isoformat()
+
+    def test_enum_serialized_by_value(self) -> None:
+        """Test enums serialize to their value."""
+        data = json.loads(fastjson.dumps({"type": OptionType.CALL}))
+        assert data["type"] == "call"
+
+    def test_indent(self) -> None:
+        """Test indented output is still valid JSON."""
+        raw = fastjson.dumps({"a": [1, 2]}, indent=True)
+        assert b"\n" in raw
+        assert json.loads(raw) == {"a": [1, 2]}
+
+    def test_roundtrip(self) -> None:
+        """Test loads parses dumps output."""
+        obj = {"x": 1.5, "y": None, "z": ["a", "b"]}
+        assert fastjson.loads(fastjson.dumps(obj)) == obj
+
+    def test_loads_invalid_raises(self) -> None:
+        """Test invalid input raises JSONDecodeError."""
+        with pytest.raises(fastjson.JSONDecodeError):
+            fastjson.loads(b"{not json")
+
+    def test_stdlib_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test stdlib fallback produces equivalent output."""
+        ts = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        monkeypatch.setattr(fastjson, "HAS_ORJSON", False)
+        raw = fastjson.dumps({"ts": ts, "type": OptionType.PUT})
+        assert fastjson.loads(raw) == {"ts": ts.isoformat(), "type": "put"}
+        assert fastjson.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
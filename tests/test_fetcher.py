@@ -5,8 +5,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from deribit_data import fastjson
 from deribit_data.config import DeribitConfig
-from deribit_data.fetcher import DeribitFetcher
+from deribit_data.fetcher import DeribitFetcher, create_http_client
+from deribit_data.models import DVOLCandle, OptionTrade
+from deribit_data.storage import trades_to_table
 
 
 class TestDeribitFetcher:
@@ -57,6 +60,24 @@ class TestDeribitFetcher:
 
         assert result is None
 
+    def test_parse_instrument_invalid_expiry(self, mock_config: DeribitConfig) -> None:
+        """Test expiries with an unknown month or day are rejected."""
+        assert DeribitFetcher._parse_instrument("BTC-30FEB24-100000-C") is None
+        assert DeribitFetcher._parse_instrument("BTC-1XYZ24-100000-C") is None
+        result = DeribitFetcher._parse_instrument("BTC-1SEP24-100000-C")
+        assert result is not None
+        assert result["expiry"] == datetime(2024, 9, 1, 8, tzinfo=timezone.utc)
+
+    def test_parse_instrument_cached(self, mock_config: DeribitConfig) -> None:
+        """Test repeated instruments are served from the parse cache."""
+        fetcher = DeribitFetcher(mock_config)
+
+        first = fetcher._parse_instrument("BTC-29MAR24-70000-P")
+        second = DeribitFetcher._parse_instrument("BTC-29MAR24-70000-P")
+
+        assert first is not None
+        assert second is first
+
     def test_parse_trade(self, mock_config: DeribitConfig) -> None:
         """Test parsing trade data."""
         fetcher = DeribitFetcher(mock_config)
@@ -84,6 +105,26 @@ class TestDeribitFetcher:
         assert trade.amount == 1.0
         assert trade.direction.value == "buy"
 
+    def test_parse_trade_uses_instrument_cache(self, mock_config: DeribitConfig) -> None:
+        """Test repeated instruments skip _parse_instrument after the first trade."""
+        fetcher = DeribitFetcher(mock_config)
+        trade_data = {
+            "trade_id": "12345",
+            "instrument_name": "ETH-26JUL24-3500-P",
+            "timestamp": 1704067200000,
+            "price": 0.05,
+            "amount": 1.0,
+            "direction": "buy",
+        }
+        fetcher._parse_trade(trade_data)
+
+        with patch.object(DeribitFetcher, "_parse_instrument") as parse_instrument:
+            trade, _ = fetcher._parse_trade(trade_data)
+
+        parse_instrument.assert_not_called()
+        assert trade is not None
+        assert trade.strike == 3500.0
+
     def test_parse_trade_no_iv(self, mock_config: DeribitConfig) -> None:
         """Test parsing trade without IV (should still work)."""
         fetcher = DeribitFetcher(mock_config)
@@ -104,6 +145,47 @@ class TestDeribitFetcher:
         assert error is None
         assert trade.iv is None
 
+    def test_parse_trade_matches_validated_model(self, mock_config: DeribitConfig) -> None:
+        """Test the unvalidated fast path builds the same trade as the model."""
+        fetcher = DeribitFetcher(mock_config)
+
+        trade_data = {
+            "trade_id": "12345",
+            "instrument_name": "BTC-27DEC24-100000-C",
+            "timestamp": 1704067200000,
+            "price": 0.05,
+            "iv": 65.0,
+            "amount": 1.0,
+            "direction": "sell",
+            "index_price": 45000,
+        }
+
+        trade, _ = fetcher._parse_trade(trade_data)
+
+        assert trade is not None
+        assert trade == OptionTrade.model_validate(trade.model_dump())
+        assert trade.index_price == 45000.0
+        assert isinstance(trade.index_price, float)
+
+    def test_parse_trade_constraint_violation(self, mock_config: DeribitConfig) -> None:
+        """Test field constraints are still enforced on the fast path."""
+        fetcher = DeribitFetcher(mock_config)
+
+        trade_data = {
+            "trade_id": "12345",
+            "instrument_name": "BTC-27DEC24-100000-C",
+            "timestamp": 1704067200000,
+            "price": 0.05,
+            "amount": 0.0,
+            "direction": "buy",
+        }
+
+        trade, error = fetcher._parse_trade(trade_data)
+
+        assert trade is None
+        assert error is not None
+        assert "amount" in error
+
     def test_parse_trade_invalid_instrument(self, mock_config: DeribitConfig) -> None:
         """Test parsing trade with invalid instrument returns error."""
         fetcher = DeribitFetcher(mock_config)
@@ -123,11 +205,97 @@ class TestDeribitFetcher:
         assert error is not None
         assert "Invalid instrument format" in error
 
+    def test_parse_trades_batch_matches_per_trade(self, mock_config: DeribitConfig) -> None:
+        """Test the vectorized page parse builds the same table as per-trade parsing."""
+        fetcher = DeribitFetcher(mock_config)
+
+        trades_data = [
+            {
+                "trade_id": 1000 + i,
+                "instrument_name": f"ETH-2{i % 2}DEC24-{3000 + 100 * (i % 3)}-{'CP'[i % 2]}",
+                "timestamp": 1704067200000 + i * 1001,
+                "price": 0.05 + i / 1000,
+                "iv": 65.0 if i % 4 else None,
+                "amount": 1.0 + i,
+                "direction": "buy" if i % 2 else "sell",
+                "index_price": 2300.5 if i % 3 else None,
+                "mark_price": 0.051,
+            }
+            for i in range(8)
+        ]
+
+        table, failures = fetcher._parse_trades_batch(trades_data)
+
+        trades = [fetcher._parse_trade(t)[0] for t in trades_data]
+        expected = trades_to_table([t for t in trades if t is not None])
+        assert failures == []
+        assert table.equals(expected)
+
+    def test_parse_trades_batch_falls_back_on_bad_trade(self, mock_config: DeribitConfig) -> None:
+        """Test a malformed trade is reported while the rest of the page is kept."""
+        fetcher = DeribitFetcher(mock_config)
+
+        good = {
+            "trade_id": "1",
+            "instrument_name": "BTC-27DEC24-100000-C",
+            "timestamp": 1704067200000,
+            "price": 0.05,
+            "amount": 1.0,
+            "direction": "buy",
+        }
+        bad = {**good, "trade_id": "2", "instrument_name": "BTC-31FEB24-100000-C"}
+
+        table, failures = fetcher._parse_trades_batch([good, bad])
+
+        assert table.column("trade_id").to_pylist() == ["1"]
+        assert len(failures) == 1
+        assert failures[0][0] is bad
+        assert "Invalid instrument format" in failures[0][1]
+
     def test_context_manager(self, mock_config: DeribitConfig) -> None:
         """Test context manager."""
         with DeribitFetcher(mock_config) as fetcher:
             assert fetcher is not None
 
+    @pytest.mark.parametrize(
+        ("has_h2", "enabled", "expected"),
+        [
+            (True, True, True),
+            (True, False, False),
+            (False, True, False),
+        ],
+    )
+    def test_create_http_client_http2(
+        self, mock_config: DeribitConfig, has_h2: bool, enabled: bool, expected: bool
+    ) -> None:
+        """Test HTTP/2 is only requested when enabled and h2 is installed."""
+        config = mock_config.model_copy(update={"http2": enabled})
+
+        with (
+            patch("deribit_data.fetcher.HAS_H2", has_h2),
+            patch("deribit_data.fetcher.httpx.Client") as client_class,
+        ):
+            create_http_client(config)
+
+        assert client_class.call_args.kwargs["http2"] is expected
+
+    def test_create_http_client_keepalive(self, mock_config: DeribitConfig) -> None:
+        """Test idle connections are kept for the configured expiry."""
+        with patch("deribit_data.fetcher.httpx.Client") as client_class:
+            create_http_client(mock_config)
+
+        limits = client_class.call_args.kwargs["limits"]
+        assert limits.keepalive_expiry == mock_config.http_keepalive_expiry == 30.0
+
+    def test_shared_client_not_closed(self, mock_config: DeribitConfig) -> None:
+        """Test a client passed in by the caller outlives the fetcher."""
+        client = MagicMock()
+
+        with DeribitFetcher(mock_config, client) as fetcher:
+            assert fetcher._client is client
+
+        client.close.assert_not_called()
+
     @patch("deribit_data.fetcher.httpx.Client")
     def test_fetch_trades_streaming(
         self, mock_client_class: MagicMock, mock_config: DeribitConfig
@@ -139,7 +307,7 @@ class TestDeribitFetcher:
 
         # Mock response with trades
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        payload = {
             "result": {
                 "trades": [
                     {
@@ -156,6 +324,7 @@ class TestDeribitFetcher:
                 "has_more": False,
             }
         }
+        mock_response.content = fastjson.dumps(payload)
         mock_client.get.return_value = mock_response
 
         with DeribitFetcher(mock_config) as fetcher:
@@ -169,6 +338,84 @@ class TestDeribitFetcher:
 
         assert len(batches) == 1
         assert len(batches[0]) == 10
+        assert batches[0].last_timestamp_ms == 1704067200000 + 9 * 1000
+
+    @patch("deribit_data.fetcher.httpx.Client")
+    def test_fetch_trades_streaming_paginates(
+        self, mock_client_class: MagicMock, mock_config: DeribitConfig
+    ) -> None:
+        """Test prefetched pages chain start_timestamp from the previous page."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        def page(start: int, has_more: bool) -> MagicMock:
+            trades = [
+                {
+                    "trade_id": f"trade_{start + i}",
+                    "instrument_name": "BTC-27DEC24-100000-C",
+                    "timestamp": 1704067200000 + (start + i) * 1000,
+                    "price": 0.05,
+                    "amount": 1.0,
+                    "direction": "buy",
+                }
+                for i in range(3)
+            ]
+            response = MagicMock()
+            response.content = fastjson.dumps({"result": {"trades": trades, "has_more": has_more}})
+            return response
+
+        mock_client.get.side_effect = [page(0, True), page(3, True), page(6, False)]
+
+        with DeribitFetcher(mock_config) as fetcher:
+            pages = list(
+                fetcher._iter_trade_pages(
+                    "BTC",
+                    datetime(2024, 1, 1, tzinfo=timezone.utc),
+                    datetime(2024, 1, 2, tzinfo=timezone.utc),
+                )
+            )
+
+        assert [len(p) for p in pages] == [3, 3, 3]
+        starts = [c.kwargs["params"]["start_timestamp"] for c in mock_client.get.call_args_list]
+        assert starts == [1704067200000, 1704067202001, 1704067205001]
+
+    @patch("deribit_data.fetcher.httpx.Client")
+    def test_fetch_trades_streaming_with_failures(
+        self, mock_client_class: MagicMock, mock_config: DeribitConfig
+    ) -> None:
+        """Test failed trades go to the DLQ and do not set last_timestamp_ms."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        trades = [
+            {
+                "trade_id": f"trade_{i}",
+                "instrument_name": "BTC-27DEC24-100000-C" if i < 3 else "INVALID",
+                "timestamp": 1704067200000 + i * 1000,
+                "price": 0.05,
+                "amount": 1.0,
+                "direction": "buy",
+            }
+            for i in range(5)
+        ]
+        mock_response = MagicMock()
+        mock_response.content = fastjson.dumps({"result": {"trades": trades, "has_more": False}})
+        mock_client.get.return_value = mock_response
+        dlq = MagicMock()
+
+        with DeribitFetcher(mock_config) as fetcher:
+            batches = list(
+                fetcher.fetch_trades_streaming(
+                    currency="BTC",
+                    start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                    end_date=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                    dead_letter_queue=dlq,
+                )
+            )
+
+        assert [t.trade_id for t in batches[0]] == ["trade_0", "trade_1", "trade_2"]
+        assert batches[0].last_timestamp_ms == 1704067200000 + 2 * 1000
+        assert dlq.add.call_count == 2
 
     @patch("deribit_data.fetcher.httpx.Client")
     def test_fetch_dvol(self, mock_client_class: MagicMock, mock_config: DeribitConfig) -> None:
@@ -177,7 +424,7 @@ class TestDeribitFetcher:
         mock_client_class.return_value = mock_client
 
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        payload = {
             "result": {
                 "data": [
                     [1704067200000, 50.0, 52.0, 48.0, 51.0],
@@ -185,6 +432,7 @@ class TestDeribitFetcher:
                 ]
             }
         }
+        mock_response.content = fastjson.dumps(payload)
         mock_client.get.return_value = mock_response
 
         with DeribitFetcher(mock_config) as fetcher:
@@ -197,3 +445,34 @@ class TestDeribitFetcher:
         assert len(candles) == 2
         assert candles[0].open == 50.0
         assert candles[0].close == 51.0
+
+    @patch("deribit_data.fetcher.httpx.Client")
+    def test_fetch_dvol_skips_invalid_candles(
+        self, mock_client_class: MagicMock, mock_config: DeribitConfig
+    ) -> None:
+        """Test candles violating model constraints are dropped on the fast path."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        mock_response = MagicMock()
+        payload = {
+            "result": {
+                "data": [
+                    [1704067200000, 50.0, 47.0, 48.0, 51.0],  # high < low
+                    [1704070800000, 0.0, 53.0, 49.0, 52.0],  # open not > 0
+                    [1704074400000, 52.0, 54.0, 50.0, 53.0],
+                ]
+            }
+        }
+        mock_response.content = fastjson.dumps(payload)
+        mock_client.get.return_value = mock_response
+
+        with DeribitFetcher(mock_config) as fetcher:
+            candles = fetcher.fetch_dvol(
+                currency="BTC",
+                start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                end_date=datetime(2024, 1, 2, tzinfo=timezone.utc),
+            )
+
+        assert len(candles) == 1
+        assert candles[0] == DVOLCandle.model_validate(candles[0].model_dump())
@@ -1,11 +1,15 @@
 """Tests for manifest module."""
 
+import hashlib
+import os
+from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import pyarrow as pa
 import pyarrow.parquet as pq
 
-from deribit_data.manifest import ManifestEntry, ManifestManager
+from deribit_data.manifest import MMAP_MIN_BYTES, ManifestEntry, ManifestManager
 
 
 class TestManifestEntry:
@@ -129,6 +133,48 @@ class TestManifestManager:
 
         assert mgr.verify_file(file_path) is False
 
+    def test_verify_file_size_mismatch_skips_hash(self, tmp_catalog: Path) -> None:
+        """Test a size mismatch fails verification without hashing the file."""
+        file_path = tmp_catalog / "test.parquet"
+        pq.write_table(pa.table({"x": [1, 2, 3]}), file_path)
+
+        mgr = ManifestManager(tmp_catalog)
+        mgr.update_file(file_path)
+        pq.write_table(pa.table({"x": list(range(100))}), file_path)
+
+        with patch.object(mgr, "_compute_sha256") as compute:
+            assert mgr.verify_file(file_path) is False
+        compute.assert_not_called()
+
+    def test_verify_file_unchanged_skips_hash(self, tmp_catalog: Path) -> None:
+        """Test matching size and mtime pass verification without hashing."""
+        file_path = tmp_catalog / "test.parquet"
+        pq.write_table(pa.table({"x": [1, 2, 3]}), file_path)
+
+        mgr = ManifestManager(tmp_catalog)
+        mgr.update_file(file_path)
+
+        with patch.object(mgr, "_compute_sha256") as compute:
+            assert mgr.verify_file(file_path) is True
+        compute.assert_not_called()
+
+    def test_verify_file_deep(self, tmp_catalog: Path) -> None:
+        """Test deep verification detects changes that keep size and mtime."""
+        file_path = tmp_catalog / "test.parquet"
+        pq.write_table(pa.table({"x": [1, 2, 3]}), file_path)
+
+        mgr = ManifestManager(tmp_catalog)
+        entry = mgr.update_file(file_path)
+
+        # Rewrite in place with the same size, then restore the mtime
+        pq.write_table(pa.table({"x": [4, 5, 6]}), file_path)
+        assert file_path.stat().st_size == entry.size_bytes
+        os.utime(file_path, ns=(entry.mtime_ns, entry.mtime_ns))
+
+        assert mgr.verify_file(file_path) is True
+        assert mgr.verify_file(file_path, deep=True) is False
+        assert mgr.verify_all(deep=True) == (0, 1, ["test.parquet"])
+
     def test_verify_file_not_in_manifest(self, tmp_catalog: Path) -> None:
         """Test verification fails for unregistered file."""
         table = pa.table({"x": [1, 2, 3]})
@@ -190,6 +236,14 @@ class TestManifestManager:
         assert result is True
         assert mgr.file_count == 0
 
+    def test_load_corrupt_manifest(self, tmp_catalog: Path) -> None:
+        """Test a corrupt manifest file is ignored."""
+        (tmp_catalog / "manifest.json").write_bytes(b"{not json")
+
+        mgr = ManifestManager(tmp_catalog)
+
+        assert mgr.file_count == 0
+
     def test_atomic_save(self, tmp_catalog: Path) -> None:
         """Test manifest save is atomic."""
         table = pa.table({"x": [1, 2, 3]})
@@ -220,3 +274,139 @@ class TestManifestManager:
 
         assert mgr.total_rows == 10 + 20 + 30  # 60
         assert mgr.total_size > 0
+
+    def test_update_files_batch_deferred(self, tmp_catalog: Path) -> None:
+        """Test staged files are hashed once on save with their final contents."""
+        file_path = tmp_catalog / "test.parquet"
+        pq.write_table(pa.table({"x": [1]}), file_path)
+
+        mgr = ManifestManager(tmp_catalog)
+        mgr.update_files_batch([file_path])
+        assert mgr.file_count == 0
+
+        # Rewritten by a later batch before the manifest is saved
+        pq.write_table(pa.table({"x": [1, 2]}), file_path)
+        mgr.update_files_batch([file_path])
+        mgr.save()
+
+        entry = mgr.get_entry("test.parquet")
+        assert entry is not None
+        assert entry.row_count == 2
+        assert mgr.verify_file(file_path)
+
+    def test_is_current_stale(self, tmp_catalog: Path) -> None:
+        """Test a currency is stale when files on disk are not in the manifest."""
+        trades_dir = tmp_catalog / "ETH" / "trades"
+        trades_dir.mkdir(parents=True)
+        pq.write_table(pa.table({"x": [1]}), trades_dir / "2024-01-01.parquet")
+
+        mgr = ManifestManager(tmp_catalog)
+
+        assert not mgr.is_current("ETH")
+        assert mgr.is_current("BTC")
+
+    def test_is_current_same_size_rewrite(self, tmp_catalog: Path) -> None:
+        """Test a daily file rewritten to the same size makes the currency stale."""
+        trades_dir = tmp_catalog / "ETH" / "trades"
+        trades_dir.mkdir(parents=True)
+        file_path = trades_dir / "2024-01-01.parquet"
+        pq.write_table(pa.table({"x": [1, 2, 3]}), file_path)
+
+        mgr = ManifestManager(tmp_catalog)
+        entry = mgr.update_file(file_path)
+        assert mgr.is_current("ETH")
+
+        pq.write_table(pa.table({"x": [4, 5, 6]}), file_path)
+        assert file_path.stat().st_size == entry.size_bytes
+        os.utime(file_path, ns=(entry.mtime_ns + 1, entry.mtime_ns + 1))
+
+        assert not mgr.is_current("ETH")
+
+    def test_update_files(self, tmp_catalog: Path) -> None:
+        """Test parallel bulk update matches per-file updates."""
+        paths = []
+        for day in range(1, 4):
+            path = tmp_catalog / "BTC" / "trades" / f"2024-01-0{day}.parquet"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            pq.write_table(pa.table({"x": list(range(day))}), path)
+            paths.append(path)
+
+        mgr = ManifestManager(tmp_catalog)
+        entries = mgr.update_files(paths)
+
+        assert [e.row_count for e in entries] == [1, 2, 3]
+        for path, entry in zip(paths, entries, strict=True):
+            expected = ManifestManager(tmp_catalog).update_file(path)
+            assert mgr.get_entry(str(path.relative_to(tmp_catalog))) is entry
+            assert entry.to_dict() == expected.to_dict()
+
+    def test_timestamp_range_from_statistics(self, tmp_catalog: Path) -> None:
+        """Test the timestamp range comes from row group statistics."""
+        timestamps = [
+            datetime(2024, 1, 1, 5, 30, 0, 123, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, 23, 59, tzinfo=timezone.utc),
+        ]
+        path = tmp_catalog / "ts.parquet"
+        table = pa.table({"timestamp": pa.array(timestamps, pa.timestamp("us", tz="UTC"))})
+        pq.write_table(table, path, row_group_size=2)
+
+        mgr = ManifestManager(tmp_catalog)
+        expected = (min(timestamps).isoformat(), max(timestamps).isoformat())
+        assert mgr._get_timestamp_range(path) == expected
+
+        pq.write_table(table, path, write_statistics=False)
+        assert mgr._get_timestamp_range(path) == expected
+
+    def test_compute_sha256(self, tmp_catalog: Path) -> None:
+        """Test hashing matches hashlib, including empty files."""
+        mgr = ManifestManager(tmp_catalog)
+        data_path = tmp_catalog / "data.bin"
+        data_path.write_bytes(b"x" * 100_000)
+        empty_path = tmp_catalog / "empty.bin"
+        empty_path.write_bytes(b"")
+
+        assert mgr._compute_sha256(data_path) == hashlib.sha256(b"x" * 100_000).hexdigest()
+        assert mgr._compute_sha256(empty_path) == hashlib.sha256().hexdigest()
+
+    def test_compute_sha256_mmap(self, tmp_catalog: Path) -> None:
+        """Test large files hashed via mmap match the streaming digest."""
+        data = bytes(range(256)) * (MMAP_MIN_BYTES // 256 + 1)
+        data_path = tmp_catalog / "large.bin"
+        data_path.write_bytes(data)
+
+        mgr = ManifestManager(tmp_catalog)
+        assert mgr._compute_sha256(data_path) == hashlib.sha256(data).hexdigest()
+
+    def test_compute_sha256_mmap_unsupported(self, tmp_catalog: Path) -> None:
+        """Test large files fall back to streaming when mmap fails."""
+        data = b"y" * MMAP_MIN_BYTES
+        data_path = tmp_catalog / "large.bin"
+        data_path.write_bytes(data)
+
+        mgr = ManifestManager(tmp_catalog)
+        with patch("deribit_data.manifest.mmap.mmap", side_effect=OSError("no mmap")):
+            assert mgr._compute_sha256(data_path) == hashlib.sha256(data).hexdigest()
+
+    def test_summary(self, tmp_catalog: Path) -> None:
+        """Test per-currency trade summaries skip non-trade entries."""
+        mgr = ManifestManager(tmp_catalog)
+        for rel_path, rows in (
+            ("ETH/trades/2024-01-02.parquet", 2),
+            ("ETH/trades/2024-01-01.parquet", 3),
+            ("BTC/trades/2024-02-01.parquet", 4),
+            ("BTC/dvol/dvol.parquet", 5),
+        ):
+            file_path = tmp_catalog / rel_path
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            pq.write_table(pa.table({"x": list(range(rows))}), file_path)
+            mgr.update_file(file_path)
+
+        summary = mgr.summary()
+
+        assert set(summary) == {"ETH", "BTC"}
+        assert summary["ETH"]["row_count"] == 5
+        assert summary["ETH"]["file_count"] == 2
+        assert [d.day for d in summary["ETH"]["date_range"]] == [1, 2]
+        assert summary["BTC"]["row_count"] == 4
+        assert mgr.is_current("ETH")
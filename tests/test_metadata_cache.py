@@ -0,0 +1,55 @@
+"""Tests for Parquet footer cache."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from deribit_data.metadata_cache import FileMetadataCache
+
+
+class TestFileMetadataCache:
+    """Tests for FileMetadataCache."""
+
+    def test_reuses_footer(self, tmp_path: Path) -> None:
+        """Test an unchanged file's footer is read once."""
+        path = tmp_path / "a.parquet"
+        pq.write_table(pa.table({"x": [1, 2, 3]}), path)
+        cache = FileMetadataCache()
+
+        with patch("deribit_data.metadata_cache.pq.read_metadata", wraps=pq.read_metadata) as read:
+            first = cache.get(path)
+            second = cache.get(path)
+
+        assert first is second
+        assert first.num_rows == 3
+        assert read.call_count == 1
+
+    def test_rewritten_file_is_reread(self, tmp_path: Path) -> None:
+        """Test a file replaced by an atomic rename gets a fresh footer."""
+        path = tmp_path / "a.parquet"
+        pq.write_table(pa.table({"x": [1, 2, 3]}), path)
+        cache = FileMetadataCache()
+        assert cache.get(path).num_rows == 3
+
+        tmp = tmp_path / "a.parquet.tmp"
+        pq.write_table(pa.table({"x": list(range(10))}), tmp)
+        tmp.rename(path)
+
+        assert cache.get(path).num_rows == 10
+
+    def test_evicts_by_size(self, tmp_path: Path) -> None:
+        """Test least recently used footers are evicted past the byte budget."""
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"{i}.parquet"
+            pq.write_table(pa.table({"x": [i]}), path)
+            paths.append(path)
+        footer_size = pq.read_metadata(paths[0]).serialized_size
+        cache = FileMetadataCache(max_bytes=footer_size * 2)
+
+        for path in paths:
+            cache.get(path)
+
+        assert len(cache) == 2
@@ -0,0 +1,48 @@
+"""Tests for credit bucket rate limiter."""
+
+from unittest.mock import patch
+
+from deribit_data.ratelimit import MIN_REFILL_FRACTION, CreditBucket
+
+
+class TestCreditBucket:
+    """Tests for CreditBucket."""
+
+    def test_burst_then_spaced(self) -> None:
+        """Test a full bucket allows a burst, then callers wait for the refill."""
+        bucket = CreditBucket(capacity=2, refill_per_sec=10.0)
+
+        with (
+            patch("deribit_data.ratelimit.time.monotonic", return_value=100.0),
+            patch("deribit_data.ratelimit.time.sleep") as sleep,
+        ):
+            bucket._updated = 100.0
+            for _ in range(4):
+                bucket.acquire()
+
+        waits = [round(call.args[0], 6) for call in sleep.call_args_list]
+        assert waits == [0.1, 0.2]  # Third and fourth callers queue behind each other
+
+    def test_unlimited(self) -> None:
+        """Test no refill rate means no waiting."""
+        bucket = CreditBucket(capacity=1, refill_per_sec=None)
+
+        with patch("deribit_data.ratelimit.time.sleep") as sleep:
+            for _ in range(10):
+                bucket.acquire()
+
+        sleep.assert_not_called()
+
+    def test_throttle_and_recover(self) -> None:
+        """Test 429s halve the rate down to a floor and successes restore it."""
+        bucket = CreditBucket(capacity=1, refill_per_sec=16.0)
+
+        bucket.throttle()
+        assert bucket.refill_per_sec == 8.0
+        for _ in range(10):
+            bucket.throttle()
+        assert bucket.refill_per_sec == 16.0 * MIN_REFILL_FRACTION
+
+        for _ in range(100):
+            bucket.recover()
+        assert bucket.refill_per_sec == 16.0
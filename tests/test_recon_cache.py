@@ -0,0 +1,47 @@
+"""Tests for reconciliation API count cache."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from deribit_data.recon_cache import ReconciliationCache, is_settled
+
+
+class TestReconciliationCache:
+    """Tests for ReconciliationCache."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test settled counts persist across instances."""
+        path = tmp_path / "cache.json"
+        day = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        cache = ReconciliationCache(path)
+        cache.put("BTC", day, 1234)
+        cache.save()
+
+        reloaded = ReconciliationCache(path)
+
+        assert reloaded.get("BTC", day) == 1234
+        assert reloaded.get("ETH", day) is None
+
+    def test_recent_days_not_cached(self, tmp_path: Path) -> None:
+        """Test yesterday and today are never cached."""
+        cache = ReconciliationCache(tmp_path / "cache.json")
+        now = datetime.now(timezone.utc)
+        yesterday = now - timedelta(days=1)
+
+        cache.put("BTC", now, 10)
+        cache.put("BTC", yesterday, 10)
+        cache.save()
+
+        assert not is_settled(yesterday)
+        assert is_settled(now - timedelta(days=2))
+        assert cache.get("BTC", yesterday) is None
+        assert not (tmp_path / "cache.json").exists()
+
+    def test_corrupt_file_ignored(self, tmp_path: Path) -> None:
+        """Test a corrupt cache file starts an empty cache."""
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+
+        cache = ReconciliationCache(path)
+
+        assert cache.get("BTC", datetime(2024, 1, 1, tzinfo=timezone.utc)) is None
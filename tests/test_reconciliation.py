@@ -0,0 +1,78 @@
+"""Tests for reconciliation module."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from deribit_data import fastjson
+from deribit_data.config import DeribitConfig
+from deribit_data.reconciliation import MAX_SPAN_DAYS, DataReconciler, _plan_windows
+
+_MS_PER_DAY = 86_400_000
+
+
+def _days(start: datetime, count: int) -> list[datetime]:
+    return [start + timedelta(days=i) for i in range(count)]
+
+
+class TestPlanWindows:
+    """Tests for _plan_windows."""
+
+    def test_few_days_are_split(self) -> None:
+        """Test days are sliced when there are fewer days than workers."""
+        day = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        windows = _plan_windows([day], 4)
+
+        assert len(windows) == 4
+        assert windows[0][0] == int(day.timestamp()) * 1000
+        assert windows[-1][1] == int(day.timestamp()) * 1000 + _MS_PER_DAY - 1
+
+    def test_consecutive_days_are_merged(self) -> None:
+        """Test runs of days share windows, capped at MAX_SPAN_DAYS and split at gaps."""
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        dates = _days(start, 20) + _days(start + timedelta(days=30), 2)
+
+        windows = _plan_windows(dates, 1)
+
+        spans = [(end - begin + 1) // _MS_PER_DAY for begin, end in windows]
+        assert spans == [MAX_SPAN_DAYS, MAX_SPAN_DAYS, 20 - 2 * MAX_SPAN_DAYS, 2]
+
+
+class TestDataReconciler:
+    """Tests for DataReconciler."""
+
+    def test_reconcile_range_buckets_trades_by_day(self, tmp_path: Path) -> None:
+        """Test one paginated walk over several days is counted per day."""
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        base = int(start.timestamp()) * 1000
+        trades = [{"timestamp": base + offset} for offset in (1, 2, _MS_PER_DAY + 5)]
+        response = MagicMock()
+        response.content = fastjson.dumps({"result": {"trades": trades, "has_more": False}})
+        client = MagicMock()
+        client.get.return_value = response
+        config = DeribitConfig(rate_limit_delay=0.0, max_concurrent_requests=1)
+
+        with DataReconciler(config, tmp_path, client) as reconciler:
+            report = reconciler.reconcile_range("BTC", start, start + timedelta(days=2))
+
+        assert client.get.call_count == 1
+        assert [r.api_count for r in report.results] == [2, 1, 0]
+
+    def test_rate_limited_page_is_retried(self, tmp_path: Path) -> None:
+        """Test a 429 slows the reconciler down and the page is fetched again."""
+        limited = MagicMock(status_code=429)
+        ok = MagicMock(status_code=200)
+        ok.content = fastjson.dumps({"result": {"trades": [{"timestamp": 1}], "has_more": False}})
+        client = MagicMock()
+        client.get.side_effect = [limited, ok]
+        config = DeribitConfig(rate_limit_delay=0.1)
+
+        with (
+            DataReconciler(config, tmp_path, client) as reconciler,
+            patch("deribit_data.reconciliation.time.sleep"),
+            patch("deribit_data.ratelimit.time.sleep"),
+        ):
+            assert reconciler._count_api_trades("BTC", 0, _MS_PER_DAY - 1) == 1
+            assert reconciler._bucket.refill_per_sec is not None
+            assert reconciler._bucket.refill_per_sec < 10.0
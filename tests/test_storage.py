@@ -2,11 +2,20 @@
 
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import patch
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 
-from deribit_data.models import DVOLCandle, OptionTrade, OptionType, TradeDirection
-from deribit_data.storage import ParquetStorage
+from deribit_data.models import (
+    DVOLCandle,
+    OptionTrade,
+    OptionType,
+    TradeBatch,
+    TradeDirection,
+)
+from deribit_data.schema import TRADES_SCHEMA_V1
+from deribit_data.storage import DICTIONARY_COLUMNS, ParquetStorage, trades_to_table
 
 
 class TestParquetStorage:
@@ -60,6 +69,79 @@ class TestParquetStorage:
         table = storage.load_trades("BTC")
         assert table.num_rows == 1
 
+    def test_save_trades_keeps_latest_duplicate(
+        self, tmp_catalog: Path, sample_trades: list[OptionTrade]
+    ) -> None:
+        """Test re-saved trades replace stored ones and rows stay time-ordered."""
+        storage = ParquetStorage(tmp_catalog)
+        day_one = [t for t in sample_trades if t.timestamp.day == 1]
+        storage.save_trades(day_one, "ETH")
+
+        updated = day_one[0].model_copy(update={"price": 0.5})
+        storage.save_trades([updated], "ETH")
+
+        table = storage.load_trades("ETH")
+        assert table.column("trade_id").to_pylist() == [t.trade_id for t in day_one]
+        assert table.column("price")[0].as_py() == 0.5
+        assert table.schema == TRADES_SCHEMA_V1
+
+    def test_save_trades_appends_later_trades(
+        self, tmp_catalog: Path, sample_trades: list[OptionTrade]
+    ) -> None:
+        """Test strictly later trades are appended without a full merge."""
+        storage = ParquetStorage(tmp_catalog)
+        storage.save_trades(sample_trades[:2], "ETH")
+
+        with patch.object(ParquetStorage, "_merge_with_existing") as merge:
+            storage.save_trades(sample_trades[2:4], "ETH")
+
+        merge.assert_not_called()
+        table = storage.load_trades("ETH")
+        assert table.column("trade_id").to_pylist() == [t.trade_id for t in sample_trades[:4]]
+
+    def test_save_trades_merges_overlapping_trades(
+        self, tmp_catalog: Path, sample_trades: list[OptionTrade]
+    ) -> None:
+        """Test earlier or repeated trades fall back to a full merge."""
+        storage = ParquetStorage(tmp_catalog)
+        storage.save_trades(sample_trades[1:3], "ETH")
+
+        storage.save_trades([sample_trades[0]], "ETH")  # Earlier than stored trades
+        repeated = sample_trades[2].model_copy(update={"timestamp": sample_trades[3].timestamp})
+        storage.save_trades([repeated], "ETH")  # Later, but reuses a trade_id
+
+        table = storage.load_trades("ETH")
+        assert table.column("trade_id").to_pylist() == ["trade_0", "trade_1", "trade_2"]
+        assert not list(tmp_catalog.rglob("*.tmp"))
+
+    def test_save_trades_interleaved_days(
+        self, tmp_catalog: Path, sample_trades: list[OptionTrade]
+    ) -> None:
+        """Test a day split across several runs of the input is merged once per file."""
+        storage = ParquetStorage(tmp_catalog)
+        interleaved = sample_trades[4:8] + sample_trades[:4] + sample_trades[8:]
+        interleaved = interleaved[::2] + interleaved[1::2]
+
+        written = storage.save_trades(interleaved, "ETH")
+
+        assert [p.stem for p in written] == ["2024-01-01", "2024-01-02", "2024-01-03"]
+        table = storage.load_trades("ETH")
+        assert table.column("trade_id").to_pylist() == [t.trade_id for t in sample_trades]
+
+    def test_save_trades_from_table(
+        self, tmp_catalog: Path, sample_trades: list[OptionTrade]
+    ) -> None:
+        """Test a trades table is written like the equivalent models."""
+        from_models = ParquetStorage(tmp_catalog / "models")
+        from_table = ParquetStorage(tmp_catalog / "table")
+        interleaved = sample_trades[::2] + sample_trades[1::2]
+
+        expected = from_models.save_trades(interleaved, "ETH")
+        written = from_table.save_trades(trades_to_table(interleaved), "ETH")
+
+        assert [p.name for p in written] == [p.name for p in expected]
+        assert from_table.load_trades("ETH").equals(from_models.load_trades("ETH"))
+
     def test_save_trades_empty_list(self, tmp_catalog: Path) -> None:
         """Test saving empty list returns empty."""
         storage = ParquetStorage(tmp_catalog)
@@ -95,6 +177,79 @@ class TestParquetStorage:
         for ts in timestamps:
             assert ts.date() == start.date()
 
+    def test_load_trades_prunes_by_footer_range(
+        self, tmp_catalog: Path, sample_trades: list[OptionTrade]
+    ) -> None:
+        """Test files are selected by their trades' time range, not the day's start."""
+        storage = ParquetStorage(tmp_catalog)
+        storage.save_trades(sample_trades, "ETH")
+
+        # Day 2 holds trades from 04:00 to 07:00
+        start = datetime(2024, 1, 2, 5, tzinfo=timezone.utc)
+        table = storage.load_trades("ETH", start_date=start)
+        assert table.column("trade_id").to_pylist() == [t.trade_id for t in sample_trades[4:]]
+
+        end = datetime(2024, 1, 2, 3, tzinfo=timezone.utc)
+        table = storage.load_trades("ETH", end_date=end)
+        assert table.column("trade_id").to_pylist() == [t.trade_id for t in sample_trades[:4]]
+
+    def test_load_trades_prunes_by_file_name(
+        self, tmp_catalog: Path, sample_trades: list[OptionTrade]
+    ) -> None:
+        """Test whole days inside the range are selected without reading footers."""
+        storage = ParquetStorage(tmp_catalog)
+        storage.save_trades(sample_trades, "ETH")
+
+        with patch("deribit_data.storage._file_timestamp_range") as footer_range:
+            table = storage.load_trades(
+                "ETH",
+                start_date=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                end_date=datetime(2024, 1, 2, 23, 59, 59, 999999, tzinfo=timezone.utc),
+            )
+
+        footer_range.assert_not_called()
+        assert table.column("trade_id").to_pylist() == [t.trade_id for t in sample_trades[4:8]]
+
+    def test_load_trades_read_dictionary(
+        self, tmp_catalog: Path, sample_trades: list[OptionTrade]
+    ) -> None:
+        """Test low-cardinality columns can be loaded dictionary encoded."""
+        storage = ParquetStorage(tmp_catalog)
+        storage.save_trades(sample_trades, "ETH")
+
+        table = storage.load_trades("ETH", read_dictionary=True)
+        empty = storage.load_trades("SOL", read_dictionary=True)
+
+        for name in DICTIONARY_COLUMNS:
+            assert pa.types.is_dictionary(table.schema.field(name).type)
+        assert empty.schema.types == table.schema.types
+        assert table.column("direction").to_pylist() == [t.direction.value for t in sample_trades]
+
+    def test_load_trades_keeps_day_order(
+        self, tmp_catalog: Path, sample_trades: list[OptionTrade]
+    ) -> None:
+        """Test files read concurrently are concatenated in date order."""
+        storage = ParquetStorage(tmp_catalog)
+        storage.save_trades(sample_trades, "ETH")
+
+        table = storage.load_trades("ETH")
+
+        assert table.column("trade_id").to_pylist() == [t.trade_id for t in sample_trades]
+
+    def test_iter_trades(self, tmp_catalog: Path, sample_trades: list[OptionTrade]) -> None:
+        """Test streamed batches match load_trades for the same range."""
+        storage = ParquetStorage(tmp_catalog)
+        storage.save_trades(sample_trades, "ETH")
+        start = datetime(2024, 1, 2, 5, tzinfo=timezone.utc)
+
+        batches = list(storage.iter_trades("ETH", start_date=start, batch_size=2))
+
+        assert all(batch.num_rows <= 2 for batch in batches)
+        assert pa.Table.from_batches(batches).equals(storage.load_trades("ETH", start_date=start))
+        columns = storage.iter_trades("ETH", columns=["trade_id"])
+        assert [batch.schema.names for batch in columns] == [["trade_id"]] * 3
+        assert list(storage.iter_trades("SOL")) == []
+
     def test_save_dvol(self, tmp_catalog: Path, sample_dvol_candles: list[DVOLCandle]) -> None:
         """Test saving DVOL candles."""
         storage = ParquetStorage(tmp_catalog)
@@ -116,6 +271,32 @@ class TestParquetStorage:
         assert "open" in table.column_names
         assert "close" in table.column_names
 
+    def test_save_dvol_stream(
+        self, tmp_catalog: Path, sample_dvol_candles: list[DVOLCandle]
+    ) -> None:
+        """Test streamed DVOL chunks are merged, deduplicated and sorted."""
+        storage = ParquetStorage(tmp_catalog)
+        storage.save_dvol(sample_dvol_candles[:2], "BTC")
+
+        # Pages arrive newest first and overlap the existing file
+        chunks = [sample_dvol_candles[3:], sample_dvol_candles[1:3]]
+        file_path, count = storage.save_dvol_stream(iter(chunks), "BTC")
+
+        assert file_path is not None
+        assert count == len(sample_dvol_candles) - 1
+        table = storage.load_dvol("BTC")
+        timestamps = table.column("timestamp").to_pylist()
+        assert len(timestamps) == len(sample_dvol_candles)
+        assert timestamps == sorted(timestamps)
+        assert list(tmp_catalog.rglob("*.partial")) == []
+
+    def test_save_dvol_stream_empty(self, tmp_catalog: Path) -> None:
+        """Test no file is written when there are no candles."""
+        storage = ParquetStorage(tmp_catalog)
+
+        assert storage.save_dvol_stream(iter([]), "BTC") == (None, 0)
+        assert not (tmp_catalog / "BTC" / "dvol" / "dvol.parquet").exists()
+
     def test_get_last_trade_timestamp(
         self, tmp_catalog: Path, sample_trades: list[OptionTrade]
     ) -> None:
@@ -123,12 +304,25 @@ class TestParquetStorage:
         storage = ParquetStorage(tmp_catalog)
         storage.save_trades(sample_trades, "ETH")
 
-        last_ts = storage.get_last_trade_timestamp("ETH")
+        with patch("deribit_data.storage.pq.read_table") as read_table:
+            last_ts = storage.get_last_trade_timestamp("ETH")
 
+        read_table.assert_not_called()  # Answered from footer statistics
         assert last_ts is not None
         expected_max = max(t.timestamp for t in sample_trades)
         assert last_ts == expected_max
 
+    def test_get_last_trade_timestamp_without_statistics(self, tmp_catalog: Path) -> None:
+        """Test the timestamp column is scanned when footers lack statistics."""
+        storage = ParquetStorage(tmp_catalog)
+        trades_dir = tmp_catalog / "ETH" / "trades"
+        trades_dir.mkdir(parents=True)
+        timestamps = [datetime(2024, 1, 1, h, tzinfo=timezone.utc) for h in (3, 9, 5)]
+        table = pa.table({"timestamp": pa.array(timestamps, pa.timestamp("us", tz="UTC"))})
+        pq.write_table(table, trades_dir / "2024-01-01.parquet", write_statistics=False)
+
+        assert storage.get_last_trade_timestamp("ETH") == timestamps[1]
+
     def test_get_last_trade_timestamp_no_data(self, tmp_catalog: Path) -> None:
         """Test getting last timestamp when no data exists."""
         storage = ParquetStorage(tmp_catalog)
@@ -137,6 +331,19 @@ class TestParquetStorage:
 
         assert last_ts is None
 
+    def test_iter_files(self, tmp_catalog: Path, sample_trades: list[OptionTrade]) -> None:
+        """Test only daily Parquet files are listed, in date order."""
+        storage = ParquetStorage(tmp_catalog)
+        storage.save_trades(sample_trades, "ETH")
+        trades_dir = tmp_catalog / "ETH" / "trades"
+        (trades_dir / "2024-01-04.parquet.partial").write_bytes(b"")
+        (trades_dir / "2024-01-05.parquet.tmp").write_bytes(b"")
+
+        names = [e.name for e in storage.iter_files("ETH")]
+
+        assert names == ["2024-01-01.parquet", "2024-01-02.parquet", "2024-01-03.parquet"]
+        assert list(storage.iter_files("BTC")) == []
+
     def test_get_stats(self, tmp_catalog: Path, sample_trades: list[OptionTrade]) -> None:
         """Test getting catalog stats."""
         storage = ParquetStorage(tmp_catalog)
@@ -160,6 +367,20 @@ class TestParquetStorage:
         # Parquet metadata should show compression
         assert metadata.num_row_groups > 0
 
+    def test_timestamp_delta_encoded(
+        self, tmp_catalog: Path, sample_trades: list[OptionTrade]
+    ) -> None:
+        """Test timestamps are delta encoded and other columns dictionary encoded."""
+        storage = ParquetStorage(tmp_catalog)
+
+        written = storage.save_trades(sample_trades, "ETH")
+
+        row_group = pq.read_metadata(written[0]).row_group(0)
+        columns = {row_group.column(i).path_in_schema: row_group.column(i) for i in range(13)}
+        assert "DELTA_BINARY_PACKED" in columns["timestamp"].encodings
+        assert columns["instrument_id"].has_dictionary_page
+        assert not columns["timestamp"].has_dictionary_page
+
     def test_atomic_write_no_temp_files(
         self, tmp_catalog: Path, sample_trades: list[OptionTrade]
     ) -> None:
@@ -170,3 +391,88 @@ class TestParquetStorage:
         # No .tmp files should exist
         tmp_files = list(tmp_catalog.rglob("*.tmp"))
         assert len(tmp_files) == 0
+
+
+class TestTradeFileWriter:
+    """Tests for streaming TradeFileWriter."""
+
+    def test_finalizes_day_when_next_day_starts(
+        self, tmp_catalog: Path, sample_trades: list[OptionTrade]
+    ) -> None:
+        """Test a day's file is committed once a later day is written."""
+        storage = ParquetStorage(tmp_catalog)
+        writer = storage.open_trade_writer("ETH")
+
+        # First two days complete, third still open
+        finalized = writer.write(sample_trades[:9])
+        assert [f.stem for f in finalized] == ["2024-01-01", "2024-01-02"]
+        assert writer.committed_ms == int(sample_trades[7].timestamp.timestamp() * 1000)
+        assert len(list(tmp_catalog.rglob("*.parquet.partial"))) == 1
+
+        finalized = writer.write(sample_trades[9:])
+        assert finalized == []
+
+        finalized = writer.close()
+        assert [f.stem for f in finalized] == ["2024-01-03"]
+        assert writer.committed_ms == int(sample_trades[9].timestamp.timestamp() * 1000)
+        assert list(tmp_catalog.rglob("*.parquet.partial")) == []
+
+        table = storage.load_trades("ETH")
+        assert table.num_rows == len(sample_trades)
+
+    def test_merges_into_existing_file(
+        self, tmp_catalog: Path, sample_trades: list[OptionTrade]
+    ) -> None:
+        """Test finalizing an existing day merges and deduplicates."""
+        storage = ParquetStorage(tmp_catalog)
+        storage.save_trades(sample_trades[:2], "ETH")
+
+        with storage.open_trade_writer("ETH") as writer:
+            writer.write(sample_trades[:4])
+
+        table = storage.load_trades("ETH")
+        assert sorted(table.column("trade_id").to_pylist()) == [
+            "trade_0",
+            "trade_1",
+            "trade_2",
+            "trade_3",
+        ]
+
+    def test_uses_batch_last_timestamp_ms(
+        self, tmp_catalog: Path, sample_trades: list[OptionTrade]
+    ) -> None:
+        """Test committed_ms is taken from the fetcher's batch when available."""
+        storage = ParquetStorage(tmp_catalog)
+        batch = TradeBatch(sample_trades[:4], last_timestamp_ms=1704078000123)
+
+        with storage.open_trade_writer("ETH") as writer:
+            writer.write(batch)
+
+        assert writer.committed_ms == 1704078000123
+
+    def test_write_table_splits_days(
+        self, tmp_catalog: Path, sample_trades: list[OptionTrade]
+    ) -> None:
+        """Test a trades table is split into daily files like a trade list."""
+        storage = ParquetStorage(tmp_catalog)
+
+        with storage.open_trade_writer("ETH") as writer:
+            finalized = writer.write_table(trades_to_table(sample_trades))
+
+        assert [f.stem for f in finalized] == ["2024-01-01", "2024-01-02"]
+        assert writer.committed_ms == int(sample_trades[-1].timestamp.timestamp() * 1000)
+        assert storage.load_trades("ETH").num_rows == len(sample_trades)
+
+    def test_removes_stale_partial_files(self, tmp_catalog: Path) -> None:
+        """Test partial files from a crashed run are discarded."""
+        trades_dir = tmp_catalog / "ETH" / "trades"
+        trades_dir.mkdir(parents=True)
+        stale = trades_dir / "2024-01-01.parquet.partial"
+        stale.write_bytes(b"garbage")
+
+        storage = ParquetStorage(tmp_catalog)
+        writer = storage.open_trade_writer("ETH")
+
+        assert not stale.exists()
+        assert writer.close() == []
+        assert writer.committed_ms is None
@@ -0,0 +1,43 @@
+"""Tests for per-file validation cache."""
+
+from pathlib import Path
+
+from deribit_data.validation_cache import ValidationCache
+
+
+class TestValidationCache:
+    """Tests for ValidationCache."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test entries persist and only match an unchanged file."""
+        path = tmp_path / "cache.json"
+        issue = {"severity": "medium", "category": "unsorted", "message": "1 out-of-order"}
+        cache = ValidationCache(path, "cfg")
+        cache.put_file("2024-01-01.parquet", [1, 100], 10, [issue])
+        cache.put_cross([["2024-01-01.parquet", 1, 100]], [])
+        cache.save()
+
+        reloaded = ValidationCache(path, "cfg")
+
+        assert reloaded.get_file("2024-01-01.parquet", [1, 100]) == (10, [issue])
+        assert reloaded.get_file("2024-01-01.parquet", [2, 100]) is None
+        assert reloaded.get_cross([["2024-01-01.parquet", 1, 100]]) == []
+        assert reloaded.get_cross([]) is None
+
+    def test_config_change_discards_cache(self, tmp_path: Path) -> None:
+        """Test results validated with other thresholds are not reused."""
+        path = tmp_path / "cache.json"
+        cache = ValidationCache(path, "cfg")
+        cache.put_file("2024-01-01.parquet", [1, 100], 10, [])
+        cache.save()
+
+        assert ValidationCache(path, "other").get_file("2024-01-01.parquet", [1, 100]) is None
+
+    def test_corrupt_file_ignored(self, tmp_path: Path) -> None:
+        """Test a corrupt cache file starts an empty cache."""
+        path = tmp_path / "cache.json"
+        path.write_text("{not json")
+
+        cache = ValidationCache(path, "cfg")
+
+        assert cache.get_file("2024-01-01.parquet", [1, 100]) is None
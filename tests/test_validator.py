@@ -0,0 +1,187 @@
+"""Tests for validator module."""
+
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pyarrow.parquet as pq
+
+from deribit_data.config import ValidationConfig
+from deribit_data.models import OptionTrade
+from deribit_data.storage import ParquetStorage
+from deribit_data.validator import DataValidator
+
+
+class TestDataValidator:
+    """Tests for DataValidator."""
+
+    def test_clean_catalog_passes(
+        self,
+        tmp_catalog: Path,
+        sample_trades: list[OptionTrade],
+        validation_config: ValidationConfig,
+    ) -> None:
+        """Test consecutive, unique, sorted days raise no issues."""
+        ParquetStorage(tmp_catalog).save_trades(sample_trades, "ETH")
+
+        result = DataValidator(validation_config).validate_trades(tmp_catalog, "ETH")
+
+        assert result.passed
+        assert result.issues == []
+        assert result.stats["total_rows"] == len(sample_trades)
+
+    def test_iv_skipped_when_footer_in_bounds(
+        self,
+        tmp_catalog: Path,
+        sample_trades: list[OptionTrade],
+        validation_config: ValidationConfig,
+    ) -> None:
+        """Test the iv column is only read when its statistics allow outliers."""
+        storage = ParquetStorage(tmp_catalog)
+        written = storage.save_trades(sample_trades, "ETH")
+        validator = DataValidator(validation_config)
+
+        assert validator._columns_to_read(pq.ParquetFile(written[0])) == ["trade_id", "timestamp"]
+
+        outlier = sample_trades[0].model_copy(update={"trade_id": "high_iv", "iv": 9.99})
+        strict = DataValidator(validation_config.model_copy(update={"iv_max": 5.0}))
+        storage.save_trades([outlier], "ETH")
+
+        assert "iv" in strict._columns_to_read(pq.ParquetFile(written[0]))
+        result = strict.validate_trades(tmp_catalog, "ETH")
+        assert [i.message for i in result.issues] == ["1 trades with IV > 5.0"]
+
+    def test_cross_file_duplicates(
+        self,
+        tmp_catalog: Path,
+        sample_trades: list[OptionTrade],
+        validation_config: ValidationConfig,
+    ) -> None:
+        """Test trade IDs repeated in a later file are reported against that file."""
+        storage = ParquetStorage(tmp_catalog)
+        storage.save_trades(sample_trades, "ETH")
+        # Two day-1 trade IDs reappear on day 3
+        repeats = [
+            t.model_copy(update={"timestamp": sample_trades[-1].timestamp})
+            for t in sample_trades[:2]
+        ]
+        storage.save_trades(repeats, "ETH")
+
+        result = DataValidator(validation_config).validate_trades(tmp_catalog, "ETH")
+
+        cross = [i for i in result.issues if i.category == "cross_duplicates"]
+        assert [(Path(i.file_path or "").stem, i.message) for i in cross] == [
+            ("2024-01-03", "2 duplicate trade IDs across files")
+        ]
+        assert result.high_count == 1
+        assert result.critical_count == 0
+        assert result.passed
+
+    def test_quick_check_all_reads_footers_in_order(
+        self,
+        tmp_catalog: Path,
+        sample_trades: list[OptionTrade],
+        validation_config: ValidationConfig,
+    ) -> None:
+        """Test footers come back in file order and quick_check passes."""
+        storage = ParquetStorage(tmp_catalog)
+        written = storage.save_trades(sample_trades, "ETH")
+        validator = DataValidator(validation_config)
+
+        footers = validator.quick_check_all(written)
+
+        assert [f.num_rows for f in footers] == [pq.read_metadata(p).num_rows for p in written]
+        assert sum(f.num_rows for f in footers) == len(sample_trades)
+        assert validator.quick_check(tmp_catalog, "ETH")
+        assert not validator.quick_check(tmp_catalog, "BTC")
+
+    def test_unchanged_files_not_reread(
+        self,
+        tmp_catalog: Path,
+        sample_trades: list[OptionTrade],
+        validation_config: ValidationConfig,
+    ) -> None:
+        """Test a second run takes unchanged files' results from the cache."""
+        storage = ParquetStorage(tmp_catalog)
+        storage.save_trades(sample_trades, "ETH")
+        repeats = [
+            t.model_copy(update={"timestamp": sample_trades[-1].timestamp})
+            for t in sample_trades[:2]
+        ]
+        storage.save_trades(repeats, "ETH")
+        validator = DataValidator(validation_config)
+        first = validator.validate_trades(tmp_catalog, "ETH")
+
+        with patch("deribit_data.validator.pq.ParquetFile") as parquet_file:
+            second = validator.validate_trades(tmp_catalog, "ETH")
+
+        parquet_file.assert_not_called()
+        assert second.issues == first.issues
+        assert second.stats == first.stats
+
+    def test_fingerprint_collisions_not_reported(
+        self,
+        tmp_catalog: Path,
+        sample_trades: list[OptionTrade],
+        validation_config: ValidationConfig,
+    ) -> None:
+        """Test colliding trade ID fingerprints are confirmed on the actual IDs."""
+        ParquetStorage(tmp_catalog).save_trades(sample_trades, "ETH")
+
+        with patch(
+            "deribit_data.validator._fingerprint_ids",
+            side_effect=lambda ids: np.zeros(len(ids), dtype=np.uint64),
+        ):
+            result = DataValidator(validation_config).validate_trades(tmp_catalog, "ETH")
+
+        assert not [i for i in result.issues if i.category == "cross_duplicates"]
+
+    def test_cross_file_duplicates_streamed_in_small_batches(
+        self,
+        tmp_catalog: Path,
+        sample_trades: list[OptionTrade],
+        validation_config: ValidationConfig,
+    ) -> None:
+        """Test batch boundaries do not change cross-file duplicate counts."""
+        storage = ParquetStorage(tmp_catalog)
+        storage.save_trades(sample_trades, "ETH")
+        repeats = [
+            t.model_copy(update={"timestamp": sample_trades[-1].timestamp})
+            for t in sample_trades[:3]
+        ]
+        storage.save_trades(repeats, "ETH")
+        validator = DataValidator(validation_config)
+        validator.validate_trades(tmp_catalog, "ETH")
+        # A changed file makes the next run stream IDs from the cached files
+        (tmp_catalog / "ETH" / "trades" / "2024-01-01.parquet").touch()
+
+        with patch("deribit_data.validator.ID_BATCH_ROWS", 1):
+            result = validator.validate_trades(tmp_catalog, "ETH")
+
+        cross = [i.message for i in result.issues if i.category == "cross_duplicates"]
+        assert cross == ["3 duplicate trade IDs across files"]
+
+    def test_fail_fast_on_critical_gap_reads_no_files(
+        self,
+        tmp_catalog: Path,
+        sample_trades: list[OptionTrade],
+        validation_config: ValidationConfig,
+    ) -> None:
+        """Test fail_fast reports a critical gap from file names alone."""
+        late = sample_trades[0].model_copy(
+            update={
+                "trade_id": "late",
+                "timestamp": sample_trades[0].timestamp + timedelta(days=30),
+            }
+        )
+        ParquetStorage(tmp_catalog).save_trades([*sample_trades, late], "ETH")
+        validator = DataValidator(validation_config)
+
+        with patch("deribit_data.validator.pq.ParquetFile") as parquet_file:
+            result = validator.validate_trades(tmp_catalog, "ETH", fail_fast=True)
+
+        parquet_file.assert_not_called()
+        assert not result.passed
+        assert [i.category for i in result.issues] == ["data_gap", "completeness"]
+        assert result.critical_count == 2